@@ -1,5 +1,12 @@
 """Research prompt templates for the AI intelligence tracker."""
 
+# Shared opening of every analyst preamble; sent once as the system
+# message when the section instruction follows the prompt.
+ANALYST_ROLE = (
+    "You are a Deep Research Analyst — providing comprehensive intelligence "
+    "analysis."
+)
+
 TLDR_PREAMBLE = (
     "You are a Deep Research Analyst — providing comprehensive intelligence "
     "analysis. Produce ONLY the ## TL;DR section with 3-5 bullet executive "
@@ -37,6 +44,38 @@ DIVES_AUDIT_PREAMBLE = (
     "Do not produce any other sections."
 )
 
+FULL_REPORT_PREAMBLE = (
+    "You are a Deep Research Analyst — providing comprehensive intelligence "
+    "analysis. Produce the complete report in this order: ## TL;DR with 3-5 "
+    "bullets, ## Global Viral Events, ## Strategic Deep Dives and "
+    "## Completeness Audit.\n"
+    "For each event use this format:\n"
+    "### <Headline>\n"
+    "- **Category**: <category>\n"
+    "- **Impact Rating**: <1-10>\n"
+    "- **Confidence**: <high|medium|low>\n"
+    "- **Source**: <source URL or name>\n"
+    "- **Summary**: <2-3 sentence description>\n"
+    "For deep dives use:\n"
+    "### <Title>\n"
+    "- **Priority**: HIGH|MEDIUM|LOW\n"
+    "- **Summary**: <paragraph>\n"
+    "- **Key Findings**\n"
+    "- <finding>\n"
+    "For completeness audit use:\n"
+    "- **Verified Signals**: <int>\n"
+    "- **Sources Checked**: <int>\n"
+    "- **Confidence Score**: <0.0-1.0>\n"
+    "- **Gaps**: <comma-separated list>"
+)
+
+CHUNK_SUMMARY_PREAMBLE = (
+    "You are a research assistant condensing web search results. Summarize "
+    "the search results above into dense bullet points relevant to the "
+    "research task. Keep every headline, company, number, date and source "
+    "URL; drop boilerplate and repetition. Output only the bullets."
+)
+
 RESEARCH_PROMPT_TEMPLATE = """You are a Global AI Viral Intelligence Tracker v4.0.
 
 Today's date: {date}
@@ -2,6 +2,9 @@
 
 from pydantic_settings import BaseSettings
 
+from backend.types.enums import EngineType
+from backend.types.routing import SectionRoute
+
 
 class Settings(BaseSettings):
     """Central configuration for the deep research agent."""
@@ -24,6 +27,58 @@ class Settings(BaseSettings):
     gemini_model: str = "gemini-3-flash-preview"
     openai_model: str = "gpt-5-mini"
 
+    # Engines each run uses, from the registry; per-engine caps on runs
+    # in flight across reports, e.g. {"gemini": 1}.
+    research_engines: list[EngineType] = [EngineType.GEMINI, EngineType.LANGCHAIN]
+    engine_max_concurrency: dict[EngineType, int] = {}
+    max_parallel_engines: int | None = None
+
+    gemini_timeout_seconds: float = 900.0
+    # Wall-clock budget for a whole research run, shared by both engines.
+    run_deadline_seconds: float | None = 1200.0
+    gemini_streaming: bool = True
+
+    search_cache_path: str = ".cache/search_cache.sqlite3"
+    search_cache_ttl_seconds: int = 24 * 3600
+    search_cache_max_entries: int = 1000
+
+    checkpoint_path: str = ".cache/checkpoints.sqlite3"
+
+    run_queue_path: str = ".cache/run_queue.sqlite3"
+    run_queue_max_concurrency: int = 2
+
+    llm_cache_backend: str = "memory"
+    llm_cache_path: str = ".cache/llm_cache.sqlite3"
+    llm_cache_max_entries: int = 512
+
+    near_duplicate_threshold: float = 0.8
+    section_message_layout: str = "shared_prefix"
+    generation_strategy: str = "fan-out"
+    # JSON, e.g. {"tldr": {"model": "gpt-5-nano", "max_tokens": 2000}}
+    section_routes: dict[str, SectionRoute] = {}
+
+    # Read from TIKTOKEN_CACHE_DIR (the images set it); None keeps
+    # tiktoken's own cache location.
+    tiktoken_cache_dir: str | None = None
+
+    # Per-provider quotas; None leaves that dimension unthrottled.
+    openai_rpm: int | None = None
+    openai_tpm: int | None = None
+    gemini_rpm: int | None = None
+    gemini_tpm: int | None = None
+    tavily_rpm: int | None = None
+    retry_max_attempts: int = 4
+    retry_base_delay_seconds: float = 1.0
+    retry_max_delay_seconds: float = 30.0
+    circuit_failure_rate: float = 0.5
+    circuit_window_seconds: float = 60.0
+    circuit_min_calls: int = 5
+    circuit_open_seconds: float = 30.0
+
+    tavily_hedging: bool = False
+    tavily_hedge_quantile: float = 0.9
+    tavily_hedge_budget: float = 0.1
+
     cors_origins: list[str] = ["http://localhost:3000"]
 
     model_config = {"env_file": ".env", "extra": "ignore"}
@@ -0,0 +1,141 @@
+"""Per-provider circuit breaker over a rolling failure-rate window."""
+
+import logging
+import time
+from collections import deque
+from collections.abc import Callable
+
+from backend.types.enums import CircuitState
+from backend.types.errors import CircuitOpenError
+from backend.types.resilience import CircuitPolicy, CircuitStatus
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitBreaker:
+    """Closed/open/half-open breaker for one outbound provider.
+
+    Closed: calls pass and outcomes are recorded over a rolling window;
+    once at least ``min_calls`` have been seen and the failure rate
+    reaches the threshold, the breaker opens. Open: calls are refused
+    until ``open_seconds`` elapse. Half-open: a single probe call is let
+    through; its success closes the breaker, its failure reopens it.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        policy: CircuitPolicy | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.name = name
+        self.policy = policy or CircuitPolicy()
+        self._clock = clock
+        self._calls: deque[tuple[float, bool]] = deque()
+        self._state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        self._probe_started: float | None = None
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state, moving open to half-open once the wait is over."""
+        if (
+            self._state is CircuitState.OPEN
+            and self._clock() - self._opened_at >= self.policy.open_seconds
+        ):
+            self._state = CircuitState.HALF_OPEN
+            self._probe_started = None
+        return self._state
+
+    def allow(self) -> None:
+        """Admit a call or raise CircuitOpenError without making it.
+
+        In half-open only one probe is admitted at a time; a probe that
+        never reports back frees its slot after ``open_seconds``.
+        """
+        state = self.state
+        now = self._clock()
+        if state is CircuitState.OPEN:
+            raise CircuitOpenError(
+                f"{self.name} circuit open; retry in "
+                f"{self.retry_in_seconds():.1f}s"
+            )
+        if state is CircuitState.HALF_OPEN:
+            probing = self._probe_started
+            if probing is not None and now - probing < self.policy.open_seconds:
+                raise CircuitOpenError(f"{self.name} circuit half-open; probing")
+            self._probe_started = now
+
+    def record_success(self) -> None:
+        """Record a call the provider answered."""
+        if self._state is CircuitState.OPEN:
+            return
+        if self._state is CircuitState.HALF_OPEN:
+            logger.info("%s circuit closed after successful probe", self.name)
+            self._state = CircuitState.CLOSED
+            self._calls.clear()
+            return
+        self._record(ok=True)
+
+    def record_failure(self) -> None:
+        """Record a provider-side failure, opening the breaker if needed.
+
+        Outcomes of calls still in flight when the breaker opened are
+        ignored, so they cannot extend the open period.
+        """
+        if self._state is CircuitState.OPEN:
+            return
+        if self._state is CircuitState.HALF_OPEN:
+            self._open("probe failed")
+            return
+        self._record(ok=False)
+        calls, rate = self._stats()
+        policy = self.policy
+        if calls >= policy.min_calls and rate >= policy.failure_rate_threshold:
+            self._open(f"{rate:.0%} of {calls} calls failed")
+
+    def retry_in_seconds(self) -> float:
+        """Seconds until an open breaker lets a probe through."""
+        if self._state is not CircuitState.OPEN:
+            return 0.0
+        remaining = self._opened_at + self.policy.open_seconds - self._clock()
+        return max(remaining, 0.0)
+
+    def status(self) -> CircuitStatus:
+        """Snapshot for health reporting."""
+        state = self.state
+        calls, rate = self._stats()
+        return CircuitStatus(
+            state=state,
+            failure_rate=round(rate, 3),
+            calls=calls,
+            retry_in_seconds=round(self.retry_in_seconds(), 1),
+        )
+
+    def _record(self, ok: bool) -> None:
+        self._calls.append((self._clock(), ok))
+        self._prune()
+
+    def _prune(self) -> None:
+        horizon = self._clock() - self.policy.window_seconds
+        while self._calls and self._calls[0][0] < horizon:
+            self._calls.popleft()
+
+    def _stats(self) -> tuple[int, float]:
+        self._prune()
+        calls = len(self._calls)
+        if not calls:
+            return 0, 0.0
+        failures = sum(1 for _, ok in self._calls if not ok)
+        return calls, failures / calls
+
+    def _open(self, reason: str) -> None:
+        logger.warning(
+            "%s circuit opened (%s); refusing calls for %.0fs",
+            self.name,
+            reason,
+            self.policy.open_seconds,
+        )
+        self._state = CircuitState.OPEN
+        self._opened_at = self._clock()
+        self._calls.clear()
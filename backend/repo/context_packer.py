@@ -0,0 +1,112 @@
+"""Relevance-ranked packing of search hits into a token budget."""
+
+import logging
+import math
+import re
+from collections import Counter
+from collections.abc import Iterable
+
+from backend.repo.context_trimmer import (
+    DEFAULT_MODEL_WINDOW,
+    DEFAULT_TOKENIZER_MODEL,
+    count_tokens,
+)
+
+logger = logging.getLogger(__name__)
+
+HIT_SEPARATOR = "\n---\n"
+CONTEXT_HEADER = "\n\nSearch context:\n"
+BM25_K1 = 1.5
+BM25_B = 0.75
+
+_TERM_RE = re.compile(r"\w+")
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it its of on or "
+    "that the this to was were will with you your".split()
+)
+
+
+def tokenize_terms(text: str) -> list[str]:
+    """Split text into lowercase index terms, dropping stopwords."""
+    return [
+        term
+        for term in _TERM_RE.findall(text.lower())
+        if len(term) > 1 and term not in _STOPWORDS
+    ]
+
+
+def bm25_scores(query: str, docs: list[str]) -> list[float]:
+    """Score each document against the query with Okapi BM25."""
+    if not docs:
+        return []
+    doc_terms = [Counter(tokenize_terms(doc)) for doc in docs]
+    lengths = [sum(terms.values()) for terms in doc_terms]
+    avg_length = sum(lengths) / len(docs) or 1.0
+    doc_freq: Counter[str] = Counter()
+    for terms in doc_terms:
+        doc_freq.update(terms.keys())
+    n_docs = len(docs)
+    query_terms = set(tokenize_terms(query))
+
+    scores = []
+    for terms, length in zip(doc_terms, lengths):
+        norm = BM25_K1 * (1 - BM25_B + BM25_B * length / avg_length)
+        score = 0.0
+        for term in query_terms & terms.keys():
+            df = doc_freq[term]
+            idf = math.log(1 + (n_docs - df + 0.5) / (df + 0.5))
+            tf = terms[term]
+            score += idf * tf * (BM25_K1 + 1) / (tf + norm)
+        scores.append(score)
+    return scores
+
+
+def pack_context(
+    prompt: str,
+    hits: list[str],
+    preambles: Iterable[str] = (),
+    max_fraction: float = 0.75,
+    max_tokens: int = DEFAULT_MODEL_WINDOW,
+    model: str = DEFAULT_TOKENIZER_MODEL,
+) -> str:
+    """Pack the most relevant whole hits into the prompt's token budget.
+
+    Hits are ranked by BM25 against the prompt and added best-first,
+    skipping any that no longer fit. The budget is charged for the
+    prompt, the context header and the longest section preamble, since
+    every section call sends one preamble alongside the shared prompt.
+    """
+    budget = int(max_tokens * max_fraction)
+    overhead = (
+        count_tokens(prompt, model)
+        + count_tokens(CONTEXT_HEADER, model)
+        + max((count_tokens(p, model) for p in preambles), default=0)
+    )
+    available = budget - overhead
+    if available <= 0:
+        logger.warning("Prompt and preambles alone exceed token budget")
+        return ""
+
+    scores = bm25_scores(prompt, hits)
+    ranked = sorted(range(len(hits)), key=lambda i: (-scores[i], i))
+    separator_tokens = count_tokens(HIT_SEPARATOR, model)
+    kept: list[str] = []
+    used = 0
+    for index in ranked:
+        cost = count_tokens(hits[index], model)
+        if kept:
+            cost += separator_tokens
+        if used + cost > available:
+            continue
+        kept.append(hits[index])
+        used += cost
+
+    if len(kept) < len(hits):
+        logger.info(
+            "Packed %d of %d search hits into ~%d/%d tokens",
+            len(kept),
+            len(hits),
+            used,
+            available,
+        )
+    return HIT_SEPARATOR.join(kept)
@@ -1,23 +1,68 @@
 """Token counting and context trimming for LLM context windows."""
 
 import logging
+import os
+import time
+from collections.abc import Iterable
+from functools import lru_cache
 
 import tiktoken
 
+from backend.types.errors import TokenizerError
+
 logger = logging.getLogger(__name__)
 
 DEFAULT_MODEL_WINDOW = 128_000
+DEFAULT_TOKENIZER_MODEL = "gpt-4o"
+FALLBACK_ENCODING = "cl100k_base"
+CHARS_PER_TOKEN_GUESS = 8
+TIKTOKEN_CACHE_ENV = "TIKTOKEN_CACHE_DIR"
+VALIDATION_TEXT = "Deep research: 128k tokens, naïve café 数据 🚀\n"
+
+
+@lru_cache(maxsize=8)
+def get_encoding(model: str = DEFAULT_TOKENIZER_MODEL) -> tiktoken.Encoding:
+    """Return the tiktoken encoding for a model, loaded once per model."""
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding(FALLBACK_ENCODING)
+
+
+def preload_encodings(
+    models: Iterable[str] = (DEFAULT_TOKENIZER_MODEL,),
+    cache_dir: str | None = None,
+) -> float:
+    """Load and validate the encodings for ``models``; return seconds taken.
+
+    With ``cache_dir`` set, tiktoken reads its BPE files from (and
+    downloads missing ones into) that directory, unless TIKTOKEN_CACHE_DIR
+    is already set. Any load or round-trip failure is raised as
+    TokenizerError.
+    """
+    if cache_dir:
+        os.environ.setdefault(TIKTOKEN_CACHE_ENV, cache_dir)
+    start = time.perf_counter()
+    for model in models:
+        try:
+            encoding = get_encoding(model)
+            tokens = encoding.encode_ordinary(VALIDATION_TEXT)
+        except Exception as exc:
+            raise TokenizerError(
+                f"Could not load tokenizer for {model}: {exc}"
+            ) from exc
+        if not tokens or encoding.decode(tokens) != VALIDATION_TEXT:
+            raise TokenizerError(
+                f"Tokenizer {encoding.name} for {model} failed validation"
+            )
+    return time.perf_counter() - start
 
 
-def count_tokens(text: str, model: str = "gpt-4o") -> int:
+def count_tokens(text: str, model: str = DEFAULT_TOKENIZER_MODEL) -> int:
     """Count tokens in text using tiktoken."""
     if not text:
         return 0
-    try:
-        encoding = tiktoken.encoding_for_model(model)
-    except KeyError:
-        encoding = tiktoken.get_encoding("cl100k_base")
-    return len(encoding.encode(text))
+    return len(get_encoding(model).encode_ordinary(text))
 
 
 def trim_context(
@@ -25,36 +70,56 @@ def trim_context(
     context: str,
     max_fraction: float = 0.75,
     max_tokens: int = DEFAULT_MODEL_WINDOW,
+    model: str = DEFAULT_TOKENIZER_MODEL,
 ) -> str:
     """Trim search context if combined tokens exceed budget.
 
-    Keeps the prompt intact and truncates context lines from the
-    end until the total fits within max_fraction of max_tokens.
+    Keeps the prompt intact and cuts the context at the token budget,
+    snapped back to the last full line, so the total fits within
+    max_fraction of max_tokens. Only a prefix a little longer than the
+    budget is encoded, so the cost does not grow with the context size.
     """
     budget = int(max_tokens * max_fraction)
-    prompt_tokens = count_tokens(prompt)
-    available = budget - prompt_tokens
+    available = budget - count_tokens(prompt, model)
     if available <= 0:
         logger.warning("Prompt alone exceeds token budget")
         return ""
 
-    context_tokens = count_tokens(context)
-    if context_tokens <= available:
-        return context
+    encoding = get_encoding(model)
+    window = available * CHARS_PER_TOKEN_GUESS
+    while True:
+        tokens = encoding.encode_ordinary(context[:window])
+        if len(tokens) > available:
+            break
+        if window >= len(context):
+            return context
+        window *= 2
 
     logger.info(
-        "Trimming context from %d to ~%d tokens",
-        context_tokens,
+        "Trimming context of %d chars to ~%d tokens",
+        len(context),
         available,
     )
-    lines = context.split("\n")
-    kept: list[str] = []
-    running = 0
-    for line in lines:
-        line_tokens = count_tokens(line)
-        if running + line_tokens > available:
-            break
-        kept.append(line)
-        running += line_tokens
+    return _cut_at_line(encoding, tokens, available)
 
-    return "\n".join(kept)
+
+def _cut_at_line(
+    encoding: tiktoken.Encoding, tokens: list[int], available: int
+) -> str:
+    """Return the longest whole-line prefix that fits in ``available``.
+
+    Re-encoding a prefix can merge tokens differently from the slice it
+    came from, so the cut is re-checked and tightened until it fits.
+    """
+    limit = available
+    while limit > 0:
+        head = encoding.decode_bytes(tokens[:limit])
+        newline = head.rfind(b"\n")
+        if newline < 0:
+            return ""
+        trimmed = head[:newline].decode("utf-8")
+        used = len(encoding.encode_ordinary(trimmed))
+        if used <= available:
+            return trimmed
+        limit -= used - available
+    return ""
@@ -0,0 +1,62 @@
+"""Run-wide deadline shared by every engine and graph node of a run."""
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+
+from backend.types.errors import DeadlineExceededError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class Deadline:
+    """A fixed point in monotonic time that a research run must finish by.
+
+    The orchestrator creates one per run and hands it down; each engine
+    and each graph node bounds its own work by whatever budget remains,
+    so a hung provider call fails at the deadline instead of pinning
+    the run.
+    """
+
+    def __init__(
+        self,
+        seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.seconds = seconds
+        self._clock = clock
+        self._expires_at = clock() + seconds
+
+    def remaining(self) -> float:
+        """Seconds left before the deadline, never negative."""
+        return max(0.0, self._expires_at - self._clock())
+
+    @property
+    def expired(self) -> bool:
+        """Whether the budget is used up."""
+        return self.remaining() <= 0.0
+
+    async def run(self, awaitable: Awaitable[T], what: str) -> T:
+        """Await ``awaitable`` within the remaining budget.
+
+        On expiry the awaitable is cancelled and DeadlineExceededError
+        is raised, naming ``what`` was cut short.
+        """
+        remaining = self.remaining()
+        if remaining <= 0.0:
+            if asyncio.iscoroutine(awaitable):
+                awaitable.close()
+            raise DeadlineExceededError(
+                f"Run deadline of {self.seconds:.0f}s expired before {what}"
+            )
+        try:
+            return await asyncio.wait_for(awaitable, remaining)
+        except TimeoutError as exc:
+            logger.warning("Run deadline expired during %s", what)
+            raise DeadlineExceededError(
+                f"Run deadline of {self.seconds:.0f}s expired during {what}"
+            ) from exc
@@ -1,12 +1,18 @@
 """Firestore repository for research reports."""
 
 import logging
+from collections.abc import Iterable
 
+from google.api_core.exceptions import AlreadyExists
+
+from backend.types.enums import ResearchStatus
 from backend.types.errors import FirestoreError
-from backend.types.report import ResearchReport
+from backend.types.report import EngineResult, ResearchReport
 
 logger = logging.getLogger(__name__)
 
+RESULTS_FIELD = "results"
+
 
 class FirestoreRepo:
     """Async CRUD operations for research reports in Firestore."""
@@ -33,6 +39,57 @@ class FirestoreRepo:
                 f"Failed to save report {report.report_id}"
             ) from exc
 
+    async def create_report(self, report: ResearchReport) -> bool:
+        """Create a report document unless one already exists.
+
+        Returns False, leaving the stored document untouched, when the
+        report is already there.
+        """
+        try:
+            await self._doc_ref(report.report_id).create(
+                report.model_dump(mode="json")
+            )
+        except AlreadyExists:
+            return False
+        except Exception as exc:
+            logger.error("Failed to create report %s: %s", report.report_id, exc)
+            raise FirestoreError(
+                f"Failed to create report {report.report_id}"
+            ) from exc
+        logger.info("Created report %s", report.report_id)
+        return True
+
+    async def update_report(
+        self,
+        report_id: str,
+        status: ResearchStatus | None = None,
+        results: Iterable[EngineResult] = (),
+    ) -> None:
+        """Merge engine results and/or a status into an existing report.
+
+        Only the given fields are written, each result to its own
+        ``results.<engine>`` entry, so a result saved by one engine is
+        never overwritten by another engine's update.
+        """
+        fields: dict[str, object] = {
+            f"{RESULTS_FIELD}.{result.engine.value}": result.model_dump(
+                mode="json"
+            )
+            for result in results
+        }
+        if status is not None:
+            fields["status"] = status.value
+        if not fields:
+            return
+        try:
+            await self._doc_ref(report_id).update(fields)
+            logger.info("Updated report %s: %s", report_id, sorted(fields))
+        except Exception as exc:
+            logger.error("Failed to update report %s: %s", report_id, exc)
+            raise FirestoreError(
+                f"Failed to update report {report_id}"
+            ) from exc
+
     async def get_report(self, report_id: str) -> ResearchReport | None:
         """Get a single report by ID."""
         try:
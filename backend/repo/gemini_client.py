@@ -1,38 +1,129 @@
 """Gemini Deep Research API client."""
 
+import asyncio
 import logging
+from collections.abc import AsyncIterator
 
 from google import genai
 
+from backend.repo.circuit_breaker import CircuitBreaker
+from backend.repo.rate_limiter import ProviderLimiter, estimate_tokens
 from backend.types.errors import GeminiApiError
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_TIMEOUT_SECONDS = 900.0
+
 
 class GeminiResearchClient:
     """Client for running research via Google Gemini Deep Research."""
 
-    def __init__(self, api_key: str, model: str) -> None:
+    def __init__(
+        self,
+        api_key: str,
+        model: str,
+        timeout_seconds: float = DEFAULT_TIMEOUT_SECONDS,
+        limiter: ProviderLimiter | None = None,
+    ) -> None:
         self.model = model
+        self.timeout_seconds = timeout_seconds
         self._client = genai.Client(api_key=api_key)
+        self._limiter = limiter or ProviderLimiter("gemini")
+
+    @property
+    def breakers(self) -> tuple[CircuitBreaker, ...]:
+        """Circuit breakers of the providers this client depends on."""
+        breaker = self._limiter.breaker
+        return (breaker,) if breaker is not None else ()
+
+    async def aclose(self) -> None:
+        """Close the SDK client's async and sync HTTP connections."""
+        await self._client.aio.aclose()
+        self._client.close()
 
     async def run_research(self, prompt: str) -> str:
         """Execute a research query and return markdown result."""
         logger.info("Starting Gemini research with model %s", self.model)
         try:
-            return await self._execute_research(prompt)
+            return await asyncio.wait_for(
+                self._execute_research(prompt), self.timeout_seconds
+            )
         except GeminiApiError:
             raise
+        except TimeoutError as exc:
+            logger.error(
+                "Gemini research timed out after %.0fs", self.timeout_seconds
+            )
+            raise GeminiApiError(
+                f"Gemini research timed out after {self.timeout_seconds:.0f}s"
+            ) from exc
         except Exception as exc:
             logger.error("Gemini research failed: %s", exc)
             raise GeminiApiError(f"Gemini research failed: {exc}") from exc
 
     async def _execute_research(self, prompt: str) -> str:
-        """Execute the actual Gemini API call."""
-        response = self._client.models.generate_content(
-            model=self.model,
-            contents=prompt,
+        """Execute the Gemini API call on the async client surface.
+
+        Uses ``client.aio`` so the event loop keeps serving other
+        requests for the duration of the call; cancelling the awaiting
+        task cancels the underlying HTTP request. Throttled or transient
+        failures are retried by the limiter within the overall timeout.
+        """
+        response = await self._limiter.run(
+            lambda: self._client.aio.models.generate_content(
+                model=self.model,
+                contents=prompt,
+            ),
+            tokens=estimate_tokens(prompt),
         )
         if response.text is None:
             raise GeminiApiError("Gemini returned empty response")
         return response.text
+
+    async def stream_research(self, prompt: str) -> AsyncIterator[str]:
+        """Stream the research markdown as text chunks arrive.
+
+        The per-call timeout bounds the whole stream, not each chunk.
+        Only opening the stream is retried; a stream that fails midway
+        is not replayed, since its chunks were already yielded.
+        """
+        logger.info("Starting Gemini streaming research with model %s", self.model)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.timeout_seconds
+        received = False
+        try:
+            stream = await asyncio.wait_for(
+                self._limiter.run(
+                    lambda: self._client.aio.models.generate_content_stream(
+                        model=self.model,
+                        contents=prompt,
+                    ),
+                    tokens=estimate_tokens(prompt),
+                ),
+                self.timeout_seconds,
+            )
+            chunks = aiter(stream)
+            while True:
+                try:
+                    chunk = await asyncio.wait_for(
+                        anext(chunks), deadline - loop.time()
+                    )
+                except StopAsyncIteration:
+                    break
+                if chunk.text:
+                    received = True
+                    yield chunk.text
+        except GeminiApiError:
+            raise
+        except TimeoutError as exc:
+            logger.error(
+                "Gemini stream timed out after %.0fs", self.timeout_seconds
+            )
+            raise GeminiApiError(
+                f"Gemini research timed out after {self.timeout_seconds:.0f}s"
+            ) from exc
+        except Exception as exc:
+            logger.error("Gemini streaming research failed: %s", exc)
+            raise GeminiApiError(f"Gemini research failed: {exc}") from exc
+        if not received:
+            raise GeminiApiError("Gemini returned empty response")
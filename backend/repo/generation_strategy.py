@@ -0,0 +1,32 @@
+"""Section generation strategies for the LangGraph research pipeline."""
+
+from backend.repo.context_packer import HIT_SEPARATOR
+from backend.repo.context_trimmer import count_tokens
+
+FAN_OUT = "fan-out"
+SINGLE_CALL = "single-call"
+MAP_REDUCE = "map-reduce"
+STRATEGIES = (FAN_OUT, SINGLE_CALL, MAP_REDUCE)
+
+FULL_REPORT_SECTION = "full_report"
+MAP_CHUNK_TOKENS = 8_000
+
+
+def chunk_hits(hits: list[str], max_tokens: int = MAP_CHUNK_TOKENS) -> list[str]:
+    """Group whole search hits into chunks of at most ``max_tokens``.
+
+    A single hit larger than the limit becomes a chunk of its own.
+    """
+    chunks: list[str] = []
+    current: list[str] = []
+    used = 0
+    for hit in hits:
+        cost = count_tokens(hit)
+        if current and used + cost > max_tokens:
+            chunks.append(HIT_SEPARATOR.join(current))
+            current, used = [], 0
+        current.append(hit)
+        used += cost
+    if current:
+        chunks.append(HIT_SEPARATOR.join(current))
+    return chunks
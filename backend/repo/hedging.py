@@ -0,0 +1,128 @@
+"""Latency-quantile request hedging under a bounded extra-load budget."""
+
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+
+from backend.types.resilience import HedgePolicy
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class LatencyTracker:
+    """Rolling window of recent latencies per key."""
+
+    def __init__(self, window: int, min_samples: int) -> None:
+        self._window = window
+        self._min_samples = min_samples
+        self._samples: dict[str, deque[float]] = {}
+
+    def record(self, key: str, seconds: float) -> None:
+        """Add one observed latency for ``key``."""
+        samples = self._samples.setdefault(key, deque(maxlen=self._window))
+        samples.append(seconds)
+
+    def quantile(self, key: str, q: float) -> float | None:
+        """Nearest-rank quantile, or None until enough samples exist."""
+        samples = self._samples.get(key)
+        if not samples or len(samples) < self._min_samples:
+            return None
+        ordered = sorted(samples)
+        rank = max(math.ceil(q * len(ordered)) - 1, 0)
+        return ordered[rank]
+
+
+class HedgeBudget:
+    """Caps hedges to a fraction of the most recent primary requests."""
+
+    def __init__(self, ratio: float, window: int) -> None:
+        self._ratio = ratio
+        self._recent: deque[bool] = deque(maxlen=window)
+
+    def record_request(self) -> None:
+        """Count a primary request against the window."""
+        self._recent.append(False)
+
+    def try_spend(self) -> bool:
+        """Take one hedge if the window still has budget for it."""
+        hedged = sum(self._recent)
+        if hedged + 1 > self._ratio * len(self._recent):
+            return False
+        for index in range(len(self._recent) - 1, -1, -1):
+            if not self._recent[index]:
+                self._recent[index] = True
+                return True
+        return False
+
+
+class Hedger:
+    """Send a duplicate request when the first outlives the key's quantile.
+
+    Whichever copy answers first wins and the other is cancelled. Until
+    a key has ``min_samples`` latencies, requests are never hedged. A
+    primary cancelled in favour of its hedge is recorded at its elapsed
+    time, a lower bound that keeps the quantile from drifting down.
+    """
+
+    def __init__(
+        self,
+        policy: HedgePolicy | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.policy = policy or HedgePolicy()
+        self._clock = clock
+        self._latencies = LatencyTracker(
+            self.policy.window, self.policy.min_samples
+        )
+        self._budget = HedgeBudget(self.policy.budget_ratio, self.policy.window)
+        self.hedges_sent = 0
+        self.hedges_won = 0
+
+    def threshold(self, key: str) -> float | None:
+        """Seconds after which a request for ``key`` is hedged."""
+        return self._latencies.quantile(key, self.policy.quantile)
+
+    async def run(self, key: str, call: Callable[[], Awaitable[T]]) -> T:
+        """Run ``call``, hedging it once if it is slower than usual."""
+        start = self._clock()
+        threshold = self.threshold(key)
+        self._budget.record_request()
+        primary = asyncio.ensure_future(call())
+        tasks = {primary}
+        try:
+            if threshold is not None:
+                done, _ = await asyncio.wait(tasks, timeout=threshold)
+                if not done and self._budget.try_spend():
+                    self.hedges_sent += 1
+                    logger.info("Hedging %s after %.2fs", key, threshold)
+                    tasks.add(asyncio.ensure_future(call()))
+            winner = await _first_success(tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+        if winner is not primary:
+            self.hedges_won += 1
+        self._latencies.record(key, self._clock() - start)
+        return winner.result()
+
+
+async def _first_success(tasks: set[asyncio.Future[T]]) -> asyncio.Future[T]:
+    """Return the first task to succeed, or raise the last failure."""
+    pending = set(tasks)
+    errors: list[BaseException] = []
+    while pending:
+        done, pending = await asyncio.wait(
+            pending, return_when=asyncio.FIRST_COMPLETED
+        )
+        for task in done:
+            error = task.exception()
+            if error is None:
+                return task
+            errors.append(error)
+    raise errors[-1]
@@ -0,0 +1,31 @@
+"""Shared pooled HTTP client for outbound provider calls."""
+
+import httpx
+
+DEFAULT_TIMEOUT_SECONDS = 120.0
+DEFAULT_MAX_CONNECTIONS = 20
+DEFAULT_MAX_KEEPALIVE = 10
+DEFAULT_KEEPALIVE_EXPIRY = 60.0
+
+
+def build_async_http_client(
+    timeout_seconds: float = DEFAULT_TIMEOUT_SECONDS,
+    max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    max_keepalive: int = DEFAULT_MAX_KEEPALIVE,
+    http2: bool = True,
+) -> httpx.AsyncClient:
+    """Build a keep-alive, HTTP/2-capable async client meant to be shared.
+
+    One instance should back every provider client of a research client
+    so connections and TLS sessions are reused across calls and runs.
+    """
+    limits = httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive,
+        keepalive_expiry=DEFAULT_KEEPALIVE_EXPIRY,
+    )
+    return httpx.AsyncClient(
+        http2=http2,
+        limits=limits,
+        timeout=httpx.Timeout(timeout_seconds),
+    )
@@ -3,27 +3,78 @@
 import asyncio
 import logging
 import os
+import threading
+import time
 import uuid
+from collections.abc import Awaitable
+from typing import TypeVar
 
+import aiosqlite
+import httpx
+from langchain_core.runnables import RunnableConfig
+from langchain_openai import ChatOpenAI
+from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
 from langgraph.graph import END, START, StateGraph
 from langgraph.types import Send
 
 from backend.config.prompts import (
+    ANALYST_ROLE,
+    CHUNK_SUMMARY_PREAMBLE,
     DIVES_AUDIT_PREAMBLE,
     EVENTS_PREAMBLE,
+    FULL_REPORT_PREAMBLE,
     TLDR_PREAMBLE,
 )
-from backend.repo.context_trimmer import trim_context
-from backend.types.errors import LangChainError
+from backend.repo.circuit_breaker import CircuitBreaker
+from backend.repo.context_packer import (
+    CONTEXT_HEADER,
+    HIT_SEPARATOR,
+    pack_context,
+)
+from backend.repo.context_trimmer import count_tokens, trim_context
+from backend.repo.deadline import Deadline
+from backend.repo.generation_strategy import (
+    FAN_OUT,
+    FULL_REPORT_SECTION,
+    MAP_REDUCE,
+    SINGLE_CALL,
+    STRATEGIES,
+    chunk_hits,
+)
+from backend.repo.hedging import Hedger
+from backend.repo.http_pool import build_async_http_client
+from backend.repo.llm_cache import LLMResponseCache, make_cache_key
+from backend.repo.near_dedup import DEFAULT_THRESHOLD, filter_near_duplicates
+from backend.repo.rate_limiter import ProviderLimiter, estimate_tokens
+from backend.repo.search_cache import SearchCache
+from backend.repo.tavily_client import TAVILY_API_URL, TavilySearchClient
+from backend.types.enums import ProgressKind
+from backend.types.errors import (
+    CircuitOpenError,
+    DeadlineExceededError,
+    LangChainError,
+)
 from backend.types.graph_state import (
+    ChunkSummaryState,
     ResearchGraphState,
     SectionGenerateState,
 )
+from backend.types.progress import ProgressCallback
+from backend.types.routing import SectionRoute
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 SECTION_ORDER = ["tldr", "events", "dives_audit"]
 
+SEARCH_MAX_RESULTS = 10
+
+SHARED_PREFIX_LAYOUT = "shared_prefix"
+PREAMBLE_FIRST_LAYOUT = "preamble_first"
+MESSAGE_LAYOUTS = (SHARED_PREFIX_LAYOUT, PREAMBLE_FIRST_LAYOUT)
+USAGE_KEYS = ("input_tokens", "cached_tokens", "output_tokens")
+
 SECTION_PREAMBLES: dict[str, str] = {
     "tldr": TLDR_PREAMBLE,
     "events": EVENTS_PREAMBLE,
@@ -41,10 +92,45 @@ def _build_search_queries(prompt: str) -> list[str]:
     ]
 
 
-def _dedup_results(raw_results: list[object]) -> str:
+async def _stream_progress(
+    graph: object,
+    inputs: dict[str, object] | None,
+    config: dict[str, object],
+    on_progress: ProgressCallback,
+) -> None:
+    """Drive the graph via ``astream_events``, reporting node milestones.
+
+    Only events emitted by graph nodes themselves are considered; the
+    final state is left in the checkpoint for the caller to read.
+    """
+    events = graph.astream_events(inputs, config=config, version="v2")
+    async for event in events:
+        node = event.get("metadata", {}).get("langgraph_node")
+        if node is None or event["name"] != node:
+            continue
+        kind = event["event"]
+        if node == "search" and kind == "on_chain_start":
+            await on_progress(ProgressKind.SEARCH_STARTED, {})
+        elif node == "search" and kind == "on_chain_end":
+            hits = event["data"].get("output", {}).get("search_hits", [])
+            await on_progress(ProgressKind.SEARCH_FINISHED, {"hits": len(hits)})
+        elif node == "generate_section" and kind == "on_chain_end":
+            output = event["data"].get("output", {})
+            for section in output.get("section_results", []):
+                await on_progress(
+                    ProgressKind.SECTION_GENERATED,
+                    {
+                        "section": section["section_name"],
+                        "model": section.get("model"),
+                        "latency_seconds": section.get("latency_seconds"),
+                    },
+                )
+
+
+def _dedup_results(raw_results: list[object]) -> list[dict[str, object]]:
     """Deduplicate search results by URL."""
     seen_urls: set[str] = set()
-    combined: list[str] = []
+    combined: list[dict[str, object]] = []
     for batch in raw_results:
         if isinstance(batch, Exception):
             logger.warning("Search query failed: %s", batch)
@@ -55,13 +141,64 @@ def _dedup_results(raw_results: list[object]) -> str:
             url = item.get("url", "")
             if url and url not in seen_urls:
                 seen_urls.add(url)
-                combined.append(
-                    f"Title: {item.get('title', '')}\n"
-                    f"URL: {url}\n"
-                    f"Content: {item.get('content', '')}"
-                )
+                combined.append(item)
     logger.info("Search collected %d unique results", len(combined))
-    return "\n---\n".join(combined)
+    return combined
+
+
+def _raise_if_search_unavailable(results: list[object]) -> None:
+    """Fail the search if its circuit is open or every query failed.
+
+    A single failed query still leaves usable context, but writing a
+    report from no search results at all would pass for a success.
+    """
+    errors = [r for r in results if isinstance(r, Exception)]
+    for error in errors:
+        if isinstance(error, CircuitOpenError):
+            raise error
+    if errors and len(errors) == len(results):
+        raise LangChainError(f"All {len(results)} searches failed: {errors[0]}")
+
+
+def _format_hit(item: dict[str, object]) -> str:
+    """Render one search result as a context block."""
+    return (
+        f"Title: {item.get('title', '')}\n"
+        f"URL: {item.get('url', '')}\n"
+        f"Content: {item.get('content', '')}"
+    )
+
+
+def _usage_from(response: object) -> dict[str, int]:
+    """Read input, cached-input and output token counts off a response."""
+    usage = getattr(response, "usage_metadata", None)
+    if not isinstance(usage, dict):
+        return dict.fromkeys(USAGE_KEYS, 0)
+    details = usage.get("input_token_details") or {}
+    return {
+        "input_tokens": int(usage.get("input_tokens", 0)),
+        "cached_tokens": int(details.get("cache_read", 0)),
+        "output_tokens": int(usage.get("output_tokens", 0)),
+    }
+
+
+async def _within_deadline(
+    config: RunnableConfig | None, awaitable: Awaitable[T], what: str
+) -> T:
+    """Await ``awaitable`` within the run's remaining deadline, if any."""
+    deadline = (config or {}).get("configurable", {}).get("deadline")
+    if deadline is None:
+        return await awaitable
+    return await deadline.run(awaitable, what)
+
+
+def _record_timing(
+    config: RunnableConfig | None, stage: str, seconds: float
+) -> None:
+    """Record how long a stage took in the run's timings, if collected."""
+    timings = (config or {}).get("configurable", {}).get("timings")
+    if timings is not None:
+        timings[stage] = round(seconds, 3)
 
 
 def _build_initial_state(
@@ -71,9 +208,13 @@ def _build_initial_state(
     return {
         "prompt": prompt,
         "search_context": "",
+        "search_hits": [],
+        "duplicate_tokens_saved": 0,
         "full_prompt": "",
+        "chunk_summaries": [],
         "section_results": [],
         "combined_markdown": "",
+        "token_usage": {},
         "run_id": run_id,
         "date": "",
     }
@@ -88,23 +229,144 @@ class LangChainResearchClient:
         tavily_api_key: str,
         model: str,
         checkpoint_path: str = ":memory:",
+        http_client: httpx.AsyncClient | None = None,
+        openai_base_url: str | None = None,
+        tavily_base_url: str = TAVILY_API_URL,
+        search_cache: SearchCache | None = None,
+        llm_cache: LLMResponseCache | None = None,
+        near_duplicate_threshold: float | None = DEFAULT_THRESHOLD,
+        message_layout: str = SHARED_PREFIX_LAYOUT,
+        strategy: str = FAN_OUT,
+        section_routes: dict[str, SectionRoute] | None = None,
+        openai_limiter: ProviderLimiter | None = None,
+        tavily_limiter: ProviderLimiter | None = None,
+        search_hedger: Hedger | None = None,
     ) -> None:
+        if message_layout not in MESSAGE_LAYOUTS:
+            raise ValueError(f"Unknown message layout: {message_layout}")
+        if strategy not in STRATEGIES:
+            raise ValueError(f"Unknown generation strategy: {strategy}")
         self.model = model
         self._openai_api_key = openai_api_key
         self._tavily_api_key = tavily_api_key
         self._checkpoint_path = checkpoint_path
+        self._http = http_client or build_async_http_client()
+        self._openai_base_url = openai_base_url
+        self._openai_limiter = openai_limiter or ProviderLimiter("openai")
+        self._tavily_limiter = tavily_limiter or ProviderLimiter("tavily")
+        self._llm = ChatOpenAI(
+            model=model,
+            api_key=openai_api_key,
+            base_url=openai_base_url,
+            http_async_client=self._http,
+            max_retries=0,
+        )
+        self._generation_params: dict[str, object] = {
+            "temperature": self._llm.temperature,
+            "max_tokens": self._llm.max_tokens,
+        }
+        self._section_llms = {
+            name: self._build_section_llm(route)
+            for name, route in (section_routes or {}).items()
+        }
+        self._search_client = TavilySearchClient(
+            api_key=tavily_api_key,
+            http_client=self._http,
+            base_url=tavily_base_url,
+            limiter=self._tavily_limiter,
+        )
+        self._search_cache = search_cache
+        self._search_hedger = search_hedger
+        self._llm_cache = llm_cache
+        self._near_duplicate_threshold = near_duplicate_threshold
+        self._message_layout = message_layout
+        self.strategy = strategy
+        self._checkpointer: AsyncSqliteSaver | None = None
+        self._graph: object | None = None
+        self._graph_lock = threading.Lock()
+
+    def _build_section_llm(
+        self, route: SectionRoute
+    ) -> tuple[str, ChatOpenAI, dict[str, object]]:
+        """Build the model, client and cache params for a routed section."""
+        model = route.model or self.model
+        llm = ChatOpenAI(
+            model=model,
+            api_key=self._openai_api_key,
+            base_url=self._openai_base_url,
+            http_async_client=self._http,
+            max_retries=0,
+            max_tokens=route.max_tokens,
+            temperature=route.temperature,
+        )
+        params = {"temperature": llm.temperature, "max_tokens": llm.max_tokens}
+        return model, llm, params
+
+    def _llm_for(
+        self, section: str | None
+    ) -> tuple[str, ChatOpenAI, dict[str, object]]:
+        """Return (model, client, params) for a section, or the default."""
+        if section in self._section_llms:
+            return self._section_llms[section]
+        return self.model, self._llm, self._generation_params
+
+    @property
+    def breakers(self) -> tuple[CircuitBreaker, ...]:
+        """Circuit breakers of the providers this client depends on."""
+        limiters = (self._openai_limiter, self._tavily_limiter)
+        return tuple(lim.breaker for lim in limiters if lim.breaker is not None)
+
+    @property
+    def graph(self) -> object:
+        """Compiled research graph, built once and shared across runs.
+
+        A compiled graph keeps no per-run state, so concurrent
+        ``ainvoke`` calls can safely share it.
+        """
+        if self._graph is None:
+            with self._graph_lock:
+                if self._graph is None:
+                    self._graph = self._build_graph()
+        return self._graph
+
+    async def _get_graph(self) -> object:
+        """Compiled graph bound to the SQLite checkpointer.
+
+        The saver needs a running loop, so it is opened on the first
+        run and the graph is (re)compiled against it once.
+        """
+        if self._checkpointer is None:
+            if self._checkpoint_path != ":memory:":
+                os.makedirs(
+                    os.path.dirname(os.path.abspath(self._checkpoint_path)),
+                    exist_ok=True,
+                )
+            self._checkpointer = AsyncSqliteSaver(
+                aiosqlite.connect(self._checkpoint_path)
+            )
+            with self._graph_lock:
+                self._graph = None
+        return self.graph
+
+    async def aclose(self) -> None:
+        """Close pooled HTTP connections and the checkpoint database."""
+        await self._http.aclose()
+        if self._checkpointer is not None:
+            await self._checkpointer.conn.close()
 
     def _build_graph(self) -> object:
         """Construct and compile the LangGraph StateGraph."""
         graph = StateGraph(ResearchGraphState)
         graph.add_node("search", self._search_node)
         graph.add_node("compose_context", self._compose_context_node)
+        graph.add_node("summarize_chunk", self._summarize_chunk_node)
+        graph.add_node("condense_context", self._condense_context_node)
         graph.add_node(
             "generate_section", self._generate_section_node
         )
         graph.add_node("combine_results", self._combine_results_node)
         self._add_graph_edges(graph)
-        return graph.compile()
+        return graph.compile(checkpointer=self._checkpointer)
 
     def _add_graph_edges(self, graph: StateGraph) -> None:
         """Wire up the graph edges and conditional routing."""
@@ -112,6 +374,12 @@ class LangChainResearchClient:
         graph.add_edge("search", "compose_context")
         graph.add_conditional_edges(
             "compose_context",
+            self._route_from_context,
+            ["summarize_chunk", "generate_section"],
+        )
+        graph.add_edge("summarize_chunk", "condense_context")
+        graph.add_conditional_edges(
+            "condense_context",
             self._route_to_sections,
             ["generate_section"],
         )
@@ -121,18 +389,61 @@ class LangChainResearchClient:
     def _compose_context_node(
         self, state: ResearchGraphState
     ) -> dict[str, str]:
-        """Combine prompt + trimmed search context."""
-        trimmed = trim_context(state["prompt"], state["search_context"])
-        return {
-            "full_prompt": (
-                f"{state['prompt']}\n\nSearch context:\n{trimmed}"
+        """Combine prompt + the most relevant search hits that fit.
+
+        Checkpoints from before hits were kept separately only have the
+        joined context, which is trimmed instead.
+        """
+        hits = state.get("search_hits")
+        if hits:
+            context = pack_context(
+                state["prompt"], hits, self._section_preambles().values()
             )
-        }
+        else:
+            context = trim_context(state["prompt"], state["search_context"])
+        return {"full_prompt": f"{state['prompt']}{CONTEXT_HEADER}{context}"}
+
+    def _section_preambles(self) -> dict[str, str]:
+        """Sections the configured strategy generates, with their preambles."""
+        if self.strategy == SINGLE_CALL:
+            return {FULL_REPORT_SECTION: FULL_REPORT_PREAMBLE}
+        return SECTION_PREAMBLES
+
+    def _route_from_context(self, state: ResearchGraphState) -> list[Send]:
+        """Map search chunks to summarizers, or go straight to sections."""
+        if self.strategy != MAP_REDUCE:
+            return self._route_to_sections(state)
+        hits = state.get("search_hits") or [
+            hit for hit in state["search_context"].split(HIT_SEPARATOR) if hit
+        ]
+        chunks = chunk_hits(hits)
+        if not chunks:
+            return self._route_to_sections(state)
+        logger.info("Summarizing %d search chunks", len(chunks))
+        return [
+            Send(
+                "summarize_chunk",
+                ChunkSummaryState(
+                    chunk_index=index, prompt=state["prompt"], chunk=chunk
+                ),
+            )
+            for index, chunk in enumerate(chunks)
+        ]
+
+    def _condense_context_node(
+        self, state: ResearchGraphState
+    ) -> dict[str, str]:
+        """Replace the search context with the chunk summaries, in order."""
+        summaries = sorted(
+            state["chunk_summaries"], key=lambda s: s["chunk_index"]
+        )
+        context = HIT_SEPARATOR.join(s["summary"] for s in summaries)
+        return {"full_prompt": f"{state['prompt']}{CONTEXT_HEADER}{context}"}
 
     def _route_to_sections(
         self, state: ResearchGraphState
     ) -> list[Send]:
-        """Fan out to 3 parallel LLM section generators."""
+        """Fan out to one LLM call per section of the strategy."""
         return [
             Send(
                 "generate_section",
@@ -142,28 +453,60 @@ class LangChainResearchClient:
                     full_prompt=state["full_prompt"],
                 ),
             )
-            for name, preamble in SECTION_PREAMBLES.items()
+            for name, preamble in self._section_preambles().items()
         ]
 
     def _combine_results_node(
         self, state: ResearchGraphState
-    ) -> dict[str, str]:
-        """Merge section outputs in canonical order."""
+    ) -> dict[str, object]:
+        """Merge section outputs in canonical order and total token usage."""
         by_name = {
             r["section_name"]: r["content"]
             for r in state["section_results"]
         }
-        parts = [by_name.get(s, "") for s in SECTION_ORDER]
-        return {"combined_markdown": "\n\n".join(parts)}
+        if FULL_REPORT_SECTION in by_name:
+            markdown = by_name[FULL_REPORT_SECTION]
+        else:
+            markdown = "\n\n".join(by_name.get(s, "") for s in SECTION_ORDER)
+        calls = [*state.get("chunk_summaries", []), *state["section_results"]]
+        usage = {key: sum(c.get(key, 0) for c in calls) for key in USAGE_KEYS}
+        if usage["input_tokens"]:
+            logger.info(
+                "Run %s prompt cache: %d of %d input tokens cached (%.0f%%)",
+                state["run_id"],
+                usage["cached_tokens"],
+                usage["input_tokens"],
+                100 * usage["cached_tokens"] / usage["input_tokens"],
+            )
+        return {"combined_markdown": markdown, "token_usage": usage}
 
-    async def run_research(self, prompt: str) -> str:
-        """Execute the LangGraph research pipeline."""
+    async def run_research(
+        self,
+        prompt: str,
+        use_cache: bool = True,
+        run_id: str | None = None,
+        on_progress: ProgressCallback | None = None,
+        deadline: Deadline | None = None,
+        timings: dict[str, float] | None = None,
+    ) -> str:
+        """Execute the LangGraph research pipeline.
+
+        ``use_cache=False`` bypasses the LLM response cache for this run.
+        Passing the ``run_id`` of an interrupted run resumes it from its
+        last checkpoint instead of starting over. ``on_progress`` is
+        told when search starts and finishes and as each section lands.
+        Search and every LLM call are bounded by what is left of
+        ``deadline``, and each finished stage's duration is written to
+        ``timings``.
+        """
         logger.info(
             "Starting LangGraph research with model %s", self.model
         )
         try:
-            return await self._execute_research(prompt)
-        except LangChainError:
+            return await self._execute_research(
+                prompt, use_cache, run_id, on_progress, deadline, timings
+            )
+        except (LangChainError, DeadlineExceededError):
             raise
         except Exception as exc:
             logger.error("LangChain research failed: %s", exc)
@@ -171,67 +514,303 @@ class LangChainResearchClient:
                 f"LangChain research failed: {exc}"
             ) from exc
 
-    def _build_run_config(self, run_id: str) -> dict[str, object]:
-        """Build RunnableConfig with metadata and thread ID."""
+    async def resume_research(
+        self, run_id: str, use_cache: bool = True
+    ) -> str:
+        """Resume an interrupted run from its last saved checkpoint."""
+        logger.info("Resuming LangGraph research run %s", run_id)
+        try:
+            graph = await self._get_graph()
+            config = self._build_run_config(run_id, use_cache)
+            snapshot = await graph.aget_state(config)
+            if not snapshot.next:
+                raise LangChainError(f"No interrupted run {run_id} to resume")
+            result = await graph.ainvoke(None, config=config)
+            return result["combined_markdown"]
+        except LangChainError:
+            raise
+        except Exception as exc:
+            logger.error("LangChain resume of %s failed: %s", run_id, exc)
+            raise LangChainError(
+                f"LangChain resume of {run_id} failed: {exc}"
+            ) from exc
+
+    def _build_run_config(
+        self,
+        run_id: str,
+        use_cache: bool = True,
+        deadline: Deadline | None = None,
+        timings: dict[str, float] | None = None,
+    ) -> dict[str, object]:
+        """Build RunnableConfig with metadata and thread ID.
+
+        The deadline and timings ride along in ``configurable`` so every
+        node can reach them; they are not checkpointed.
+        """
+        configurable: dict[str, object] = {
+            "thread_id": run_id,
+            "use_cache": use_cache,
+        }
+        if deadline is not None:
+            configurable["deadline"] = deadline
+        if timings is not None:
+            configurable["timings"] = timings
         return {
             "metadata": {"run_id": run_id},
             "tags": ["research"],
-            "configurable": {"thread_id": run_id},
+            "configurable": configurable,
         }
 
-    async def _execute_research(self, prompt: str) -> str:
-        """Run the compiled LangGraph pipeline."""
-        graph = self._build_graph()
-        run_id = str(uuid.uuid4())
-        config = self._build_run_config(run_id)
-        result = await graph.ainvoke(
-            _build_initial_state(prompt, run_id), config=config
-        )
+    async def _execute_research(
+        self,
+        prompt: str,
+        use_cache: bool = True,
+        run_id: str | None = None,
+        on_progress: ProgressCallback | None = None,
+        deadline: Deadline | None = None,
+        timings: dict[str, float] | None = None,
+    ) -> str:
+        """Run the compiled LangGraph pipeline, resuming if interrupted.
+
+        A thread that already ran to completion is cleared first, so
+        re-running the same ``run_id`` does fresh research instead of
+        returning the previous run's output.
+        """
+        run_id = run_id or str(uuid.uuid4())
+        config = self._build_run_config(run_id, use_cache, deadline, timings)
+        graph = await self._get_graph()
+        snapshot = await graph.aget_state(config)
+        if snapshot.next:
+            logger.info("Resuming run %s at %s", run_id, snapshot.next)
+            inputs = None
+        else:
+            if snapshot.values:
+                logger.info("Run %s already completed; starting over", run_id)
+                await self._checkpointer.adelete_thread(run_id)
+            inputs = _build_initial_state(prompt, run_id)
+        if on_progress is None:
+            result = await graph.ainvoke(inputs, config=config)
+        else:
+            await _stream_progress(graph, inputs, config, on_progress)
+            result = (await graph.aget_state(config)).values
+        if self._llm_cache is not None:
+            logger.info("LLM cache stats: %s", self._llm_cache.stats())
         return result["combined_markdown"]
 
     async def _search_node(
-        self, state: ResearchGraphState
-    ) -> dict[str, str]:
+        self,
+        state: ResearchGraphState,
+        config: RunnableConfig | None = None,
+    ) -> dict[str, object]:
         """Run 3 parallel Tavily searches and deduplicate."""
-        from langchain_tavily import TavilySearch
-
-        os.environ["TAVILY_API_KEY"] = self._tavily_api_key
-        search_tool = TavilySearch(max_results=10)
         queries = _build_search_queries(state["prompt"])
         logger.info(
             "Starting parallel search (%d queries)", len(queries)
         )
-        results = await asyncio.gather(
-            *[search_tool.ainvoke(q) for q in queries],
-            return_exceptions=True,
+        start = time.perf_counter()
+
+        async def search_all() -> list[object]:
+            # Started only once the deadline admits it, so an expired
+            # deadline never leaves orphaned search tasks behind.
+            return await asyncio.gather(
+                *[
+                    self._cached_search(query, f"query-{index}")
+                    for index, query in enumerate(queries)
+                ],
+                return_exceptions=True,
+            )
+
+        results = await _within_deadline(config, search_all(), "search")
+        _raise_if_search_unavailable(results)
+        _record_timing(config, "search", time.perf_counter() - start)
+        if self._search_cache is not None:
+            logger.info("Search cache stats: %s", self._search_cache.stats())
+        items = _dedup_results(results)
+        kept, saved = self._drop_near_duplicates(items)
+        hits = [_format_hit(item) for item in kept]
+        return {
+            "search_context": HIT_SEPARATOR.join(hits),
+            "search_hits": hits,
+            "duplicate_tokens_saved": saved,
+        }
+
+    def _drop_near_duplicates(
+        self, items: list[dict[str, object]]
+    ) -> tuple[list[dict[str, object]], int]:
+        """Drop syndicated copies; return kept hits and tokens saved.
+
+        The saving is logged per run: under map-reduce each hit is
+        summarised once, otherwise it is resent with every section call
+        the strategy makes.
+        """
+        if self._near_duplicate_threshold is None or len(items) < 2:
+            return items, 0
+        kept, dropped = filter_near_duplicates(
+            items, self._near_duplicate_threshold
         )
-        return {"search_context": _dedup_results(results)}
+        if not dropped:
+            return items, 0
+        saved = sum(count_tokens(_format_hit(items[i])) for i in dropped)
+        if self.strategy == MAP_REDUCE:
+            logger.info(
+                "Dropped %d near-duplicate hits, saving %d summarizer tokens",
+                len(dropped),
+                saved,
+            )
+        else:
+            calls = len(self._section_preambles())
+            logger.info(
+                "Dropped %d near-duplicate hits, saving %d tokens per section "
+                "(%d across %d sections)",
+                len(dropped),
+                saved,
+                saved * calls,
+                calls,
+            )
+        return [items[i] for i in kept], saved
+
+    async def _cached_search(
+        self, query: str, slot: str = "query"
+    ) -> list[dict[str, str]]:
+        """Consult the search cache before calling Tavily.
+
+        With a hedger, latency is tracked per query ``slot`` (the same
+        template across runs) and a slow call gets one duplicate.
+        """
+        cache = self._search_cache
+        if cache is not None:
+            cached = cache.get(query, SEARCH_MAX_RESULTS)
+            if cached is not None:
+                return cached
+
+        def search() -> Awaitable[list[dict[str, str]]]:
+            return self._search_client.search(
+                query, max_results=SEARCH_MAX_RESULTS
+            )
+
+        if self._search_hedger is not None:
+            results = await self._search_hedger.run(slot, search)
+        else:
+            results = await search()
+        if cache is not None:
+            cache.set(query, SEARCH_MAX_RESULTS, results)
+        return results
 
     def _build_section_messages(
         self, state: SectionGenerateState
     ) -> list[dict[str, str]]:
-        """Build system/user message pair for a section call."""
+        """Build the messages for a section call.
+
+        In the shared-prefix layout the system message holds only the
+        analyst role, then comes the large prompt every section shares
+        and last the section instruction as a user message, so the
+        parallel calls send an identical leading prefix the provider
+        can cache while the system role still comes first.
+        """
+        prompt = {"role": "user", "content": state["full_prompt"]}
+        if self._message_layout == PREAMBLE_FIRST_LAYOUT:
+            return [{"role": "system", "content": state["preamble"]}, prompt]
+        instruction = state["preamble"].removeprefix(ANALYST_ROLE).strip()
         return [
-            {"role": "system", "content": state["preamble"]},
-            {"role": "user", "content": state["full_prompt"]},
+            {"role": "system", "content": ANALYST_ROLE},
+            prompt,
+            {"role": "user", "content": instruction},
         ]
 
     async def _generate_section_node(
-        self, state: SectionGenerateState
-    ) -> dict[str, list[dict[str, str]]]:
+        self,
+        state: SectionGenerateState,
+        config: RunnableConfig | None = None,
+    ) -> dict[str, list[dict[str, object]]]:
         """Call LLM with a specialized preamble for one section."""
-        from langchain_openai import ChatOpenAI
-
-        llm = ChatOpenAI(
-            model=self.model, api_key=self._openai_api_key
-        )
+        name = state["section_name"]
         messages = self._build_section_messages(state)
-        response = await llm.ainvoke(messages)
+        start = time.perf_counter()
+        content, usage = await self._invoke_llm(messages, config, name)
+        latency = time.perf_counter() - start
+        _record_timing(config, f"section:{name}", latency)
+        model = self._llm_for(name)[0]
+        logger.info(
+            "Section %s on %s took %.2fs (%d in, %d cached, %d out tokens)",
+            name,
+            model,
+            latency,
+            usage["input_tokens"],
+            usage["cached_tokens"],
+            usage["output_tokens"],
+        )
         return {
             "section_results": [
                 {
-                    "section_name": state["section_name"],
-                    "content": str(response.content),
+                    "section_name": name,
+                    "content": content,
+                    "model": model,
+                    "latency_seconds": latency,
+                    **usage,
                 }
             ]
         }
+
+    async def _summarize_chunk_node(
+        self,
+        state: ChunkSummaryState,
+        config: RunnableConfig | None = None,
+    ) -> dict[str, list[dict[str, object]]]:
+        """Condense one chunk of search hits for the map-reduce strategy."""
+        messages = self._build_section_messages(
+            SectionGenerateState(
+                section_name="chunk",
+                preamble=CHUNK_SUMMARY_PREAMBLE,
+                full_prompt=f"{state['prompt']}{CONTEXT_HEADER}{state['chunk']}",
+            )
+        )
+        start = time.perf_counter()
+        summary, usage = await self._invoke_llm(messages, config)
+        _record_timing(
+            config,
+            f"chunk:{state['chunk_index']}",
+            time.perf_counter() - start,
+        )
+        return {
+            "chunk_summaries": [
+                {
+                    "chunk_index": state["chunk_index"],
+                    "summary": summary,
+                    **usage,
+                }
+            ]
+        }
+
+    async def _invoke_llm(
+        self,
+        messages: list[dict[str, str]],
+        config: RunnableConfig | None,
+        section: str | None = None,
+    ) -> tuple[str, dict[str, int]]:
+        """Call the section's LLM through the response cache.
+
+        Returns the text and its token usage (zeros on a cache hit).
+        """
+        model, llm, params = self._llm_for(section)
+        configurable = (config or {}).get("configurable", {})
+        cache = self._llm_cache if configurable.get("use_cache", True) else None
+        key = make_cache_key(model, messages, params)
+        content = cache.get(key) if cache is not None else None
+        if content is not None:
+            return content, dict.fromkeys(USAGE_KEYS, 0)
+        estimate = sum(estimate_tokens(m["content"]) for m in messages)
+        response = await _within_deadline(
+            config,
+            self._openai_limiter.run(
+                lambda: llm.ainvoke(messages), tokens=estimate
+            ),
+            f"section {section or 'chunk'}",
+        )
+        content = str(response.content)
+        if cache is not None:
+            cache.set(key, content)
+        usage = _usage_from(response)
+        self._openai_limiter.settle(
+            estimate, usage["input_tokens"] + usage["output_tokens"]
+        )
+        return content, usage
@@ -0,0 +1,156 @@
+"""Exact-match, content-addressed cache for LLM responses."""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 512
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS llm_cache (
+    key TEXT PRIMARY KEY,
+    response TEXT NOT NULL,
+    last_access REAL NOT NULL
+)
+"""
+
+
+def make_cache_key(
+    model: str,
+    messages: list[dict[str, str]],
+    params: dict[str, object],
+) -> str:
+    """Hash model, messages and generation params into a stable key."""
+    payload = json.dumps(
+        {"model": model, "messages": messages, "params": params},
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class LLMResponseCache(ABC):
+    """Base class holding hit/miss accounting for response caches."""
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> str | None:
+        """Return the cached response for ``key`` and count the lookup."""
+        value = self._get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def set(self, key: str, response: str) -> None:
+        """Store a response under ``key``."""
+        self._set(key, response)
+
+    def stats(self) -> dict[str, float]:
+        """Return hit/miss counters and the current hit rate."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    @abstractmethod
+    def _get(self, key: str) -> str | None:
+        """Backend lookup; None on a miss."""
+
+    @abstractmethod
+    def _set(self, key: str, response: str) -> None:
+        """Backend write."""
+
+
+class InMemoryLLMCache(LLMResponseCache):
+    """Process-local LRU response cache."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        super().__init__()
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get(self, key: str) -> str | None:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def _set(self, key: str, response: str) -> None:
+        with self._lock:
+            self._entries[key] = response
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+class SqliteLLMCache(LLMResponseCache):
+    """On-disk LRU response cache that survives restarts."""
+
+    def __init__(
+        self, path: str, max_entries: int = DEFAULT_MAX_ENTRIES
+    ) -> None:
+        super().__init__()
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(_SCHEMA)
+        self._conn.commit()
+
+    def _get(self, key: str) -> str | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute(
+                "UPDATE llm_cache SET last_access = ? WHERE key = ?",
+                (time.time(), key),
+            )
+            self._conn.commit()
+            return row[0]
+
+    def _set(self, key: str, response: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, response, last_access) "
+                "VALUES (?, ?, ?)",
+                (key, response, time.time()),
+            )
+            self._conn.execute(
+                "DELETE FROM llm_cache WHERE key NOT IN ("
+                "SELECT key FROM llm_cache ORDER BY last_access DESC LIMIT ?)",
+                (self.max_entries,),
+            )
+            self._conn.commit()
+
+
+def build_llm_cache(
+    backend: str, path: str, max_entries: int = DEFAULT_MAX_ENTRIES
+) -> LLMResponseCache | None:
+    """Build the configured cache: ``memory``, ``sqlite`` or ``none``."""
+    if backend == "memory":
+        return InMemoryLLMCache(max_entries=max_entries)
+    if backend == "sqlite":
+        return SqliteLLMCache(path=path, max_entries=max_entries)
+    if backend != "none":
+        logger.warning("Unknown LLM cache backend %r, caching disabled", backend)
+    return None
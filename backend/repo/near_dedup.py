@@ -0,0 +1,160 @@
+"""Shingle-based MinHash near-duplicate detection for search hits."""
+
+import random
+import re
+from collections.abc import Mapping, Sequence
+from urllib.parse import urlsplit
+
+SHINGLE_WORDS = 3
+NUM_PERM = 64
+LSH_RECALL_TARGET = 0.95
+DEFAULT_THRESHOLD = 0.8
+
+# Wire services and outlets that syndicated copies usually originate from.
+AUTHORITATIVE_DOMAINS = (
+    "reuters.com",
+    "apnews.com",
+    "bloomberg.com",
+    "ft.com",
+    "wsj.com",
+    "nytimes.com",
+    "theverge.com",
+    "techcrunch.com",
+)
+
+_MASK64 = (1 << 64) - 1
+_GOLDEN = 0x9E3779B97F4A7C15
+_WORD_RE = re.compile(r"\w+")
+
+
+def shingles(text: str, size: int = SHINGLE_WORDS) -> set[int]:
+    """Hash the overlapping ``size``-word shingles of ``text``.
+
+    Uses the built-in string hash, so values are stable within a process
+    only; signatures must not be persisted.
+    """
+    words = _WORD_RE.findall(text.lower())
+    if len(words) < size:
+        return {hash(tuple(words)) & _MASK64} if words else set()
+    grams = zip(*(words[i:] for i in range(size)))
+    return {hash(gram) & _MASK64 for gram in grams}
+
+
+def jaccard(a: set[int], b: set[int]) -> float:
+    """Exact Jaccard similarity of two shingle sets."""
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def authority(item: Mapping[str, object]) -> tuple[int, float]:
+    """Rank a search hit: known wire/major outlet first, then its score."""
+    host = (urlsplit(str(item.get("url", ""))).hostname or "").lower()
+    trusted = any(
+        host == domain or host.endswith(f".{domain}")
+        for domain in AUTHORITATIVE_DOMAINS
+    )
+    try:
+        score = float(item.get("score") or 0.0)  # type: ignore[arg-type]
+    except (TypeError, ValueError):
+        score = 0.0
+    return int(trusted), score
+
+
+def lsh_shape(num_perm: int, threshold: float) -> tuple[int, int]:
+    """Pick (bands, rows) so pairs at ``threshold`` collide in some band.
+
+    Prefers the most rows per band (fewest false candidates) that still
+    reaches LSH_RECALL_TARGET at the threshold.
+    """
+    for rows in range(num_perm, 0, -1):
+        if num_perm % rows:
+            continue
+        bands = num_perm // rows
+        if 1 - (1 - threshold**rows) ** bands >= LSH_RECALL_TARGET:
+            return bands, rows
+    return num_perm, 1
+
+
+class MinHasher:
+    """One-permutation MinHash with densification.
+
+    Each shingle hash is mixed once and routed to one of ``num_perm``
+    bins, whose minimum becomes that signature slot; empty bins borrow
+    from the next filled bin. This costs one pass over the shingles
+    instead of one pass per permutation.
+    """
+
+    def __init__(self, num_perm: int = NUM_PERM, seed: int = 1) -> None:
+        self.num_perm = num_perm
+        self._seed = random.Random(seed).getrandbits(64)
+        self._span = _MASK64 // num_perm + 1
+
+    def signature(self, shingle_set: set[int]) -> tuple[int, ...]:
+        """Return the MinHash signature, or () for an empty set."""
+        if not shingle_set:
+            return ()
+        k, seed = self.num_perm, self._seed
+        bins = [-1] * k
+        for value in shingle_set:
+            mixed = ((value ^ seed) * _GOLDEN) & _MASK64
+            mixed ^= mixed >> 29
+            slot, rank = mixed % k, mixed // k
+            if bins[slot] < 0 or rank < bins[slot]:
+                bins[slot] = rank
+        return tuple(self._densify(bins))
+
+    def _densify(self, bins: list[int]) -> list[int]:
+        """Fill empty bins from the next filled bin, tagged by distance."""
+        k = self.num_perm
+        filled = list(bins)
+        for slot in range(k):
+            if bins[slot] >= 0:
+                continue
+            for distance in range(1, k):
+                donor = bins[(slot + distance) % k]
+                if donor >= 0:
+                    filled[slot] = donor + distance * self._span
+                    break
+        return filled
+
+
+def filter_near_duplicates(
+    items: Sequence[Mapping[str, object]],
+    threshold: float = DEFAULT_THRESHOLD,
+    hasher: MinHasher | None = None,
+) -> tuple[list[int], list[int]]:
+    """Split hits into kept and dropped indices by title+content similarity.
+
+    Hits are visited most-authoritative first, so each cluster of
+    near-duplicates keeps its best copy. LSH bands over MinHash
+    signatures propose candidates; the exact shingle Jaccard decides.
+    Kept indices are returned in their original order.
+    """
+    hasher = hasher or MinHasher()
+    bands, rows = lsh_shape(hasher.num_perm, threshold)
+    sets = [
+        shingles(f"{item.get('title', '')} {item.get('content', '')}")
+        for item in items
+    ]
+    order = sorted(
+        range(len(items)),
+        key=lambda i: (*(-v for v in authority(items[i])), i),
+    )
+    buckets: dict[tuple[int, tuple[int, ...]], list[int]] = {}
+    kept: list[int] = []
+    dropped: list[int] = []
+    for index in order:
+        signature = hasher.signature(sets[index])
+        keys = [
+            (band, signature[band * rows : (band + 1) * rows])
+            for band in range(bands if signature else 0)
+        ]
+        candidates = {j for key in keys for j in buckets.get(key, ())}
+        if any(jaccard(sets[index], sets[j]) >= threshold for j in candidates):
+            dropped.append(index)
+            continue
+        kept.append(index)
+        for key in keys:
+            buckets.setdefault(key, []).append(index)
+    return sorted(kept), dropped
@@ -0,0 +1,207 @@
+"""Per-provider token-bucket rate limiting with jittered retry backoff."""
+
+import asyncio
+import logging
+import random
+import time
+from collections.abc import Awaitable, Callable
+from email.utils import parsedate_to_datetime
+from typing import TypeVar
+
+import httpx
+
+from backend.repo.circuit_breaker import CircuitBreaker
+from backend.types.resilience import RetryPolicy
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+RETRYABLE_STATUSES = frozenset({408, 429, 500, 502, 503, 504})
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate for quota accounting (no tokenizer needed)."""
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def status_code_of(exc: BaseException) -> int | None:
+    """Extract an HTTP status from httpx, OpenAI or google-genai errors."""
+    for attr in ("status_code", "code"):
+        value = getattr(exc, attr, None)
+        if isinstance(value, int):
+            return value
+    response = getattr(exc, "response", None)
+    value = getattr(response, "status_code", None)
+    return value if isinstance(value, int) else None
+
+
+def retry_after_of(exc: BaseException) -> float | None:
+    """Read Retry-After (seconds or HTTP date, or retry-after-ms) if sent."""
+    headers = getattr(getattr(exc, "response", None), "headers", None)
+    if not headers:
+        return None
+    millis = headers.get("retry-after-ms")
+    if millis:
+        try:
+            return max(float(millis) / 1000, 0.0)
+        except ValueError:
+            pass
+    value = headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(when.timestamp() - time.time(), 0.0)
+
+
+def is_retryable(exc: BaseException) -> bool:
+    """Throttling, transient server errors and transport failures retry."""
+    if isinstance(exc, httpx.TransportError):
+        return True
+    if type(exc).__name__ in ("APIConnectionError", "APITimeoutError"):
+        return True
+    return status_code_of(exc) in RETRYABLE_STATUSES
+
+
+class TokenBucket:
+    """Reservation-style token bucket refilled continuously per minute.
+
+    ``reserve`` debits immediately and returns how long the caller must
+    wait, so concurrent callers queue in arrival order without a lock.
+    """
+
+    def __init__(
+        self, per_minute: float, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self.capacity = float(per_minute)
+        self._rate = per_minute / 60.0
+        self._clock = clock
+        self._tokens = self.capacity
+        self._updated = clock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        elapsed = now - self._updated
+        self._tokens = min(self.capacity, self._tokens + elapsed * self._rate)
+        self._updated = now
+
+    def reserve(self, amount: float) -> float:
+        """Take ``amount`` (capped at capacity); return seconds to wait."""
+        self._refill()
+        self._tokens -= min(amount, self.capacity)
+        return max(0.0, -self._tokens / self._rate)
+
+    def adjust(self, delta: float) -> None:
+        """Charge (positive) or refund (negative) tokens after the fact."""
+        self._refill()
+        self._tokens = min(self.capacity, self._tokens - delta)
+
+
+class ProviderLimiter:
+    """RPM/TPM limiter and retry scheduler shared by one provider's calls.
+
+    Callers queue on the token buckets instead of failing fast; a 429
+    pauses the whole provider for its Retry-After, and retryable errors
+    back off exponentially with full jitter. With a ``breaker`` each
+    attempt is admitted by, and reported to, the provider's circuit.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        rpm: int | None = None,
+        tpm: int | None = None,
+        policy: RetryPolicy | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+        jitter: Callable[[], float] = random.random,
+        breaker: CircuitBreaker | None = None,
+    ) -> None:
+        self.name = name
+        self.policy = policy or RetryPolicy()
+        self.breaker = breaker
+        self._requests = TokenBucket(rpm, clock) if rpm else None
+        self._tokens = TokenBucket(tpm, clock) if tpm else None
+        self._clock = clock
+        self._sleep = sleep
+        self._jitter = jitter
+        self._paused_until = 0.0
+
+    async def acquire(self, tokens: int = 0) -> None:
+        """Wait for a request slot and ``tokens`` of token quota."""
+        wait = self._paused_until - self._clock()
+        if self._requests is not None:
+            wait = max(wait, self._requests.reserve(1))
+        if self._tokens is not None and tokens:
+            wait = max(wait, self._tokens.reserve(tokens))
+        if wait > 0:
+            logger.info("%s rate limit: queueing for %.2fs", self.name, wait)
+            await self._sleep(wait)
+
+    def settle(self, estimated: int, actual: int) -> None:
+        """Correct the token bucket once the real usage is known."""
+        if self._tokens is not None and actual:
+            self._tokens.adjust(actual - estimated)
+
+    def pause(self, seconds: float) -> None:
+        """Hold every call to this provider for ``seconds``."""
+        self._paused_until = max(self._paused_until, self._clock() + seconds)
+
+    def backoff_seconds(self, attempt: int, retry_after: float | None) -> float:
+        """Retry-After if the provider sent one, else full-jitter backoff."""
+        if retry_after is not None:
+            return retry_after
+        ceiling = min(
+            self.policy.max_delay_seconds,
+            self.policy.base_delay_seconds * 2 ** (attempt - 1),
+        )
+        return self._jitter() * ceiling
+
+    async def run(self, call: Callable[[], Awaitable[T]], tokens: int = 0) -> T:
+        """Run ``call`` under the limits, retrying retryable failures."""
+        attempt = 1
+        while True:
+            if self.breaker is not None:
+                self.breaker.allow()
+            await self.acquire(tokens)
+            try:
+                result = await call()
+            except Exception as exc:
+                retryable = is_retryable(exc)
+                self._report(ok=not retryable)
+                if attempt >= self.policy.max_attempts or not retryable:
+                    raise
+                retry_after = retry_after_of(exc)
+                delay = self.backoff_seconds(attempt, retry_after)
+                if status_code_of(exc) == 429:
+                    self.pause(delay)
+                logger.warning(
+                    "%s call failed (%s); retry %d/%d in %.2fs",
+                    self.name,
+                    exc,
+                    attempt,
+                    self.policy.max_attempts - 1,
+                    delay,
+                )
+                await self._sleep(delay)
+                attempt += 1
+            else:
+                self._report(ok=True)
+                return result
+
+    def _report(self, ok: bool) -> None:
+        """Tell the breaker whether the provider itself answered."""
+        if self.breaker is None:
+            return
+        if ok:
+            self.breaker.record_success()
+        else:
+            self.breaker.record_failure()
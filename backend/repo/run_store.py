@@ -0,0 +1,108 @@
+"""SQLite-backed store for queued research runs."""
+
+import logging
+import os
+import sqlite3
+import threading
+
+from backend.types.enums import ResearchStatus
+from backend.types.runs import ResearchRun
+
+logger = logging.getLogger(__name__)
+
+ACTIVE_STATUSES = (ResearchStatus.PENDING, ResearchStatus.RUNNING)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS research_runs (
+    run_id TEXT PRIMARY KEY,
+    date TEXT NOT NULL,
+    status TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    payload TEXT NOT NULL
+)
+"""
+_INDEX = (
+    "CREATE INDEX IF NOT EXISTS research_runs_status "
+    "ON research_runs (status, created_at)"
+)
+
+
+class RunStore:
+    """Persists runs so queued work survives a process restart.
+
+    Each row keeps the status and date as columns for lookups and the
+    full run as JSON.
+    """
+
+    def __init__(self, path: str = ":memory:") -> None:
+        self._lock = threading.Lock()
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(_SCHEMA)
+        self._conn.execute(_INDEX)
+        self._conn.commit()
+
+    def save(self, run: ResearchRun) -> None:
+        """Insert or update a run."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO research_runs "
+                "(run_id, date, status, created_at, payload) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (
+                    run.run_id,
+                    run.date,
+                    run.status.value,
+                    run.created_at.isoformat(),
+                    run.model_dump_json(),
+                ),
+            )
+            self._conn.commit()
+
+    def get(self, run_id: str) -> ResearchRun | None:
+        """Return a run by ID, or None if unknown."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload FROM research_runs WHERE run_id = ?",
+                (run_id,),
+            ).fetchone()
+        return ResearchRun.model_validate_json(row[0]) if row else None
+
+    def find_active(self, date: str) -> ResearchRun | None:
+        """Return the oldest pending or running run for ``date``, if any."""
+        runs = self._select(
+            "date = ? AND status IN (?, ?)",
+            (date, *(s.value for s in ACTIVE_STATUSES)),
+        )
+        return runs[0] if runs else None
+
+    def list_by_status(self, status: ResearchStatus) -> list[ResearchRun]:
+        """Runs in ``status``, oldest first."""
+        return self._select("status = ?", (status.value,))
+
+    def requeue_interrupted(self) -> int:
+        """Move runs left RUNNING by a dead process back to PENDING."""
+        interrupted = self.list_by_status(ResearchStatus.RUNNING)
+        for run in interrupted:
+            self.save(
+                run.model_copy(
+                    update={"status": ResearchStatus.PENDING, "started_at": None}
+                )
+            )
+        if interrupted:
+            logger.info("Requeued %d interrupted runs", len(interrupted))
+        return len(interrupted)
+
+    def _select(self, where: str, params: tuple[str, ...]) -> list[ResearchRun]:
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT payload FROM research_runs WHERE {where} "
+                "ORDER BY created_at",
+                params,
+            ).fetchall()
+        return [ResearchRun.model_validate_json(row[0]) for row in rows]
+
+    def close(self) -> None:
+        """Close the underlying SQLite connection."""
+        self._conn.close()
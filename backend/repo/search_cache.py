@@ -0,0 +1,141 @@
+"""SQLite-backed TTL cache for web search results."""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Callable
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_SECONDS = 24 * 3600
+DEFAULT_MAX_ENTRIES = 1000
+DEFAULT_BUCKET_SECONDS = 24 * 3600
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS search_cache (
+    key TEXT PRIMARY KEY,
+    query TEXT NOT NULL,
+    results TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    last_access REAL NOT NULL
+)
+"""
+
+
+def normalize_query(query: str) -> str:
+    """Lower-case and collapse whitespace so trivial variants share a key."""
+    return " ".join(query.lower().split())
+
+
+class SearchCache:
+    """Persistent search-result cache with TTL and LRU size bound.
+
+    Entries are keyed on the normalized query, ``max_results`` and a
+    time bucket (the UTC day by default), so re-runs and backfills for
+    the same day reuse results while the next day searches afresh.
+    """
+
+    def __init__(
+        self,
+        path: str = ":memory:",
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        bucket_seconds: float = DEFAULT_BUCKET_SECONDS,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.bucket_seconds = bucket_seconds
+        self.hits = 0
+        self.misses = 0
+        self._clock = clock
+        self._lock = threading.Lock()
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(_SCHEMA)
+        self._conn.commit()
+
+    def make_key(self, query: str, max_results: int) -> str:
+        """Build the cache key for a query in the current time bucket."""
+        bucket = int(self._clock() // self.bucket_seconds)
+        raw = f"{normalize_query(query)}|{max_results}|{bucket}"
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def get(
+        self, query: str, max_results: int
+    ) -> list[dict[str, str]] | None:
+        """Return cached results, or None on a miss or expired entry."""
+        key = self.make_key(query, max_results)
+        now = self._clock()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT results, created_at FROM search_cache WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None or now - row[1] > self.ttl_seconds:
+                self.misses += 1
+                return None
+            self._conn.execute(
+                "UPDATE search_cache SET last_access = ? WHERE key = ?",
+                (now, key),
+            )
+            self._conn.commit()
+            self.hits += 1
+        return json.loads(row[0])
+
+    def set(
+        self,
+        query: str,
+        max_results: int,
+        results: list[dict[str, str]],
+    ) -> None:
+        """Store results, then drop expired and least-recently-used rows."""
+        key = self.make_key(query, max_results)
+        now = self._clock()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO search_cache "
+                "(key, query, results, created_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, normalize_query(query), json.dumps(results), now, now),
+            )
+            self._evict(now)
+            self._conn.commit()
+
+    def _evict(self, now: float) -> None:
+        """Delete expired entries and trim to ``max_entries`` by LRU."""
+        self._conn.execute(
+            "DELETE FROM search_cache WHERE created_at < ?",
+            (now - self.ttl_seconds,),
+        )
+        self._conn.execute(
+            "DELETE FROM search_cache WHERE key NOT IN ("
+            "SELECT key FROM search_cache "
+            "ORDER BY last_access DESC LIMIT ?)",
+            (self.max_entries,),
+        )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM search_cache"
+            ).fetchone()[0]
+
+    def stats(self) -> dict[str, float]:
+        """Return hit/miss counters and the current hit rate."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": len(self),
+        }
+
+    def close(self) -> None:
+        """Close the underlying SQLite connection."""
+        self._conn.close()
@@ -0,0 +1,56 @@
+"""Tavily search client over a shared pooled HTTP client."""
+
+import logging
+
+import httpx
+
+from backend.repo.rate_limiter import ProviderLimiter
+from backend.types.errors import SearchError
+
+logger = logging.getLogger(__name__)
+
+TAVILY_API_URL = "https://api.tavily.com"
+
+
+class TavilySearchClient:
+    """Minimal async client for the Tavily ``/search`` endpoint.
+
+    The API key is sent per request, so nothing is written to the
+    process environment, and connections come from the shared pool.
+    Calls go through the provider limiter, which queues and retries.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        http_client: httpx.AsyncClient,
+        base_url: str = TAVILY_API_URL,
+        limiter: ProviderLimiter | None = None,
+    ) -> None:
+        self._api_key = api_key
+        self._http = http_client
+        self._base_url = base_url.rstrip("/")
+        self._limiter = limiter or ProviderLimiter("tavily")
+
+    async def search(
+        self, query: str, max_results: int = 10
+    ) -> list[dict[str, str]]:
+        """Run a search and return the list of result dicts."""
+        try:
+            response = await self._limiter.run(
+                lambda: self._post(query, max_results)
+            )
+        except httpx.HTTPError as exc:
+            logger.error("Tavily search failed for %r: %s", query, exc)
+            raise SearchError(f"Tavily search failed: {exc}") from exc
+        return response.json().get("results", [])
+
+    async def _post(self, query: str, max_results: int) -> httpx.Response:
+        """POST one search request, raising on an error status."""
+        response = await self._http.post(
+            f"{self._base_url}/search",
+            json={"query": query, "max_results": max_results},
+            headers={"Authorization": f"Bearer {self._api_key}"},
+        )
+        response.raise_for_status()
+        return response
@@ -4,14 +4,41 @@ import logging
 from functools import lru_cache
 
 from backend.config.settings import Settings
+from backend.repo.circuit_breaker import CircuitBreaker
+from backend.repo.context_trimmer import preload_encodings
 from backend.repo.firestore_client import FirestoreRepo
 from backend.repo.gemini_client import GeminiResearchClient
+from backend.repo.hedging import Hedger
 from backend.repo.langchain_client import LangChainResearchClient
+from backend.repo.llm_cache import build_llm_cache
+from backend.repo.rate_limiter import ProviderLimiter
+from backend.repo.run_store import RunStore
+from backend.repo.search_cache import SearchCache
 from backend.service.auth_service import AuthService
+from backend.service.engine_registry import (
+    DEFAULT_MAX_CONCURRENCY,
+    EngineRegistry,
+    gemini_engine,
+    langchain_engine,
+)
+from backend.service.progress_bus import ProgressBus
 from backend.service.research_orchestrator import ResearchOrchestrator
+from backend.service.run_queue import RunQueue
+from backend.service.single_flight import SingleFlight
+from backend.types.enums import EngineType
+from backend.types.errors import TokenizerError
+from backend.types.report import ResearchReport
+from backend.types.resilience import (
+    CircuitPolicy,
+    CircuitStatus,
+    HedgePolicy,
+    RetryPolicy,
+)
 
 logger = logging.getLogger(__name__)
 
+PROVIDERS = ("openai", "gemini", "tavily")
+
 
 @lru_cache
 def get_settings() -> Settings:
@@ -44,29 +71,213 @@ def get_firestore_repo() -> FirestoreRepo:
     return FirestoreRepo(db=db, collection_name=settings.firestore_collection)
 
 
+@lru_cache
+def get_circuit_breaker(provider: str) -> CircuitBreaker:
+    """Build the circuit breaker for a provider (cached, process-wide)."""
+    settings = get_settings()
+    return CircuitBreaker(
+        name=provider,
+        policy=CircuitPolicy(
+            failure_rate_threshold=settings.circuit_failure_rate,
+            window_seconds=settings.circuit_window_seconds,
+            min_calls=settings.circuit_min_calls,
+            open_seconds=settings.circuit_open_seconds,
+        ),
+    )
+
+
+def get_circuit_statuses() -> dict[str, CircuitStatus]:
+    """Snapshot every provider's circuit breaker."""
+    return {name: get_circuit_breaker(name).status() for name in PROVIDERS}
+
+
+@lru_cache
+def get_rate_limiter(provider: str) -> ProviderLimiter:
+    """Build the rate limiter for a provider (cached, shared by all clients)."""
+    settings = get_settings()
+    return ProviderLimiter(
+        name=provider,
+        rpm=getattr(settings, f"{provider}_rpm", None),
+        tpm=getattr(settings, f"{provider}_tpm", None),
+        policy=RetryPolicy(
+            max_attempts=settings.retry_max_attempts,
+            base_delay_seconds=settings.retry_base_delay_seconds,
+            max_delay_seconds=settings.retry_max_delay_seconds,
+        ),
+        breaker=get_circuit_breaker(provider),
+    )
+
+
+@lru_cache
 def get_gemini_client() -> GeminiResearchClient:
-    """Build the Gemini research client."""
+    """Build the Gemini research client (cached, shared across runs)."""
     settings = get_settings()
     return GeminiResearchClient(
         api_key=settings.gemini_api_key,
         model=settings.gemini_model,
+        timeout_seconds=settings.gemini_timeout_seconds,
+        limiter=get_rate_limiter("gemini"),
+    )
+
+
+@lru_cache
+def get_search_cache() -> SearchCache:
+    """Build the persistent search-result cache (cached)."""
+    settings = get_settings()
+    return SearchCache(
+        path=settings.search_cache_path,
+        ttl_seconds=settings.search_cache_ttl_seconds,
+        max_entries=settings.search_cache_max_entries,
     )
 
 
+def build_search_hedger() -> Hedger | None:
+    """Build the Tavily request hedger when hedging is enabled."""
+    settings = get_settings()
+    if not settings.tavily_hedging:
+        return None
+    return Hedger(
+        HedgePolicy(
+            quantile=settings.tavily_hedge_quantile,
+            budget_ratio=settings.tavily_hedge_budget,
+        )
+    )
+
+
+@lru_cache
 def get_langchain_client() -> LangChainResearchClient:
-    """Build the LangChain research client."""
+    """Build the LangChain research client (cached, shared across runs)."""
     settings = get_settings()
     return LangChainResearchClient(
         openai_api_key=settings.openai_api_key,
         tavily_api_key=settings.tavily_api_key,
         model=settings.openai_model,
+        checkpoint_path=settings.checkpoint_path,
+        search_cache=get_search_cache(),
+        llm_cache=build_llm_cache(
+            backend=settings.llm_cache_backend,
+            path=settings.llm_cache_path,
+            max_entries=settings.llm_cache_max_entries,
+        ),
+        near_duplicate_threshold=settings.near_duplicate_threshold,
+        message_layout=settings.section_message_layout,
+        strategy=settings.generation_strategy,
+        section_routes=settings.section_routes,
+        openai_limiter=get_rate_limiter("openai"),
+        tavily_limiter=get_rate_limiter("tavily"),
+        search_hedger=build_search_hedger(),
+    )
+
+
+@lru_cache
+def get_run_flights() -> SingleFlight[ResearchReport]:
+    """Process-wide registry of in-flight research runs (cached)."""
+    return SingleFlight()
+
+
+@lru_cache
+def get_progress_bus() -> ProgressBus:
+    """Process-wide broadcast bus for run progress events (cached)."""
+    return ProgressBus()
+
+
+@lru_cache
+def get_engine_registry() -> EngineRegistry:
+    """Register every research engine (cached, process-wide).
+
+    Clients are built lazily, so engines left out of
+    ``research_engines`` never need their API keys.
+    """
+    settings = get_settings()
+    limits = settings.engine_max_concurrency
+    return EngineRegistry(
+        [
+            gemini_engine(
+                get_gemini_client,
+                stream=settings.gemini_streaming,
+                max_concurrency=limits.get(
+                    EngineType.GEMINI, DEFAULT_MAX_CONCURRENCY
+                ),
+            ),
+            langchain_engine(
+                get_langchain_client,
+                max_concurrency=limits.get(
+                    EngineType.LANGCHAIN, DEFAULT_MAX_CONCURRENCY
+                ),
+            ),
+        ]
     )
 
 
+async def close_clients() -> None:
+    """Close the cached research clients that were actually built.
+
+    The shared search cache's SQLite connection is closed with them.
+    Their caches (and the registry holding them) are cleared so the
+    next use builds fresh clients. A failed close is logged, not raised.
+    """
+    for get_client in (get_langchain_client, get_gemini_client):
+        if not get_client.cache_info().currsize:
+            continue
+        try:
+            await get_client().aclose()
+        except Exception as exc:
+            logger.warning("Closing %s failed: %s", get_client.__name__, exc)
+    if get_search_cache.cache_info().currsize:
+        try:
+            get_search_cache().close()
+        except Exception as exc:
+            logger.warning("Closing get_search_cache failed: %s", exc)
+    get_engine_registry.cache_clear()
+    get_langchain_client.cache_clear()
+    get_gemini_client.cache_clear()
+    get_search_cache.cache_clear()
+
+
 def get_orchestrator() -> ResearchOrchestrator:
-    """Build the research orchestrator with all clients."""
+    """Build the research orchestrator over the engine registry."""
+    settings = get_settings()
     return ResearchOrchestrator(
-        gemini_client=get_gemini_client(),
-        langchain_client=get_langchain_client(),
+        registry=get_engine_registry(),
         firestore_repo=get_firestore_repo(),
+        flights=get_run_flights(),
+        progress_bus=get_progress_bus(),
+        deadline_seconds=settings.run_deadline_seconds,
+        engines=settings.research_engines,
+        max_parallel_engines=settings.max_parallel_engines,
+    )
+
+
+@lru_cache
+def get_run_queue() -> RunQueue:
+    """Build the persistent research run queue (cached, process-wide)."""
+    settings = get_settings()
+
+    async def run_daily(date: str, use_cache: bool) -> ResearchReport:
+        return await get_orchestrator().run_daily_research(
+            date, use_cache=use_cache
+        )
+
+    return RunQueue(
+        store=RunStore(settings.run_queue_path),
+        run_fn=run_daily,
+        max_concurrency=settings.run_queue_max_concurrency,
+        progress_bus=get_progress_bus(),
     )
+
+
+def preload_tokenizer() -> bool:
+    """Load the bundled tokenizer encodings before serving any work.
+
+    A missing or corrupt bundle is logged rather than raised so the
+    Gemini engine can still run; the LangChain engine needs it.
+    """
+    cache_dir = get_settings().tiktoken_cache_dir
+    source = cache_dir or "the default cache"
+    try:
+        elapsed = preload_encodings(cache_dir=cache_dir)
+    except TokenizerError as exc:
+        logger.error("Tokenizer preload from %s failed: %s", source, exc)
+        return False
+    logger.info("Tokenizer preloaded from %s in %.3fs", source, elapsed)
+    return True
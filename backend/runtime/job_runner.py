@@ -1,22 +1,56 @@
-"""Cloud Run Job entry point for scheduled research."""
+"""Cloud Run Job entry point for scheduled research.
 
+Usage:
+    python -m backend.runtime.job_runner [--date YYYY-MM-DD]
+    python -m backend.runtime.job_runner resume <run_id>
+
+The process exits non-zero when any engine failed or timed out, so
+Cloud Run Jobs retries the task.
+"""
+
+import argparse
 import asyncio
 import logging
+import sys
 from datetime import datetime, timezone
 
-from backend.runtime.dependencies import get_orchestrator
+from backend.runtime.dependencies import get_orchestrator, preload_tokenizer
 from backend.service.research_orchestrator import ResearchOrchestrator
+from backend.types.enums import ResearchStatus
+from backend.types.report import ResearchReport
 
 logger = logging.getLogger(__name__)
 
+UNFINISHED_STATUSES = (ResearchStatus.FAILED, ResearchStatus.TIMED_OUT)
+
 
 def _build_orchestrator() -> ResearchOrchestrator:
     """Build orchestrator with default settings."""
     return get_orchestrator()
 
 
-async def run_daily_job(date: str | None = None) -> None:
-    """Execute the daily research job."""
+def _exit_code(report: ResearchReport) -> int:
+    """1 if any engine of ``report`` failed or timed out, else 0."""
+    unfinished = [
+        engine.value
+        for engine, result in report.results.items()
+        if result.status in UNFINISHED_STATUSES
+    ]
+    if not unfinished:
+        return 0
+    logger.error(
+        "%s did not finish for %s", ", ".join(unfinished), report.report_id
+    )
+    return 1
+
+
+async def run_daily_job(date: str | None = None) -> int:
+    """Execute the daily research job and return its exit code.
+
+    The LangChain run is keyed on the report, so a retried job resumes
+    from its last checkpoint instead of searching again, provided
+    ``CHECKPOINT_PATH`` is on storage that outlives the task.
+    """
     if date is None:
         date = datetime.now(timezone.utc).strftime("%Y-%m-%d")
 
@@ -24,13 +58,37 @@ async def run_daily_job(date: str | None = None) -> None:
     orchestrator = _build_orchestrator()
     report = await orchestrator.run_daily_research(date)
     logger.info("Daily job complete: %s", report.report_id)
+    return _exit_code(report)
+
+
+async def resume_job(run_id: str) -> int:
+    """Resume an interrupted LangChain run and return the exit code."""
+    logger.info("Resuming run %s", run_id)
+    orchestrator = _build_orchestrator()
+    report = await orchestrator.resume_langchain_run(run_id)
+    logger.info("Resumed run complete: %s", report.report_id)
+    return _exit_code(report)
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    """Parse the job's command line."""
+    parser = argparse.ArgumentParser(description="Daily research job")
+    parser.add_argument("--date", default=None, help="Report date (UTC)")
+    commands = parser.add_subparsers(dest="command")
+    resume = commands.add_parser("resume", help="Resume an interrupted run")
+    resume.add_argument("run_id", help="Run ID, e.g. rpt-2026-02-28:langchain")
+    return parser.parse_args(argv)
 
 
-def main() -> None:
-    """CLI entry point for the job runner."""
+def main(argv: list[str] | None = None) -> int:
+    """CLI entry point for the job runner; returns the exit code."""
     logging.basicConfig(level=logging.INFO)
-    asyncio.run(run_daily_job())
+    args = _parse_args(argv)
+    preload_tokenizer()
+    if args.command == "resume":
+        return asyncio.run(resume_job(args.run_id))
+    return asyncio.run(run_daily_job(args.date))
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
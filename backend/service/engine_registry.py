@@ -0,0 +1,170 @@
+"""Registry of research engines the orchestrator can run side by side."""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable, Iterable
+from typing import Any
+
+from backend.repo.deadline import Deadline
+from backend.service.engine_runner import (
+    SectionCallback,
+    run_gemini_engine,
+    run_langchain_engine,
+    stream_gemini_engine,
+)
+from backend.types.enums import EngineType
+from backend.types.progress import ProgressCallback
+from backend.types.report import EngineResult
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONCURRENCY = 2
+
+
+def engine_run_id(report_id: str, engine: EngineType) -> str:
+    """Stable ID of one engine's run for a report."""
+    return f"{report_id}:{engine.value}"
+
+
+class EngineHooks:
+    """Per-run context handed to an engine: deadline, options, callbacks.
+
+    Engines use the hooks they support; a non-streaming engine simply
+    never calls ``on_partial`` and an engine without a response cache
+    ignores ``use_cache``.
+    """
+
+    def __init__(
+        self,
+        report_id: str,
+        deadline: Deadline | None = None,
+        use_cache: bool = True,
+        on_progress: ProgressCallback | None = None,
+        on_partial: SectionCallback | None = None,
+        on_complete: SectionCallback | None = None,
+    ) -> None:
+        self.report_id = report_id
+        self.deadline = deadline
+        self.use_cache = use_cache
+        self.on_progress = on_progress
+        self.on_partial = on_partial
+        self.on_complete = on_complete
+
+
+EngineRunFn = Callable[[Any, str, EngineHooks], Awaitable[EngineResult]]
+
+
+class EngineSpec:
+    """One engine: how to build its client and how to run it.
+
+    The client is built on first use, so an engine that is registered
+    but never selected never needs its credentials. At most
+    ``max_concurrency`` runs of the engine execute at once across all
+    reports; further runs wait for a slot.
+    """
+
+    def __init__(
+        self,
+        engine: EngineType,
+        client_factory: Callable[[], object],
+        run: EngineRunFn,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> None:
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be >= 1: {max_concurrency}")
+        self.engine = engine
+        self.max_concurrency = max_concurrency
+        self._client_factory = client_factory
+        self._run = run
+        self._client: object | None = None
+        self._slots = asyncio.Semaphore(max_concurrency)
+
+    @property
+    def client(self) -> Any:
+        """The engine's client, built on first access."""
+        if self._client is None:
+            self._client = self._client_factory()
+        return self._client
+
+    async def execute(self, prompt: str, hooks: EngineHooks) -> EngineResult:
+        """Run the engine once a concurrency slot is free."""
+        async with self._slots:
+            return await self._run(self.client, prompt, hooks)
+
+
+class EngineRegistry:
+    """Engines available to the orchestrator, in registration order."""
+
+    def __init__(self, specs: Iterable[EngineSpec] = ()) -> None:
+        self._specs: dict[EngineType, EngineSpec] = {}
+        for spec in specs:
+            self.register(spec)
+
+    def register(self, spec: EngineSpec) -> None:
+        """Add an engine; each engine may be registered once."""
+        if spec.engine in self._specs:
+            raise ValueError(f"Engine already registered: {spec.engine.value}")
+        self._specs[spec.engine] = spec
+
+    @property
+    def engines(self) -> tuple[EngineType, ...]:
+        """Registered engines, in registration order."""
+        return tuple(self._specs)
+
+    def get(self, engine: EngineType) -> EngineSpec:
+        """The spec of a registered engine."""
+        spec = self._specs.get(engine)
+        if spec is None:
+            raise ValueError(f"Engine not registered: {engine.value}")
+        return spec
+
+    def select(
+        self, engines: Iterable[EngineType] | None = None
+    ) -> list[EngineSpec]:
+        """Specs for ``engines`` (all registered engines when None)."""
+        if engines is None:
+            return list(self._specs.values())
+        return [self.get(engine) for engine in dict.fromkeys(engines)]
+
+
+def gemini_engine(
+    client_factory: Callable[[], object],
+    stream: bool = False,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> EngineSpec:
+    """Gemini Deep Research; streamed runs report each closed section."""
+
+    async def run(client: Any, prompt: str, hooks: EngineHooks) -> EngineResult:
+        if stream:
+            return await stream_gemini_engine(
+                client,
+                prompt,
+                on_section=hooks.on_partial,
+                on_complete=hooks.on_complete,
+                deadline=hooks.deadline,
+            )
+        return await run_gemini_engine(
+            client, prompt, on_complete=hooks.on_complete, deadline=hooks.deadline
+        )
+
+    return EngineSpec(EngineType.GEMINI, client_factory, run, max_concurrency)
+
+
+def langchain_engine(
+    client_factory: Callable[[], object],
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> EngineSpec:
+    """LangGraph pipeline, checkpointed under a report-stable run ID."""
+
+    async def run(client: Any, prompt: str, hooks: EngineHooks) -> EngineResult:
+        return await run_langchain_engine(
+            client,
+            prompt,
+            run_id=engine_run_id(hooks.report_id, EngineType.LANGCHAIN),
+            use_cache=hooks.use_cache,
+            on_progress=hooks.on_progress,
+            on_complete=hooks.on_complete,
+            deadline=hooks.deadline,
+        )
+
+    return EngineSpec(EngineType.LANGCHAIN, client_factory, run, max_concurrency)
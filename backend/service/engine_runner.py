@@ -2,37 +2,117 @@
 
 import logging
 import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
 from datetime import datetime, timezone
 
+from backend.repo.circuit_breaker import CircuitBreaker
+from backend.repo.deadline import Deadline
 from backend.repo.gemini_client import GeminiResearchClient
 from backend.repo.langchain_client import LangChainResearchClient
 from backend.service.report_parser import ReportParser
-from backend.types.enums import EngineType, ResearchStatus
-from backend.types.report import EngineResult
+from backend.service.streaming_report_parser import StreamingReportParser
+from backend.types.enums import CircuitState, EngineType, ResearchStatus
+from backend.types.errors import DeadlineExceededError
+from backend.types.progress import ProgressCallback
+from backend.types.report import EngineResult, ParsedReport
 
 logger = logging.getLogger(__name__)
 _parser = ReportParser()
 
+SECTION_HEADING = "\n## "
+
+SectionCallback = Callable[[EngineResult], Awaitable[None]]
+
 
 async def run_gemini_engine(
-    client: GeminiResearchClient, prompt: str
+    client: GeminiResearchClient,
+    prompt: str,
+    on_complete: SectionCallback | None = None,
+    deadline: Deadline | None = None,
 ) -> EngineResult:
     """Run the Gemini research engine and return structured result."""
     return await _run_engine(
         engine_type=EngineType.GEMINI,
         run_fn=client.run_research,
         prompt=prompt,
+        breakers=client.breakers,
+        on_complete=on_complete,
+        deadline=deadline,
+    )
+
+
+async def stream_gemini_engine(
+    client: GeminiResearchClient,
+    prompt: str,
+    on_section: SectionCallback | None = None,
+    on_complete: SectionCallback | None = None,
+    deadline: Deadline | None = None,
+) -> EngineResult:
+    """Run Gemini in streaming mode, reporting each closed section."""
+    return await _run_engine(
+        engine_type=EngineType.GEMINI,
+        run_fn=client.run_research,
+        prompt=prompt,
+        stream_fn=client.stream_research,
+        on_section=on_section,
+        breakers=client.breakers,
+        on_complete=on_complete,
+        deadline=deadline,
     )
 
 
 async def run_langchain_engine(
-    client: LangChainResearchClient, prompt: str
+    client: LangChainResearchClient,
+    prompt: str,
+    run_id: str | None = None,
+    on_progress: ProgressCallback | None = None,
+    on_complete: SectionCallback | None = None,
+    deadline: Deadline | None = None,
+    use_cache: bool = True,
 ) -> EngineResult:
-    """Run the LangChain research engine and return structured result."""
+    """Run the LangChain research engine and return structured result.
+
+    A stable ``run_id`` lets a retried run resume from its checkpoint;
+    ``use_cache=False`` bypasses the LLM response cache.
+    The graph's nodes record their own timings and bound their calls
+    by ``deadline``.
+    """
+    timings: dict[str, float] = {}
+
+    async def run_fn(engine_prompt: str) -> str:
+        return await client.run_research(
+            engine_prompt,
+            use_cache=use_cache,
+            run_id=run_id,
+            on_progress=on_progress,
+            deadline=deadline,
+            timings=timings,
+        )
+
     return await _run_engine(
         engine_type=EngineType.LANGCHAIN,
-        run_fn=client.run_research,
+        run_fn=run_fn,
         prompt=prompt,
+        breakers=client.breakers,
+        on_complete=on_complete,
+        deadline=deadline,
+        timings=timings,
+    )
+
+
+async def resume_langchain_engine(
+    client: LangChainResearchClient, run_id: str
+) -> EngineResult:
+    """Resume an interrupted LangChain run from its last checkpoint."""
+
+    async def run_fn(_prompt: str) -> str:
+        return await client.resume_research(run_id)
+
+    return await _run_engine(
+        engine_type=EngineType.LANGCHAIN,
+        run_fn=run_fn,
+        prompt="",
+        breakers=client.breakers,
     )
 
 
@@ -40,51 +120,216 @@ async def _run_engine(
     engine_type: EngineType,
     run_fn: object,
     prompt: str,
+    stream_fn: Callable[[str], AsyncIterator[str]] | None = None,
+    on_section: SectionCallback | None = None,
+    breakers: Iterable[CircuitBreaker] = (),
+    on_complete: SectionCallback | None = None,
+    deadline: Deadline | None = None,
+    timings: dict[str, float] | None = None,
 ) -> EngineResult:
-    """Generic engine runner with timing and error handling."""
+    """Run an engine, then hand its final result to ``on_complete``.
+
+    ``on_complete`` sees every outcome, including fast failures, and an
+    error raised by it is logged rather than failing the engine.
+    """
+    result = await _execute_engine(
+        engine_type,
+        run_fn,
+        prompt,
+        stream_fn,
+        on_section,
+        breakers,
+        deadline,
+        {} if timings is None else timings,
+    )
+    if on_complete is not None:
+        try:
+            await on_complete(result)
+        except Exception as exc:
+            logger.warning(
+                "%s completion hook failed: %s", engine_type.value, exc
+            )
+    return result
+
+
+async def _execute_engine(
+    engine_type: EngineType,
+    run_fn: object,
+    prompt: str,
+    stream_fn: Callable[[str], AsyncIterator[str]] | None,
+    on_section: SectionCallback | None,
+    breakers: Iterable[CircuitBreaker],
+    deadline: Deadline | None,
+    timings: dict[str, float],
+) -> EngineResult:
+    """Generic engine runner with timing and error handling.
+
+    When ``stream_fn`` is given the engine output is consumed chunk by
+    chunk; a failure part-way keeps every section received so far. If
+    any provider the engine needs has an open circuit, the engine is
+    not started and a FAILED result is returned straight away. When
+    ``deadline`` expires the engine is cancelled and a TIMED_OUT result
+    keeps the closed sections and stage timings reached so far.
+    """
     started_at = datetime.now(timezone.utc)
     start_time = time.monotonic()
+    chunks: list[str] = []
 
-    try:
-        raw_markdown = await run_fn(prompt)
-        completed_at = datetime.now(timezone.utc)
-        duration = time.monotonic() - start_time
+    open_circuits = [b.name for b in breakers if b.state is CircuitState.OPEN]
+    if open_circuits:
+        message = f"Circuit open for {', '.join(open_circuits)}"
+        logger.warning("%s engine skipped: %s", engine_type.value, message)
+        return _build_result(
+            engine_type,
+            ResearchStatus.FAILED,
+            "",
+            started_at,
+            start_time,
+            error_message=message,
+        )
 
-        tldr = _parser.parse_tldr(raw_markdown)
-        viral_events = _parser.parse_viral_events(raw_markdown)
-        deep_dives = _parser.parse_deep_dives(raw_markdown)
-        audit = _parser.parse_completeness_audit(raw_markdown)
+    async def produce() -> tuple[str, ParsedReport | None]:
+        if stream_fn is None:
+            return await run_fn(prompt), None
+        return await _consume_stream(
+            engine_type,
+            stream_fn(prompt),
+            chunks,
+            started_at,
+            start_time,
+            on_section,
+            timings,
+        )
 
+    try:
+        if deadline is None:
+            raw_markdown, parsed = await produce()
+        else:
+            raw_markdown, parsed = await deadline.run(
+                produce(), f"the {engine_type.value} engine"
+            )
+        if stream_fn is None and not timings:
+            timings["generate"] = round(time.monotonic() - start_time, 3)
+        result = _build_result(
+            engine_type,
+            ResearchStatus.COMPLETED,
+            raw_markdown,
+            started_at,
+            start_time,
+            parsed=parsed,
+            timings=timings,
+        )
         logger.info(
-            "%s engine completed in %.1fs", engine_type.value, duration
+            "%s engine completed in %.1fs",
+            engine_type.value,
+            result.duration_seconds,
         )
-        return EngineResult(
-            engine=engine_type,
-            status=ResearchStatus.COMPLETED,
-            raw_markdown=raw_markdown,
-            tldr=tldr,
-            viral_events=viral_events,
-            deep_dives=deep_dives,
-            completeness_audit=audit,
-            started_at=started_at,
-            completed_at=completed_at,
-            duration_seconds=duration,
-            error_message=None,
+        return result
+    except DeadlineExceededError as exc:
+        logger.error("%s engine timed out: %s", engine_type.value, exc)
+        return _build_result(
+            engine_type,
+            ResearchStatus.TIMED_OUT,
+            _closed_sections("".join(chunks)),
+            started_at,
+            start_time,
+            error_message=str(exc),
+            timings=timings,
         )
     except Exception as exc:
-        completed_at = datetime.now(timezone.utc)
-        duration = time.monotonic() - start_time
         logger.error("%s engine failed: %s", engine_type.value, exc)
-        return EngineResult(
-            engine=engine_type,
-            status=ResearchStatus.FAILED,
-            raw_markdown="",
-            tldr=None,
-            viral_events=[],
-            deep_dives=[],
-            completeness_audit=None,
-            started_at=started_at,
-            completed_at=completed_at,
-            duration_seconds=duration,
+        return _build_result(
+            engine_type,
+            ResearchStatus.FAILED,
+            _closed_sections("".join(chunks)),
+            started_at,
+            start_time,
             error_message=str(exc),
+            timings=timings,
         )
+
+
+async def _consume_stream(
+    engine_type: EngineType,
+    stream: AsyncIterator[str],
+    chunks: list[str],
+    started_at: datetime,
+    start_time: float,
+    on_section: SectionCallback | None,
+    timings: dict[str, float],
+) -> tuple[str, ParsedReport]:
+    """Drain a chunk stream, emitting a partial result per closed section.
+
+    Chunks are parsed incrementally, so each one is scanned only once.
+    A partial's markdown stops at the last closed section, and each
+    section's time to close is recorded in ``timings``.
+    """
+    parser = StreamingReportParser()
+    section_start = time.monotonic()
+    async for chunk in stream:
+        chunks.append(chunk)
+        closed_before = parser.sections_closed
+        parser.feed(chunk)
+        if parser.sections_closed == closed_before:
+            continue
+        now = time.monotonic()
+        timings[f"section:{parser.sections_closed}"] = round(
+            now - section_start, 3
+        )
+        section_start = now
+        logger.info(
+            "%s engine closed section %d",
+            engine_type.value,
+            parser.sections_closed,
+        )
+        if on_section is not None:
+            await on_section(
+                _build_result(
+                    engine_type,
+                    ResearchStatus.RUNNING,
+                    _closed_sections("".join(chunks)),
+                    started_at,
+                    start_time,
+                    parsed=parser.result(),
+                    timings=timings,
+                )
+            )
+    parser.close()
+    return "".join(chunks), parser.result()
+
+
+def _closed_sections(markdown: str) -> str:
+    """Drop the trailing, possibly truncated, section of a partial stream."""
+    closed = markdown.rfind(SECTION_HEADING)
+    return markdown[:closed] if closed > 0 else ""
+
+
+def _build_result(
+    engine_type: EngineType,
+    status: ResearchStatus,
+    raw_markdown: str,
+    started_at: datetime,
+    start_time: float,
+    error_message: str | None = None,
+    parsed: ParsedReport | None = None,
+    timings: dict[str, float] | None = None,
+) -> EngineResult:
+    """Parse markdown into an EngineResult stamped with timings."""
+    failed = status in (ResearchStatus.FAILED, ResearchStatus.TIMED_OUT)
+    failed_empty = failed and not raw_markdown
+    if parsed is None:
+        parsed = _parser.parse(raw_markdown)
+    return EngineResult(
+        engine=engine_type,
+        status=status,
+        raw_markdown=raw_markdown,
+        tldr=None if failed_empty else parsed.tldr,
+        viral_events=parsed.viral_events,
+        deep_dives=parsed.deep_dives,
+        completeness_audit=parsed.completeness_audit,
+        started_at=started_at,
+        completed_at=datetime.now(timezone.utc),
+        duration_seconds=time.monotonic() - start_time,
+        error_message=error_message,
+        timings=dict(timings or {}),
+    )
@@ -0,0 +1,122 @@
+"""In-process broadcast bus for research run progress events."""
+
+import asyncio
+import logging
+from collections import deque
+from collections.abc import AsyncIterator
+
+from backend.types.enums import ProgressKind
+from backend.types.progress import ProgressEvent
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BUFFER_SIZE = 64
+DEFAULT_HISTORY_SIZE = 64
+
+
+class Subscription:
+    """One subscriber's bounded view of a report's event stream.
+
+    When the buffer is full the oldest event is dropped, so a slow
+    reader loses detail but never blocks the publisher and always sees
+    the latest (terminal) event.
+    """
+
+    def __init__(self, bus: "ProgressBus", report_id: str, size: int) -> None:
+        self.report_id = report_id
+        self.dropped = 0
+        self._bus = bus
+        self._buffer: asyncio.Queue[ProgressEvent] = asyncio.Queue(maxsize=size)
+
+    def offer(self, event: ProgressEvent) -> None:
+        """Enqueue without waiting, evicting the oldest event if full."""
+        if self._buffer.full():
+            self._buffer.get_nowait()
+            self.dropped += 1
+        self._buffer.put_nowait(event)
+
+    async def get(self) -> ProgressEvent:
+        """Wait for the next event."""
+        return await self._buffer.get()
+
+    async def __aiter__(self) -> AsyncIterator[ProgressEvent]:
+        """Yield events until the run's terminal event."""
+        while True:
+            event = await self.get()
+            yield event
+            if event.terminal:
+                return
+
+    def close(self) -> None:
+        """Stop receiving events."""
+        self._bus.unsubscribe(self)
+
+
+class ProgressBus:
+    """Fans progress events out to every subscriber of a report.
+
+    ``publish`` never awaits, so a run is never slowed by its readers.
+    Recent events are kept per report and replayed to late subscribers.
+    That history only ever describes the latest run: ``reset`` clears it
+    when a new run is queued, and a RUN_STARTED event clears it again.
+    """
+
+    def __init__(
+        self,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        history_size: int = DEFAULT_HISTORY_SIZE,
+    ) -> None:
+        self._buffer_size = buffer_size
+        self._history_size = history_size
+        self._subscribers: dict[str, set[Subscription]] = {}
+        self._history: dict[str, deque[ProgressEvent]] = {}
+
+    def publish(self, event: ProgressEvent) -> None:
+        """Deliver ``event`` to current subscribers and record it."""
+        history = self._history.get(event.report_id)
+        if history is None or event.kind is ProgressKind.RUN_STARTED:
+            history = deque(maxlen=self._history_size)
+            self._history[event.report_id] = history
+        history.append(event)
+        for subscription in self._subscribers.get(event.report_id, ()):
+            subscription.offer(event)
+
+    def reset(self, report_id: str) -> None:
+        """Forget a report's history before a new run of it is queued.
+
+        Without this, a subscriber to the queued run would be replayed
+        the previous run's events, terminal one included.
+        """
+        self._history.pop(report_id, None)
+
+    def finished(self, report_id: str) -> bool:
+        """Whether the report's latest recorded event is terminal."""
+        history = self._history.get(report_id)
+        return bool(history) and history[-1].terminal
+
+    def subscribe(self, report_id: str) -> Subscription:
+        """Subscribe to a report, starting with its recorded history."""
+        subscription = Subscription(self, report_id, self._buffer_size)
+        for event in self._history.get(report_id, ()):
+            subscription.offer(event)
+        self._subscribers.setdefault(report_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Remove a subscriber; unknown subscriptions are ignored."""
+        subscribers = self._subscribers.get(subscription.report_id)
+        if subscribers is None:
+            return
+        subscribers.discard(subscription)
+        if not subscribers:
+            del self._subscribers[subscription.report_id]
+        if subscription.dropped:
+            logger.info(
+                "Subscriber to %s dropped %d events",
+                subscription.report_id,
+                subscription.dropped,
+            )
+
+    def subscriber_count(self, report_id: str) -> int:
+        """Number of live subscribers to a report."""
+        return len(self._subscribers.get(report_id, ()))
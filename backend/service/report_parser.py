@@ -5,6 +5,7 @@ import re
 
 from backend.types.enums import ConfidenceLevel, EventCategory
 from backend.types.events import CompletenessAudit, DeepDive, ViralEvent
+from backend.types.report import ParsedReport
 
 logger = logging.getLogger(__name__)
 
@@ -23,53 +24,164 @@ CONFIDENCE_MAP: dict[str, ConfidenceLevel] = {
     "low": ConfidenceLevel.LOW,
 }
 
+TLDR_SECTION = "TL;DR"
+EVENTS_SECTION = "Global Viral Events"
+DIVES_SECTION = "Strategic Deep Dives"
+AUDIT_SECTION = "Completeness Audit"
+
+_SECTION_RE = re.compile(r"##(?!#)[ \t]*([^\n]*?)[ \t]*(?=\n|\Z)")
+_LINE_SECTION_RE = re.compile("\n" + _SECTION_RE.pattern)
+_BLOCK_SPLIT_RE = re.compile(r"\n###\s+")
+_HEADING_RE = re.compile(r"^#+\s*")
+_FIELD_RE = re.compile(r"-\s*\*\*(.+?)\*\*:\s*(.+)")
+
+SectionIndex = dict[str, tuple[int, int]]
+
+
+def index_sections(markdown: str) -> SectionIndex:
+    """Map each level-2 heading to the span of its body in one pass.
+
+    A section runs until the next ``##`` heading (``###`` subheadings
+    stay inside it). The first occurrence of a heading wins.
+    """
+    index: SectionIndex = {}
+    title: str | None = None
+    body_start = 0
+    first = _SECTION_RE.match(markdown)
+    if first:
+        title, body_start = first.group(1), first.end()
+    # A leading literal newline lets the regex engine skip ahead with a
+    # fast substring search instead of testing every line start.
+    for match in _LINE_SECTION_RE.finditer(markdown):
+        if title is not None and title not in index:
+            index[title] = (body_start, match.start())
+        title = match.group(1)
+        body_start = match.end()
+    if title is not None and title not in index:
+        index[title] = (body_start, len(markdown))
+    return index
+
+
+def _section(markdown: str, index: SectionIndex, title: str) -> str | None:
+    """Slice a section body out of the markdown via the index."""
+    span = index.get(title)
+    return markdown[span[0] : span[1]] if span else None
+
+
+def _parse_fields(lines: list[str]) -> dict[str, str]:
+    """Collect ``- **Name**: value`` fields keyed by lower-cased name."""
+    fields: dict[str, str] = {}
+    for line in lines:
+        match = _FIELD_RE.match(line.strip())
+        if match:
+            fields[match.group(1).lower()] = match.group(2).strip()
+    return fields
+
 
 class ReportParser:
     """Parses markdown research reports into structured data."""
 
+    def parse(self, markdown: str) -> ParsedReport:
+        """Parse every section from a single scan of the document."""
+        index = index_sections(markdown)
+        return ParsedReport(
+            tldr=self.tldr_from(_section(markdown, index, TLDR_SECTION)),
+            viral_events=self.events_from(
+                _section(markdown, index, EVENTS_SECTION)
+            ),
+            deep_dives=self.dives_from(
+                _section(markdown, index, DIVES_SECTION)
+            ),
+            completeness_audit=self.audit_from(
+                _section(markdown, index, AUDIT_SECTION)
+            ),
+        )
+
     def parse_tldr(self, markdown: str) -> str:
         """Extract the TL;DR section."""
-        match = re.search(
-            r"##\s*TL;DR\s*\n(.*?)(?=\n##|\Z)", markdown, re.DOTALL
-        )
-        return match.group(1).strip() if match else ""
+        index = index_sections(markdown)
+        return self.tldr_from(_section(markdown, index, TLDR_SECTION))
 
     def parse_viral_events(self, markdown: str) -> list[ViralEvent]:
         """Extract viral events from markdown."""
+        index = index_sections(markdown)
+        return self.events_from(_section(markdown, index, EVENTS_SECTION))
+
+    def parse_deep_dives(self, markdown: str) -> list[DeepDive]:
+        """Extract deep dive sections."""
+        index = index_sections(markdown)
+        return self.dives_from(_section(markdown, index, DIVES_SECTION))
+
+    def parse_completeness_audit(
+        self, markdown: str
+    ) -> CompletenessAudit | None:
+        """Extract completeness audit section."""
+        index = index_sections(markdown)
+        return self.audit_from(_section(markdown, index, AUDIT_SECTION))
+
+    def tldr_from(self, body: str | None) -> str:
+        """Parse a TL;DR section body."""
+        return body.strip() if body else ""
+
+    def events_from(self, body: str | None) -> list[ViralEvent]:
+        """Parse a Global Viral Events section body."""
         events: list[ViralEvent] = []
-        section = re.search(
-            r"##\s*Global Viral Events\s*\n(.*?)(?=\n##|\Z)",
-            markdown,
-            re.DOTALL,
-        )
-        if not section:
+        if body is None:
             return events
-
-        event_blocks = re.split(r"\n###\s+", section.group(1))
-        for block in event_blocks:
+        for block in _BLOCK_SPLIT_RE.split(body):
             block = block.strip()
             if not block:
                 continue
-            event = self._parse_single_event(block)
+            event = self.event_from(block)
             if event:
                 events.append(event)
         return events
 
-    def _parse_single_event(self, block: str) -> ViralEvent | None:
+    def dives_from(self, body: str | None) -> list[DeepDive]:
+        """Parse a Strategic Deep Dives section body."""
+        dives: list[DeepDive] = []
+        if body is None:
+            return dives
+        for block in _BLOCK_SPLIT_RE.split(body):
+            block = block.strip()
+            if not block:
+                continue
+            dive = self.dive_from(block)
+            if dive:
+                dives.append(dive)
+        return dives
+
+    def audit_from(self, body: str | None) -> CompletenessAudit | None:
+        """Parse a Completeness Audit section body."""
+        if body is None:
+            return None
+
+        fields = _parse_fields(body.split("\n"))
+        try:
+            signals = int(fields.get("verified signals", "0"))
+            sources = int(fields.get("sources checked", "0"))
+            score = float(fields.get("confidence score", "0.0"))
+        except ValueError:
+            return None
+
+        gaps_str = fields.get("gaps", "")
+        gaps = [g.strip() for g in gaps_str.split(",") if g.strip()]
+
+        return CompletenessAudit(
+            verified_signals=signals,
+            sources_checked=sources,
+            confidence_score=score,
+            gaps=gaps,
+        )
+
+    def event_from(self, block: str) -> ViralEvent | None:
         """Parse a single event block."""
         lines = block.split("\n")
-        headline = re.sub(r"^#+\s*", "", lines[0].strip())
+        headline = _HEADING_RE.sub("", lines[0].strip())
         if not headline:
             return None
 
-        fields: dict[str, str] = {}
-        for line in lines[1:]:
-            match = re.match(
-                r"-\s*\*\*(.+?)\*\*:\s*(.+)", line.strip()
-            )
-            if match:
-                fields[match.group(1).lower()] = match.group(2).strip()
-
+        fields = _parse_fields(lines[1:])
         category_str = fields.get("category", "research")
         category = CATEGORY_MAP.get(category_str, EventCategory.RESEARCH)
         confidence_str = fields.get("confidence", "medium")
@@ -90,31 +202,10 @@ class ReportParser:
             source=fields.get("source", "Unknown"),
         )
 
-    def parse_deep_dives(self, markdown: str) -> list[DeepDive]:
-        """Extract deep dive sections."""
-        dives: list[DeepDive] = []
-        section = re.search(
-            r"##\s*Strategic Deep Dives\s*\n(.*?)(?=\n##|\Z)",
-            markdown,
-            re.DOTALL,
-        )
-        if not section:
-            return dives
-
-        dive_blocks = re.split(r"\n###\s+", section.group(1))
-        for block in dive_blocks:
-            block = block.strip()
-            if not block:
-                continue
-            dive = self._parse_single_dive(block)
-            if dive:
-                dives.append(dive)
-        return dives
-
-    def _parse_single_dive(self, block: str) -> DeepDive | None:
+    def dive_from(self, block: str) -> DeepDive | None:
         """Parse a single deep dive block."""
         lines = block.split("\n")
-        title = re.sub(r"^#+\s*", "", lines[0].strip())
+        title = _HEADING_RE.sub("", lines[0].strip())
         if not title:
             return None
 
@@ -131,9 +222,7 @@ class ReportParser:
                 findings.append(stripped[2:].strip())
                 continue
             if not in_findings:
-                match = re.match(
-                    r"-\s*\*\*(.+?)\*\*:\s*(.+)", stripped
-                )
+                match = _FIELD_RE.match(stripped)
                 if match:
                     fields[match.group(1).lower()] = match.group(2).strip()
 
@@ -143,39 +232,3 @@ class ReportParser:
             summary=fields.get("summary", ""),
             key_findings=findings,
         )
-
-    def parse_completeness_audit(
-        self, markdown: str
-    ) -> CompletenessAudit | None:
-        """Extract completeness audit section."""
-        section = re.search(
-            r"##\s*Completeness Audit\s*\n(.*?)(?=\n##|\Z)",
-            markdown,
-            re.DOTALL,
-        )
-        if not section:
-            return None
-
-        text = section.group(1)
-        fields: dict[str, str] = {}
-        for line in text.split("\n"):
-            match = re.match(r"-\s*\*\*(.+?)\*\*:\s*(.+)", line.strip())
-            if match:
-                fields[match.group(1).lower()] = match.group(2).strip()
-
-        try:
-            signals = int(fields.get("verified signals", "0"))
-            sources = int(fields.get("sources checked", "0"))
-            score = float(fields.get("confidence score", "0.0"))
-        except ValueError:
-            return None
-
-        gaps_str = fields.get("gaps", "")
-        gaps = [g.strip() for g in gaps_str.split(",") if g.strip()]
-
-        return CompletenessAudit(
-            verified_signals=signals,
-            sources_checked=sources,
-            confidence_score=score,
-            gaps=gaps,
-        )
@@ -1,52 +1,324 @@
-"""Research orchestrator — runs both engines in parallel."""
+"""Research orchestrator — runs the configured engines in parallel."""
 
 import asyncio
 import logging
+from collections.abc import Awaitable, Callable, Iterable, Sequence
 from datetime import datetime, timezone
 
 from backend.config.prompts import build_research_prompt
+from backend.repo.deadline import Deadline
 from backend.repo.firestore_client import FirestoreRepo
-from backend.repo.gemini_client import GeminiResearchClient
-from backend.repo.langchain_client import LangChainResearchClient
-from backend.service.engine_runner import run_gemini_engine, run_langchain_engine
-from backend.types.report import ResearchReport
+from backend.service.engine_registry import (
+    EngineHooks,
+    EngineRegistry,
+    EngineSpec,
+    engine_run_id,
+)
+from backend.service.engine_runner import resume_langchain_engine
+from backend.service.progress_bus import ProgressBus
+from backend.service.single_flight import SingleFlight
+from backend.types.enums import EngineType, ProgressKind, ResearchStatus
+from backend.types.errors import FirestoreError
+from backend.types.progress import ProgressCallback, ProgressEvent
+from backend.types.report import EngineResult, ResearchReport
 
 logger = logging.getLogger(__name__)
 
+LANGCHAIN_RUN_SUFFIX = f":{EngineType.LANGCHAIN.value}"
+
+
+def daily_report_id(date: str) -> str:
+    """ID of the report a daily run for ``date`` writes."""
+    return f"rpt-{date}"
+
+
+def langchain_run_id(report_id: str) -> str:
+    """Stable checkpoint thread ID of a report's LangChain run."""
+    return engine_run_id(report_id, EngineType.LANGCHAIN)
+
+
+def _report_status(results: Iterable[EngineResult]) -> ResearchStatus:
+    """Overall status of a report from its engine results.
+
+    FAILED if no engine completed, else TIMED_OUT if the run deadline
+    cut any engine off, else COMPLETED.
+    """
+    results = list(results)
+    if not any(r.status == ResearchStatus.COMPLETED for r in results):
+        return ResearchStatus.FAILED
+    if any(r.status == ResearchStatus.TIMED_OUT for r in results):
+        return ResearchStatus.TIMED_OUT
+    return ResearchStatus.COMPLETED
+
+
+def failure_message(report: ResearchReport) -> str:
+    """Summarise why no engine of a FAILED report completed."""
+    reasons = [
+        f"{engine.value}: {result.error_message or result.status.value}"
+        for engine, result in report.results.items()
+    ]
+    return "No engine completed (" + "; ".join(reasons) + ")"
+
+
+def _new_report(report_id: str) -> ResearchReport:
+    """An empty RUNNING report that engine results are merged into."""
+    now = datetime.now(timezone.utc)
+    return ResearchReport(
+        report_id=report_id,
+        run_date=now,
+        created_at=now,
+        status=ResearchStatus.RUNNING,
+    )
+
 
 class ResearchOrchestrator:
-    """Orchestrates daily research across both engines."""
+    """Orchestrates daily research across the registered engines.
+
+    ``engines`` picks the subset of the registry to run (all of it by
+    default) and ``max_parallel_engines`` caps how many of them run at
+    once within a single report.
+    """
 
     def __init__(
         self,
-        gemini_client: GeminiResearchClient,
-        langchain_client: LangChainResearchClient,
+        registry: EngineRegistry,
         firestore_repo: FirestoreRepo,
+        flights: SingleFlight[ResearchReport] | None = None,
+        progress_bus: ProgressBus | None = None,
+        deadline_seconds: float | None = None,
+        engines: Sequence[EngineType] | None = None,
+        max_parallel_engines: int | None = None,
     ) -> None:
-        self._gemini = gemini_client
-        self._langchain = langchain_client
+        self._registry = registry
         self._firestore = firestore_repo
+        self._flights = flights or SingleFlight()
+        self._bus = progress_bus
+        self._deadline_seconds = deadline_seconds
+        self._specs = registry.select(engines)
+        self._max_parallel = max_parallel_engines
+
+    async def run_daily_research(
+        self, date: str, use_cache: bool = True
+    ) -> ResearchReport:
+        """Run the engines in parallel, saving each result as it lands.
+
+        Concurrent calls for the same report join the run already in
+        flight instead of starting (and paying for) a second one.
+        ``use_cache=False`` bypasses the engines' LLM response caches.
+        """
+        report_id = daily_report_id(date)
+        return await self._flights.run(
+            report_id,
+            lambda: self._run_daily_research(date, report_id, use_cache),
+        )
+
+    async def _run_daily_research(
+        self, date: str, report_id: str, use_cache: bool = True
+    ) -> ResearchReport:
+        """Run every selected engine for ``date``, merging results in.
 
-    async def run_daily_research(self, date: str) -> ResearchReport:
-        """Run both engines in parallel and save the report."""
+        The report is created as RUNNING if it does not exist yet (an
+        existing one keeps its results and is only marked RUNNING), each
+        engine result is written to its own field as soon as that
+        engine finishes, and the status moves to COMPLETED at the end.
+        A result whose write failed is retried with the final status
+        update. All engines share one run deadline; if any is cut off
+        by it the report ends TIMED_OUT instead, and if no engine
+        completed it ends FAILED.
+        """
         prompt = build_research_prompt(date)
-        report_id = f"rpt-{date}"
-        logger.info("Starting daily research for %s", date)
+        logger.info(
+            "Starting daily research for %s with %s",
+            date,
+            ", ".join(spec.engine.value for spec in self._specs),
+        )
+        self._publish(report_id, ProgressKind.RUN_STARTED, date=date)
 
-        gemini_result, langchain_result = await asyncio.gather(
-            run_gemini_engine(self._gemini, prompt),
-            run_langchain_engine(self._langchain, prompt),
+        report = _new_report(report_id)
+        unsaved: dict[EngineType, EngineResult] = {}
+        on_complete = self._completion_hook(report_id, unsaved)
+        deadline = self._new_deadline()
+        slots = (
+            asyncio.Semaphore(self._max_parallel)
+            if self._max_parallel is not None
+            else None
         )
 
-        now = datetime.now(timezone.utc)
-        report = ResearchReport(
-            report_id=report_id,
-            run_date=now,
-            gemini_result=gemini_result,
-            langchain_result=langchain_result,
-            created_at=now,
+        async def run_engine(spec: EngineSpec) -> EngineResult:
+            hooks = EngineHooks(
+                report_id,
+                deadline=deadline,
+                use_cache=use_cache,
+                on_progress=self._progress_hook(report_id, spec.engine),
+                on_partial=self._partial_hook(report_id, spec.engine),
+                on_complete=on_complete,
+            )
+            if slots is None:
+                return await spec.execute(prompt, hooks)
+            async with slots:
+                return await spec.execute(prompt, hooks)
+
+        try:
+            await self._open_report(report)
+            results = await asyncio.gather(
+                *(run_engine(spec) for spec in self._specs)
+            )
+            status = _report_status(results)
+            await self._firestore.update_report(
+                report_id, status=status, results=unsaved.values()
+            )
+        except Exception as exc:
+            self._publish(report_id, ProgressKind.RUN_FAILED, error=str(exc))
+            await self._mark_failed(report_id)
+            raise
+        finished = report.model_copy(
+            update={
+                "results": {result.engine: result for result in results},
+                "status": status,
+            }
         )
+        if status == ResearchStatus.FAILED:
+            message = failure_message(finished)
+            logger.error("Daily research failed: %s: %s", report_id, message)
+            self._publish(report_id, ProgressKind.RUN_FAILED, error=message)
+        else:
+            self._publish(report_id, ProgressKind.REPORT_SAVED)
+            logger.info("Daily research complete: %s", report_id)
+        return finished
+
+    async def resume_langchain_run(self, run_id: str) -> ResearchReport:
+        """Resume a crashed LangChain run and merge it into its report.
+
+        The report is RUNNING while the run resumes and then takes the
+        status its merged engine results add up to.
+        """
+        if not run_id.endswith(LANGCHAIN_RUN_SUFFIX):
+            raise ValueError(f"Not a LangChain run ID: {run_id}")
+        report_id = run_id.removesuffix(LANGCHAIN_RUN_SUFFIX)
+        logger.info("Resuming %s for report %s", run_id, report_id)
+
+        report = await self._firestore.get_report(report_id)
+        if report is None:
+            report = _new_report(report_id)
+        await self._open_report(report)
+        try:
+            langchain_result = await resume_langchain_engine(
+                self._registry.get(EngineType.LANGCHAIN).client, run_id
+            )
+            results = {**report.results, EngineType.LANGCHAIN: langchain_result}
+            status = _report_status(results.values())
+            await self._firestore.update_report(
+                report_id, status=status, results=[langchain_result]
+            )
+        except Exception:
+            await self._mark_failed(report_id)
+            raise
+        return report.model_copy(update={"results": results, "status": status})
+
+    async def _open_report(self, report: ResearchReport) -> None:
+        """Create the report as RUNNING, or mark an existing one RUNNING.
+
+        Only the status of an existing report is touched, so results
+        saved by an earlier run survive until this run replaces them.
+        """
+        if not await self._firestore.create_report(report):
+            await self._firestore.update_report(
+                report.report_id, status=ResearchStatus.RUNNING
+            )
+
+    def _new_deadline(self) -> Deadline | None:
+        """Start the deadline of a new run, if one is configured."""
+        if self._deadline_seconds is None:
+            return None
+        return Deadline(self._deadline_seconds)
+
+    async def _save_result(self, report_id: str, result: EngineResult) -> bool:
+        """Merge one engine result into the report; False if the write failed."""
+        try:
+            await self._firestore.update_report(report_id, results=[result])
+        except FirestoreError as exc:
+            logger.warning(
+                "Saving %s result of %s failed: %s",
+                result.engine.value,
+                report_id,
+                exc,
+            )
+            return False
+        return True
+
+    async def _mark_failed(self, report_id: str) -> None:
+        """Best-effort move of a report out of RUNNING after a failed run."""
+        try:
+            await self._firestore.update_report(
+                report_id, status=ResearchStatus.FAILED
+            )
+        except FirestoreError as exc:
+            logger.warning("Could not mark %s failed: %s", report_id, exc)
+
+    def _publish(
+        self,
+        report_id: str,
+        kind: ProgressKind,
+        engine: EngineType | None = None,
+        **data: object,
+    ) -> None:
+        """Broadcast a progress event if a bus is attached."""
+        if self._bus is not None:
+            self._bus.publish(
+                ProgressEvent(
+                    report_id=report_id, kind=kind, engine=engine, data=data
+                )
+            )
+
+    def _completion_hook(
+        self, report_id: str, unsaved: dict[EngineType, EngineResult]
+    ) -> Callable[[EngineResult], Awaitable[None]]:
+        """Build the engine hook that saves and announces a finished engine.
+
+        Results that could not be written are left in ``unsaved``.
+        """
+
+        async def on_complete(result: EngineResult) -> None:
+            if not await self._save_result(report_id, result):
+                unsaved[result.engine] = result
+            self._publish(
+                report_id,
+                ProgressKind.ENGINE_COMPLETED,
+                result.engine,
+                status=result.status.value,
+                duration_seconds=round(result.duration_seconds, 3),
+                error=result.error_message,
+            )
+
+        return on_complete
+
+    def _progress_hook(
+        self, report_id: str, engine: EngineType
+    ) -> ProgressCallback:
+        """Build the hook that relays an engine's own progress events."""
+
+        async def on_progress(
+            kind: ProgressKind, data: dict[str, object]
+        ) -> None:
+            self._publish(report_id, kind, engine, **data)
+
+        return on_progress
+
+    def _partial_hook(
+        self, report_id: str, engine: EngineType
+    ) -> Callable[[EngineResult], Awaitable[None]]:
+        """Build the hook that saves each partial result a stream closes."""
+        closed = 0
+
+        async def save_partial(partial: EngineResult) -> None:
+            nonlocal closed
+            closed += 1
+            self._publish(
+                report_id,
+                ProgressKind.SECTION_GENERATED,
+                engine,
+                sections_closed=closed,
+            )
+            await self._save_result(report_id, partial)
 
-        await self._firestore.save_report(report)
-        logger.info("Daily research complete: %s", report_id)
-        return report
+        return save_partial
@@ -0,0 +1,173 @@
+"""Bounded worker pool that executes queued research runs."""
+
+import asyncio
+import logging
+import uuid
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timezone
+
+from backend.repo.run_store import RunStore
+from backend.service.progress_bus import ProgressBus
+from backend.service.research_orchestrator import (
+    daily_report_id,
+    failure_message,
+)
+from backend.types.enums import ProgressKind, ResearchStatus
+from backend.types.progress import ProgressEvent
+from backend.types.report import ResearchReport
+from backend.types.runs import ResearchRun
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONCURRENCY = 2
+REPORT_END_STATUSES = (
+    ResearchStatus.COMPLETED,
+    ResearchStatus.TIMED_OUT,
+    ResearchStatus.FAILED,
+)
+
+RunFn = Callable[[str, bool], Awaitable[ResearchReport]]
+
+
+class RunQueue:
+    """Accepts research runs and executes them on ``max_concurrency`` workers.
+
+    Runs are written to the store before they are queued, so anything
+    pending or interrupted when the process stops is picked up again by
+    the next ``start``. A date that already has a pending or running run
+    is not queued twice; the existing run is returned instead. Each run
+    is executed as ``run_fn(date, use_cache)``.
+
+    Queuing a new run clears the report's progress history on
+    ``progress_bus``, so its event stream never starts with an earlier
+    run's events, and a run that raises always ends its stream with a
+    RUN_FAILED event.
+    """
+
+    def __init__(
+        self,
+        store: RunStore,
+        run_fn: RunFn,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        progress_bus: ProgressBus | None = None,
+    ) -> None:
+        self._store = store
+        self._run_fn = run_fn
+        self.max_concurrency = max_concurrency
+        self._bus = progress_bus
+        self._queue: asyncio.Queue[str] = asyncio.Queue()
+        self._workers: list[asyncio.Task[None]] = []
+
+    async def start(self) -> None:
+        """Requeue persisted work and start the workers (idempotent)."""
+        if self._workers:
+            return
+        self._queue = asyncio.Queue()
+        self._store.requeue_interrupted()
+        pending = self._store.list_by_status(ResearchStatus.PENDING)
+        for run in pending:
+            self._queue.put_nowait(run.run_id)
+        self._workers = [
+            asyncio.create_task(self._worker(index))
+            for index in range(self.max_concurrency)
+        ]
+        logger.info(
+            "Run queue started: %d workers, %d pending runs",
+            self.max_concurrency,
+            len(pending),
+        )
+
+    async def stop(self) -> None:
+        """Cancel the workers; in-flight runs are resumed on next start."""
+        workers, self._workers = self._workers, []
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+    async def submit(self, date: str, use_cache: bool = True) -> ResearchRun:
+        """Queue a run for ``date`` and return it without waiting.
+
+        ``use_cache=False`` bypasses the LLM response cache for the run.
+        """
+        active = self._store.find_active(date)
+        if active is not None:
+            logger.info("Run %s already active for %s", active.run_id, date)
+            return active
+        run = ResearchRun(
+            run_id=f"run-{uuid.uuid4().hex[:12]}",
+            date=date,
+            report_id=daily_report_id(date),
+            use_cache=use_cache,
+            created_at=datetime.now(timezone.utc),
+        )
+        self._store.save(run)
+        if self._bus is not None:
+            self._bus.reset(run.report_id)
+        await self.start()
+        self._queue.put_nowait(run.run_id)
+        logger.info("Queued run %s for %s", run.run_id, date)
+        return run
+
+    def get(self, run_id: str) -> ResearchRun | None:
+        """Current state of a run, or None if unknown."""
+        return self._store.get(run_id)
+
+    def _announce_failure(self, run: ResearchRun, exc: Exception) -> None:
+        """End the run's event stream if the run failed before doing so.
+
+        A run that failed before the orchestrator could publish anything
+        (building it, say) would otherwise leave subscribers waiting.
+        """
+        if self._bus is None or self._bus.finished(run.report_id):
+            return
+        self._bus.publish(
+            ProgressEvent(
+                report_id=run.report_id,
+                kind=ProgressKind.RUN_FAILED,
+                data={"error": str(exc)},
+            )
+        )
+
+    async def _worker(self, index: int) -> None:
+        queue = self._queue
+        while True:
+            run_id = await queue.get()
+            try:
+                await self._execute(run_id)
+            except Exception:
+                logger.exception("Worker %d failed on run %s", index, run_id)
+            finally:
+                queue.task_done()
+
+    async def _execute(self, run_id: str) -> None:
+        """Run one queued run, recording each status transition."""
+        run = self._store.get(run_id)
+        if run is None or run.status != ResearchStatus.PENDING:
+            return
+        run = run.model_copy(
+            update={
+                "status": ResearchStatus.RUNNING,
+                "started_at": datetime.now(timezone.utc),
+            }
+        )
+        self._store.save(run)
+        logger.info("Run %s started for %s", run_id, run.date)
+        update: dict[str, object] = {}
+        try:
+            report = await self._run_fn(run.date, run.use_cache)
+        except Exception as exc:
+            logger.error("Run %s failed: %s", run_id, exc)
+            status = ResearchStatus.FAILED
+            update["error_message"] = str(exc)
+            self._announce_failure(run, exc)
+        else:
+            status = report.status
+            if status not in REPORT_END_STATUSES:
+                status = ResearchStatus.COMPLETED
+            if status == ResearchStatus.FAILED:
+                update["error_message"] = failure_message(report)
+            update["report_id"] = report.report_id
+        update["status"] = status
+        update["completed_at"] = datetime.now(timezone.utc)
+        self._store.save(run.model_copy(update=update))
+        logger.info("Run %s finished: %s", run_id, status.value)
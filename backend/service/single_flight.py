@@ -0,0 +1,44 @@
+"""In-process single-flight coalescing of concurrent identical calls."""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from typing import Generic, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class SingleFlight(Generic[T]):
+    """Run at most one call per key; concurrent callers share its result.
+
+    The shared call runs as its own task, and each caller awaits it
+    through ``asyncio.shield``, so a caller that disconnects does not
+    cancel the run for everyone else. The key is forgotten as soon as
+    the call finishes, so later callers start a fresh run.
+    """
+
+    def __init__(self) -> None:
+        self._inflight: dict[str, asyncio.Task[T]] = {}
+
+    def in_flight(self) -> list[str]:
+        """Keys with a call currently running."""
+        return list(self._inflight)
+
+    async def run(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """Await the in-flight call for ``key``, starting one if needed."""
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        else:
+            logger.info("Joining in-flight run %s", key)
+        return await asyncio.shield(task)
+
+    def _forget(self, key: str, task: asyncio.Task[T]) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            task.exception()  # mark retrieved if every caller went away
@@ -0,0 +1,156 @@
+"""Push-style report parser that emits sections as their blocks close."""
+
+import logging
+
+from backend.service.report_parser import (
+    AUDIT_SECTION,
+    DIVES_SECTION,
+    EVENTS_SECTION,
+    TLDR_SECTION,
+    ReportParser,
+)
+from backend.types.events import CompletenessAudit, DeepDive, ViralEvent
+from backend.types.report import ParsedReport
+
+logger = logging.getLogger(__name__)
+
+TRACKED_SECTIONS = (TLDR_SECTION, EVENTS_SECTION, DIVES_SECTION, AUDIT_SECTION)
+BLOCK_SECTIONS = (EVENTS_SECTION, DIVES_SECTION)
+
+ParsedItem = tuple[str, str | ViralEvent | DeepDive | CompletenessAudit]
+
+
+def _is_section_heading(line: str) -> bool:
+    """Level-2 heading: ``##`` not followed by a third ``#``."""
+    return line.startswith("##") and not line.startswith("###")
+
+
+def _is_block_boundary(line: str) -> bool:
+    """``###`` followed by whitespace starts a new event or dive block."""
+    return line.startswith("###") and (len(line) == 3 or line[3].isspace())
+
+
+class StreamingReportParser:
+    """Incremental counterpart of ``ReportParser``.
+
+    Feed markdown chunks as they arrive; each call returns the
+    ``(section, item)`` pairs completed by that chunk. Every complete
+    line is examined exactly once, and the final ``result()`` equals
+    ``ReportParser().parse()`` on the concatenated input.
+    """
+
+    def __init__(self) -> None:
+        self._parser = ReportParser()
+        self._partial: list[str] = []
+        self._seen: set[str] = set()
+        self._section: str | None = None
+        self._lines: list[str] = []
+        self._swallowing = False
+        self._emitted: list[ParsedItem] = []
+        self._closed = False
+        self.sections_closed = 0
+        self._tldr = ""
+        self._events: list[ViralEvent] = []
+        self._dives: list[DeepDive] = []
+        self._audit: CompletenessAudit | None = None
+
+    def feed(self, chunk: str) -> list[ParsedItem]:
+        """Consume a chunk and return the items it completed."""
+        if self._closed:
+            raise ValueError("Parser already closed")
+        parts = chunk.split("\n")
+        if len(parts) > 1:
+            self._partial.append(parts[0])
+            self._on_line("".join(self._partial))
+            for line in parts[1:-1]:
+                self._on_line(line)
+            self._partial = []
+        self._partial.append(parts[-1])
+        return self._drain()
+
+    def close(self) -> list[ParsedItem]:
+        """Flush the trailing line and section at end of stream."""
+        if not self._closed:
+            self._on_line("".join(self._partial))
+            self._partial = []
+            self._close_section()
+            self._closed = True
+        return self._drain()
+
+    def result(self) -> ParsedReport:
+        """Snapshot of everything completed so far."""
+        return ParsedReport(
+            tldr=self._tldr,
+            viral_events=list(self._events),
+            deep_dives=list(self._dives),
+            completeness_audit=self._audit,
+        )
+
+    def _drain(self) -> list[ParsedItem]:
+        emitted, self._emitted = self._emitted, []
+        return emitted
+
+    def _on_line(self, line: str) -> None:
+        """Route one complete line to the current section."""
+        if _is_section_heading(line):
+            self._close_section()
+            self._open_section(line[2:].strip(" \t"))
+        elif self._section is None:
+            return
+        elif self._section not in BLOCK_SECTIONS:
+            self._lines.append(line)
+        elif self._swallowing:
+            # The batch splitter's greedy ``\s+`` after ``###`` eats
+            # blank lines and the newline before the next text, so that
+            # line can never start a block of its own.
+            self._lines.append(line)
+            self._swallowing = not line.strip()
+        elif _is_block_boundary(line):
+            self._close_block()
+            self._lines = [line[3:]]
+            self._swallowing = not line[3:].strip()
+        else:
+            self._lines.append(line)
+
+    def _open_section(self, title: str) -> None:
+        """Start tracking a section unless it is unknown or a repeat."""
+        if title in TRACKED_SECTIONS and title not in self._seen:
+            self._seen.add(title)
+            self._section = title
+            self._lines = []
+
+    def _close_section(self) -> None:
+        """Parse and emit whatever the current section still holds."""
+        section = self._section
+        if section is None:
+            return
+        if section == TLDR_SECTION:
+            self._tldr = self._parser.tldr_from("\n".join(self._lines))
+            self._emitted.append((section, self._tldr))
+        elif section == AUDIT_SECTION:
+            self._audit = self._parser.audit_from("\n".join(self._lines))
+            if self._audit is not None:
+                self._emitted.append((section, self._audit))
+        else:
+            self._close_block()
+        self._section = None
+        self._lines = []
+        self._swallowing = False
+        self.sections_closed += 1
+
+    def _close_block(self) -> None:
+        """Parse the buffered event or dive block, if it has content."""
+        block = "\n".join(self._lines).strip()
+        self._lines = []
+        if not block:
+            return
+        if self._section == EVENTS_SECTION:
+            event = self._parser.event_from(block)
+            if event:
+                self._events.append(event)
+                self._emitted.append((EVENTS_SECTION, event))
+        else:
+            dive = self._parser.dive_from(block)
+            if dive:
+                self._dives.append(dive)
+                self._emitted.append((DIVES_SECTION, dive))
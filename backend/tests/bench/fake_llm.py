@@ -0,0 +1,67 @@
+"""Fake chat model with configurable latency and decode throughput."""
+
+import asyncio
+
+from langchain_core.messages import AIMessage
+
+from backend.repo.context_trimmer import count_tokens
+from backend.tests.bench.reports import synthetic_report
+
+
+def _section(markdown: str, heading: str) -> str:
+    start = markdown.index(f"## {heading}")
+    end = markdown.find("\n## ", start + 1)
+    return markdown[start:] if end < 0 else markdown[start:end]
+
+
+class FakeChatModel:
+    """Stands in for ChatOpenAI: answers by instruction, sleeps like an API.
+
+    Each call costs ``latency_s`` plus output tokens at
+    ``tokens_per_s``, and reports real input/output token counts.
+    """
+
+    def __init__(
+        self,
+        latency_s: float = 0.2,
+        tokens_per_s: float = 2_000.0,
+        n_events: int = 12,
+        n_dives: int = 3,
+    ) -> None:
+        self.latency_s = latency_s
+        self.tokens_per_s = tokens_per_s
+        report = synthetic_report(n_events, n_dives, 0)
+        tldr = _section(report, "TL;DR")
+        events = _section(report, "Global Viral Events")
+        dives = _section(report, "Strategic Deep Dives")
+        audit = _section(report, "Completeness Audit")
+        self._replies = {
+            "ONLY the ## TL;DR": tldr,
+            "ONLY the ## Global Viral Events": events,
+            "ONLY the ## Strategic Deep Dives": f"{dives}\n{audit}",
+            "complete report": "\n".join([tldr, events, dives, audit]),
+        }
+        self.calls = 0
+        self.input_tokens = 0
+        self.output_tokens = 0
+
+    async def ainvoke(self, messages: list[dict[str, str]]) -> AIMessage:
+        instruction = messages[-1]["content"]
+        content = next(
+            (text for key, text in self._replies.items() if key in instruction),
+            "- condensed facts with numbers and source URLs\n" * 20,
+        )
+        input_tokens = sum(count_tokens(m["content"]) for m in messages)
+        output_tokens = count_tokens(content)
+        self.calls += 1
+        self.input_tokens += input_tokens
+        self.output_tokens += output_tokens
+        await asyncio.sleep(self.latency_s + output_tokens / self.tokens_per_s)
+        return AIMessage(
+            content=content,
+            usage_metadata={
+                "input_tokens": input_tokens,
+                "output_tokens": output_tokens,
+                "total_tokens": input_tokens + output_tokens,
+            },
+        )
@@ -0,0 +1,37 @@
+"""Baseline per-line context trimmer, kept as the benchmark reference."""
+
+import tiktoken
+
+
+def count_tokens(text: str, model: str = "gpt-4o") -> int:
+    """Count tokens, resolving the encoding on every call."""
+    if not text:
+        return 0
+    try:
+        encoding = tiktoken.encoding_for_model(model)
+    except KeyError:
+        encoding = tiktoken.get_encoding("cl100k_base")
+    return len(encoding.encode(text))
+
+
+def trim_context(
+    prompt: str,
+    context: str,
+    max_fraction: float = 0.75,
+    max_tokens: int = 128_000,
+) -> str:
+    """Trim context by re-encoding it one line at a time."""
+    available = int(max_tokens * max_fraction) - count_tokens(prompt)
+    if available <= 0:
+        return ""
+    if count_tokens(context) <= available:
+        return context
+    kept: list[str] = []
+    running = 0
+    for line in context.split("\n"):
+        line_tokens = count_tokens(line)
+        if running + line_tokens > available:
+            break
+        kept.append(line)
+        running += line_tokens
+    return "\n".join(kept)
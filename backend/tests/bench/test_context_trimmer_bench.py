@@ -0,0 +1,46 @@
+"""Benchmark: budget-bounded trimming vs per-line re-encoding."""
+
+import pytest
+
+from backend.repo.context_trimmer import count_tokens, trim_context
+from backend.tests.bench import legacy_context_trimmer
+from backend.tests.bench.timing import best_of
+
+pytestmark = pytest.mark.bench
+
+PROMPT = "Research the most viral AI events of the day."
+
+
+def _search_context(size_bytes: int) -> str:
+    """Build a Tavily-style search context of roughly ``size_bytes``."""
+    blocks = []
+    total = 0
+    i = 0
+    while total < size_bytes:
+        block = (
+            f"Source: https://example.com/news/{i}\n"
+            f"Title: AI lab ships model update number {i}\n"
+            f"Content: The release improves reasoning benchmarks by {i % 40}% "
+            "and adds tool use, according to the announcement.\n"
+        )
+        blocks.append(block)
+        total += len(block)
+        i += 1
+    return "\n".join(blocks)
+
+
+@pytest.mark.parametrize("size_mb", [1, 5, 10])
+def test_bounded_trim_speedup(size_mb: int) -> None:
+    context = _search_context(size_mb * 1_000_000)
+    trimmed = trim_context(PROMPT, context)
+    assert count_tokens(PROMPT) + count_tokens(trimmed) <= 96_000
+
+    before = best_of(
+        lambda: legacy_context_trimmer.trim_context(PROMPT, context), repeat=1
+    )
+    after = best_of(lambda: trim_context(PROMPT, context), repeat=3)
+    print(
+        f"\n{size_mb} MB context: per-line={before * 1e3:.0f}ms "
+        f"bounded={after * 1e3:.0f}ms ({before / after:.1f}x)"
+    )
+    assert after < before
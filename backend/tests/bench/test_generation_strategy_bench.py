@@ -0,0 +1,72 @@
+"""Benchmark: fan-out vs single-call vs map-reduce section generation."""
+
+import time
+
+import pytest
+
+from backend.repo.generation_strategy import FAN_OUT, MAP_REDUCE, SINGLE_CALL
+from backend.repo.langchain_client import LangChainResearchClient
+from backend.service.report_parser import ReportParser
+from backend.tests.bench.fake_llm import FakeChatModel
+
+pytestmark = pytest.mark.bench
+
+PROMPT = "Report the most viral AI product launches, funding and research today."
+
+
+def _search_results(query: str) -> list[dict[str, object]]:
+    """Thirty long, distinct hits per query, as a busy news day returns."""
+    return [
+        {
+            "url": f"https://news{i}.example/{abs(hash(query)) % 997}",
+            "title": f"{query} story {i}",
+            "content": f"Story {i} for {query}: "
+            + " ".join(f"detail{i}-{j}" for j in range(300)),
+            "score": 1 / (i + 1),
+        }
+        for i in range(30)
+    ]
+
+
+async def _run(strategy: str, llm: FakeChatModel) -> tuple[float, str]:
+    client = LangChainResearchClient(
+        openai_api_key="k", tavily_api_key="k", model="m", strategy=strategy
+    )
+    client._llm = llm
+
+    async def search(query: str, max_results: int) -> list[dict[str, object]]:
+        return _search_results(query)
+
+    client._search_client.search = search
+    start = time.perf_counter()
+    markdown = await client.run_research(PROMPT, use_cache=False)
+    elapsed = time.perf_counter() - start
+    await client.aclose()
+    return elapsed, markdown
+
+
+def _parses(markdown: str) -> bool:
+    parsed = ReportParser().parse(markdown)
+    return bool(
+        parsed.tldr
+        and parsed.viral_events
+        and parsed.deep_dives
+        and parsed.completeness_audit.verified_signals
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("latency_s", "tokens_per_s"), [(0.2, 2_000.0), (1.0, 200.0)]
+)
+async def test_strategy_tradeoffs(latency_s: float, tokens_per_s: float) -> None:
+    print(f"\nlatency={latency_s}s throughput={tokens_per_s:.0f} tok/s")
+    for strategy in (FAN_OUT, SINGLE_CALL, MAP_REDUCE):
+        llm = FakeChatModel(latency_s=latency_s, tokens_per_s=tokens_per_s)
+        elapsed, markdown = await _run(strategy, llm)
+        ok = _parses(markdown)
+        print(
+            f"  {strategy:<11} calls={llm.calls:<2} input={llm.input_tokens:>7} "
+            f"output={llm.output_tokens:>5} wall={elapsed:.2f}s parsed={ok}"
+        )
+        assert ok
@@ -0,0 +1,27 @@
+"""Benchmark: per-run LangGraph setup overhead."""
+
+import pytest
+
+from backend.repo.langchain_client import LangChainResearchClient
+from backend.tests.bench.timing import best_of
+
+pytestmark = pytest.mark.bench
+
+
+def _make_client() -> LangChainResearchClient:
+    return LangChainResearchClient(
+        openai_api_key="k", tavily_api_key="k", model="m"
+    )
+
+
+class TestGraphSetupBench:
+    def test_cached_graph_vs_rebuild(self) -> None:
+        client = _make_client()
+        rebuild = best_of(client._build_graph, number=20)
+        client.graph
+        cached = best_of(lambda: client.graph, number=20)
+        print(
+            f"\ngraph setup per run: rebuild={rebuild * 1e3:.3f}ms "
+            f"cached={cached * 1e6:.3f}us ({rebuild / cached:.0f}x)"
+        )
+        assert cached < rebuild
@@ -0,0 +1,71 @@
+"""Benchmark: MinHash-LSH near-duplicate filter vs exact all-pairs Jaccard."""
+
+import random
+
+import pytest
+
+from backend.repo.near_dedup import authority, filter_near_duplicates, jaccard, shingles
+from backend.tests.bench.timing import best_of
+
+pytestmark = pytest.mark.bench
+
+VOCAB = [f"w{i}" for i in range(5000)]
+COPIES_PER_STORY = 4
+
+
+def _syndicated_hits(n_hits: int, seed: int = 7) -> list[dict[str, object]]:
+    """Stories of ~60 words, each republished with light edits."""
+    rng = random.Random(seed)
+    hits: list[dict[str, object]] = []
+    while len(hits) < n_hits:
+        story = rng.choices(VOCAB, k=60)
+        for copy in range(COPIES_PER_STORY):
+            words = list(story)
+            words[rng.randrange(60)] = rng.choice(VOCAB)
+            hits.append(
+                {
+                    "url": f"https://outlet{copy}.example/{len(hits)}",
+                    "title": " ".join(story[:8]),
+                    "content": " ".join(words),
+                    "score": rng.random(),
+                }
+            )
+    return hits[:n_hits]
+
+
+def _all_pairs(items: list[dict[str, object]], threshold: float) -> list[int]:
+    """Reference filter: compare every hit with every kept hit."""
+    sets = [shingles(f"{i['title']} {i['content']}") for i in items]
+    order = sorted(
+        range(len(items)),
+        key=lambda i: (*(-v for v in authority(items[i])), i),
+    )
+    kept: list[int] = []
+    for index in order:
+        if not any(jaccard(sets[index], sets[j]) >= threshold for j in kept):
+            kept.append(index)
+    return sorted(kept)
+
+
+@pytest.mark.parametrize("n_hits", [1000, 2000])
+def test_lsh_filter_speedup(n_hits: int) -> None:
+    hits = _syndicated_hits(n_hits)
+    expected = _all_pairs(hits, 0.8)
+    kept, dropped = filter_near_duplicates(hits, 0.8)
+    assert kept == expected
+    assert len(dropped) >= n_hits // 2
+
+    before = best_of(lambda: _all_pairs(hits, 0.8), repeat=1)
+    after = best_of(lambda: filter_near_duplicates(hits, 0.8), repeat=3)
+    print(
+        f"\n{n_hits} hits, {len(dropped)} dropped: all-pairs={before * 1e3:.0f}ms "
+        f"minhash-lsh={after * 1e3:.0f}ms ({before / after:.1f}x)"
+    )
+    assert after < before
+
+
+def test_lsh_filter_scales_to_thousands() -> None:
+    hits = _syndicated_hits(10_000)
+    elapsed = best_of(lambda: filter_near_duplicates(hits, 0.8), repeat=3)
+    print(f"\n10000 hits: minhash-lsh={elapsed * 1e3:.0f}ms")
+    assert elapsed < 5.0
@@ -0,0 +1,54 @@
+"""Benchmark: single-pass section scanner vs the four-pass parser."""
+
+import pytest
+
+from backend.service.report_parser import ReportParser
+from backend.tests.bench.legacy_report_parser import (
+    ReportParser as LegacyReportParser,
+)
+from backend.tests.bench.reports import synthetic_report
+from backend.tests.bench.timing import best_of
+
+pytestmark = pytest.mark.bench
+
+
+def _legacy_parse(parser: LegacyReportParser, markdown: str) -> tuple:
+    return (
+        parser.parse_tldr(markdown),
+        parser.parse_viral_events(markdown),
+        parser.parse_deep_dives(markdown),
+        parser.parse_completeness_audit(markdown),
+    )
+
+
+def _single_pass_parse(parser: ReportParser, markdown: str) -> tuple:
+    parsed = parser.parse(markdown)
+    return (
+        parsed.tldr,
+        parsed.viral_events,
+        parsed.deep_dives,
+        parsed.completeness_audit,
+    )
+
+
+@pytest.mark.parametrize(
+    ("n_events", "n_dives", "filler"),
+    [(50, 10, 0), (300, 60, 20), (500, 100, 200)],
+)
+def test_single_pass_parser_speedup(
+    n_events: int, n_dives: int, filler: int
+) -> None:
+    markdown = synthetic_report(n_events, n_dives, filler)
+    legacy, current = LegacyReportParser(), ReportParser()
+    assert _single_pass_parse(current, markdown) == _legacy_parse(
+        legacy, markdown
+    )
+
+    before = best_of(lambda: _legacy_parse(legacy, markdown))
+    after = best_of(lambda: _single_pass_parse(current, markdown))
+    print(
+        f"\n{len(markdown) / 1e6:.2f} MB, {n_events} events: "
+        f"four-pass={before * 1e3:.1f}ms single-pass={after * 1e3:.1f}ms "
+        f"({before / after:.1f}x)"
+    )
+    assert after < before
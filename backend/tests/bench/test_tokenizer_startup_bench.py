@@ -0,0 +1,47 @@
+"""Benchmark: first count_tokens latency in a cold vs pre-warmed process."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from backend.repo.context_trimmer import TIKTOKEN_CACHE_ENV
+
+pytestmark = pytest.mark.bench
+
+_FIRST_COUNT = """
+import sys, time
+from backend.repo.context_trimmer import count_tokens, preload_encodings
+if sys.argv[1] == "warm":
+    preload_encodings()
+start = time.perf_counter()
+count_tokens("How long does the first token count take?")
+print(time.perf_counter() - start)
+"""
+
+
+def _first_count_seconds(mode: str, cache_dir: Path) -> float:
+    """Run one fresh interpreter and return its first-count latency."""
+    env = {**os.environ, TIKTOKEN_CACHE_ENV: str(cache_dir)}
+    out = subprocess.run(
+        [sys.executable, "-c", _FIRST_COUNT, mode],
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return float(out.stdout.strip().splitlines()[-1])
+
+
+def test_prewarm_removes_first_count_latency(tmp_path: Path) -> None:
+    bundle = tmp_path / "tiktoken"
+    download = _first_count_seconds("cold", bundle)
+    cold = min(_first_count_seconds("cold", bundle) for _ in range(3))
+    warm = min(_first_count_seconds("warm", bundle) for _ in range(3))
+    print(
+        f"\nfirst count_tokens: no bundle={download * 1e3:.0f}ms "
+        f"cold bundled={cold * 1e3:.0f}ms warm={warm * 1e3:.2f}ms"
+    )
+    assert warm < cold
@@ -2,11 +2,14 @@
 
 import os
 
+import pytest
+
 from backend.config.settings import Settings
 
 
 class TestSettings:
-    def test_default_values(self) -> None:
+    def test_default_values(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.delenv("TIKTOKEN_CACHE_DIR", raising=False)
         old = os.environ.pop("APP_ENV", None)
         try:
             s = Settings(
@@ -26,6 +29,20 @@ class TestSettings:
         assert s.firestore_collection == "research_reports"
         assert s.gemini_model == "gemini-3-flash-preview"
         assert s.openai_model == "gpt-5-mini"
+        assert s.gemini_timeout_seconds == 900.0
+        assert s.run_deadline_seconds == 1200.0
+        assert s.tiktoken_cache_dir is None
+        assert s.near_duplicate_threshold == 0.8
+        assert s.section_message_layout == "shared_prefix"
+        assert s.generation_strategy == "fan-out"
+        assert s.section_routes == {}
+        assert s.openai_rpm is None
+        assert s.openai_tpm is None
+        assert s.retry_max_attempts == 4
+        assert s.circuit_failure_rate == 0.5
+        assert s.circuit_open_seconds == 30.0
+        assert s.tavily_hedging is False
+        assert s.run_queue_max_concurrency == 2
         assert s.jwt_algorithm == "HS256"
         assert s.jwt_expire_hours == 24
         assert s.cors_origins == ["http://localhost:3000"]
@@ -47,6 +64,25 @@ class TestSettings:
         assert s.firestore_project_id == "my-project"
         assert s.cors_origins == ["https://app.example.com"]
 
+    def test_section_routes_from_env_json(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv(
+            "SECTION_ROUTES",
+            '{"tldr": {"model": "gpt-5-nano", "max_tokens": 500}}',
+        )
+        s = Settings(_env_file=None)
+        assert s.section_routes["tldr"].model == "gpt-5-nano"
+        assert s.section_routes["tldr"].max_tokens == 500
+        assert s.section_routes["tldr"].temperature is None
+
+    def test_tiktoken_cache_dir_from_env(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("TIKTOKEN_CACHE_DIR", "/app/.cache/tiktoken")
+        s = Settings(_env_file=None)
+        assert s.tiktoken_cache_dir == "/app/.cache/tiktoken"
+
     def test_required_keys_present(self) -> None:
         s = Settings(
             gemini_api_key="g",
@@ -0,0 +1,50 @@
+"""E2E test: the API stays responsive while an engine call is in flight."""
+
+import asyncio
+import time
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from backend.repo.gemini_client import GeminiResearchClient
+from backend.ui.app_factory import create_app
+
+
+def _slow_genai(delay: float) -> MagicMock:
+    """Fake genai.Client: the sync surface blocks, the async one yields."""
+
+    def _blocking(**_kwargs: object) -> MagicMock:
+        time.sleep(delay)
+        return MagicMock(text="# Blocking")
+
+    async def _non_blocking(**_kwargs: object) -> MagicMock:
+        await asyncio.sleep(delay)
+        return MagicMock(text="# Report")
+
+    fake = MagicMock()
+    fake.models.generate_content.side_effect = _blocking
+    fake.aio.models.generate_content.side_effect = _non_blocking
+    return fake
+
+
+class TestEventLoopResponsiveness:
+    @pytest.mark.asyncio
+    async def test_health_served_during_slow_gemini_call(self) -> None:
+        gemini = GeminiResearchClient(api_key="k", model="m")
+        gemini._client = _slow_genai(delay=1.0)
+        transport = httpx.ASGITransport(app=create_app())
+
+        research = asyncio.create_task(gemini.run_research("prompt"))
+        await asyncio.sleep(0.05)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://test"
+        ) as http:
+            start = time.monotonic()
+            resp = await http.get("/health")
+            elapsed = time.monotonic() - start
+
+        assert resp.status_code == 200
+        assert not research.done()
+        assert elapsed < 0.5
+        assert await research == "# Report"
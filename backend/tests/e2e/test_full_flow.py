@@ -1,11 +1,14 @@
 """End-to-end test for the full API flow."""
 
+import time
 from datetime import datetime, timezone
 from unittest.mock import AsyncMock
 
 from fastapi.testclient import TestClient
 
-from backend.runtime.dependencies import get_firestore_repo, get_orchestrator
+from backend.repo.run_store import RunStore
+from backend.runtime.dependencies import get_firestore_repo, get_run_queue
+from backend.service.run_queue import RunQueue
 from backend.types.enums import EngineType, ResearchStatus
 from backend.types.report import EngineResult, ResearchReport
 from backend.ui.app_factory import create_app
@@ -56,9 +59,11 @@ class TestFullFlow:
         self.app.dependency_overrides[get_firestore_repo] = (
             lambda: self.mock_repo
         )
-        self.app.dependency_overrides[get_orchestrator] = (
-            lambda: self.mock_orchestrator
+        self.queue = RunQueue(
+            store=RunStore(),
+            run_fn=self.mock_orchestrator.run_daily_research,
         )
+        self.app.dependency_overrides[get_run_queue] = lambda: self.queue
         self.client = TestClient(self.app)
 
     def teardown_method(self) -> None:
@@ -91,17 +96,31 @@ class TestFullFlow:
         )
         assert detail_resp.status_code == 200
         detail = detail_resp.json()
-        assert detail["gemini_result"] is not None
-        assert detail["langchain_result"] is not None
+        assert set(detail["results"]) == {"gemini", "langchain"}
 
         self.mock_orchestrator.run_daily_research.return_value = report
-        trigger_resp = self.client.post(
-            "/api/reports/trigger",
-            json={"date": "2026-02-28"},
-            headers=headers,
+        with TestClient(self.app) as client:
+            trigger_resp = client.post(
+                "/api/reports/trigger",
+                json={"date": "2026-02-28"},
+                headers=headers,
+            )
+            assert trigger_resp.status_code == 202
+            accepted = trigger_resp.json()
+            assert accepted["report_id"] == "rpt-2026-02-28"
+            assert accepted["status"] == "pending"
+
+            run_url = f"/api/runs/{accepted['run_id']}"
+            deadline = time.monotonic() + 5
+            while time.monotonic() < deadline:
+                run = client.get(run_url, headers=headers).json()
+                if run["status"] == "completed":
+                    break
+                time.sleep(0.01)
+            assert run["status"] == "completed"
+        self.mock_orchestrator.run_daily_research.assert_awaited_once_with(
+            "2026-02-28", True
         )
-        assert trigger_resp.status_code == 200
-        assert trigger_resp.json()["report_id"] == "rpt-2026-02-28"
 
     def test_unauthenticated_access_blocked(self) -> None:
         resp = self.client.get("/api/reports/")
@@ -0,0 +1,133 @@
+"""Tests for backend.repo.circuit_breaker."""
+
+import pytest
+
+from backend.repo.circuit_breaker import CircuitBreaker
+from backend.types.enums import CircuitState
+from backend.types.errors import CircuitOpenError
+from backend.types.resilience import CircuitPolicy
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _breaker(clock: FakeClock, **policy: object) -> CircuitBreaker:
+    defaults: dict[str, object] = {
+        "failure_rate_threshold": 0.5,
+        "window_seconds": 60.0,
+        "min_calls": 4,
+        "open_seconds": 30.0,
+    }
+    defaults.update(policy)
+    return CircuitBreaker("openai", CircuitPolicy(**defaults), clock)
+
+
+def _trip(breaker: CircuitBreaker) -> None:
+    for _ in range(breaker.policy.min_calls):
+        breaker.record_failure()
+
+
+class TestClosed:
+    def test_starts_closed_and_admits_calls(self) -> None:
+        breaker = _breaker(FakeClock())
+        breaker.allow()
+        assert breaker.state is CircuitState.CLOSED
+
+    def test_stays_closed_below_min_calls(self) -> None:
+        breaker = _breaker(FakeClock())
+        for _ in range(3):
+            breaker.record_failure()
+        assert breaker.state is CircuitState.CLOSED
+
+    def test_stays_closed_below_failure_rate(self) -> None:
+        breaker = _breaker(FakeClock())
+        for _ in range(3):
+            breaker.record_success()
+        breaker.record_failure()
+        breaker.record_failure()
+        assert breaker.state is CircuitState.CLOSED
+
+    def test_opens_at_failure_rate(self) -> None:
+        breaker = _breaker(FakeClock())
+        breaker.record_success()
+        breaker.record_success()
+        breaker.record_failure()
+        breaker.record_failure()
+        assert breaker.state is CircuitState.OPEN
+
+    def test_old_outcomes_leave_the_window(self) -> None:
+        clock = FakeClock()
+        breaker = _breaker(clock)
+        for _ in range(3):
+            breaker.record_failure()
+        clock.now = 61.0
+        breaker.record_failure()
+        assert breaker.state is CircuitState.CLOSED
+        assert breaker.status().calls == 1
+
+
+class TestOpenAndHalfOpen:
+    def test_open_refuses_calls(self) -> None:
+        clock = FakeClock()
+        breaker = _breaker(clock)
+        _trip(breaker)
+        clock.now = 10.0
+        with pytest.raises(CircuitOpenError, match="retry in 20.0s"):
+            breaker.allow()
+
+    def test_half_open_admits_one_probe(self) -> None:
+        clock = FakeClock()
+        breaker = _breaker(clock)
+        _trip(breaker)
+        clock.now = 30.0
+        assert breaker.state is CircuitState.HALF_OPEN
+        breaker.allow()
+        with pytest.raises(CircuitOpenError, match="probing"):
+            breaker.allow()
+
+    def test_successful_probe_closes(self) -> None:
+        clock = FakeClock()
+        breaker = _breaker(clock)
+        _trip(breaker)
+        clock.now = 30.0
+        breaker.allow()
+        breaker.record_success()
+        assert breaker.state is CircuitState.CLOSED
+        assert breaker.status().calls == 0
+
+    def test_failed_probe_reopens(self) -> None:
+        clock = FakeClock()
+        breaker = _breaker(clock)
+        _trip(breaker)
+        clock.now = 30.0
+        breaker.allow()
+        breaker.record_failure()
+        assert breaker.state is CircuitState.OPEN
+        assert breaker.retry_in_seconds() == 30.0
+
+    def test_lost_probe_frees_its_slot(self) -> None:
+        clock = FakeClock()
+        breaker = _breaker(clock)
+        _trip(breaker)
+        clock.now = 30.0
+        breaker.allow()
+        clock.now = 60.0
+        breaker.allow()
+
+
+class TestStatus:
+    def test_reports_state_and_rate(self) -> None:
+        clock = FakeClock()
+        breaker = _breaker(clock)
+        breaker.record_success()
+        breaker.record_failure()
+        status = breaker.status()
+        assert status.state is CircuitState.CLOSED
+        assert status.failure_rate == 0.5
+        assert status.calls == 2
+        assert status.retry_in_seconds == 0.0
@@ -0,0 +1,103 @@
+"""Tests for backend.repo.context_packer."""
+
+import pytest
+
+from backend.repo.context_packer import (
+    CONTEXT_HEADER,
+    HIT_SEPARATOR,
+    bm25_scores,
+    pack_context,
+    tokenize_terms,
+)
+from backend.repo.context_trimmer import count_tokens
+
+
+def _hit(title: str, content: str) -> str:
+    return f"Title: {title}\nURL: https://example.com/{title}\nContent: {content}"
+
+
+RELEVANT = _hit("funding", "OpenAI raises new funding round for AI models.")
+OFF_TOPIC = _hit("weather", "Sunny skies expected across the coast tomorrow.")
+PARTIAL = _hit("chips", "AI chip demand grows as labs train larger models.")
+
+
+class TestTokenizeTerms:
+    def test_lowercases_and_drops_stopwords(self) -> None:
+        assert tokenize_terms("The AI Lab is shipping a Model") == [
+            "ai",
+            "lab",
+            "shipping",
+            "model",
+        ]
+
+    def test_empty_text(self) -> None:
+        assert tokenize_terms("") == []
+
+
+class TestBm25Scores:
+    def test_ranks_matching_documents_higher(self) -> None:
+        scores = bm25_scores("AI funding round", [OFF_TOPIC, PARTIAL, RELEVANT])
+        assert scores[2] > scores[1] > scores[0]
+        assert scores[0] == 0.0
+
+    def test_rare_terms_weigh_more(self) -> None:
+        docs = ["ai ai news", "ai regulation news", "ai news"]
+        scores = bm25_scores("ai regulation", docs)
+        assert scores.index(max(scores)) == 1
+
+    def test_no_documents(self) -> None:
+        assert bm25_scores("anything", []) == []
+
+
+class TestPackContext:
+    def test_everything_fits_in_rank_order(self) -> None:
+        packed = pack_context("AI funding", [OFF_TOPIC, PARTIAL, RELEVANT])
+        assert packed.split(HIT_SEPARATOR) == [RELEVANT, PARTIAL, OFF_TOPIC]
+
+    def test_keeps_hits_whole_and_drops_least_relevant(self) -> None:
+        prompt = "AI funding"
+        hits = [OFF_TOPIC, PARTIAL, RELEVANT]
+        budget = (
+            count_tokens(prompt)
+            + count_tokens(CONTEXT_HEADER)
+            + count_tokens(RELEVANT)
+            + count_tokens(HIT_SEPARATOR)
+            + count_tokens(PARTIAL)
+        )
+        packed = pack_context(prompt, hits, max_fraction=1.0, max_tokens=budget)
+        assert packed.split(HIT_SEPARATOR) == [RELEVANT, PARTIAL]
+
+    def test_budget_includes_longest_preamble(self) -> None:
+        prompt = "AI funding"
+        hits = [OFF_TOPIC, PARTIAL, RELEVANT]
+        preamble = "Produce the section. " * 40
+        budget = (
+            count_tokens(prompt)
+            + count_tokens(CONTEXT_HEADER)
+            + count_tokens(preamble)
+            + count_tokens(RELEVANT)
+        )
+        without = pack_context(prompt, hits, max_fraction=1.0, max_tokens=budget)
+        with_preamble = pack_context(
+            prompt,
+            hits,
+            ["short", preamble],
+            max_fraction=1.0,
+            max_tokens=budget,
+        )
+        assert without.split(HIT_SEPARATOR) == [RELEVANT, PARTIAL, OFF_TOPIC]
+        assert with_preamble == RELEVANT
+
+    @pytest.mark.parametrize("max_tokens", [100, 400, 2000])
+    def test_never_exceeds_budget(self, max_tokens: int) -> None:
+        prompt = "AI models funding chips"
+        hits = [_hit(f"h{i}", "AI news " * (i % 50 + 1)) for i in range(200)]
+        packed = pack_context(prompt, hits, max_tokens=max_tokens)
+        total = count_tokens(prompt + CONTEXT_HEADER) + count_tokens(packed)
+        assert total <= int(max_tokens * 0.75)
+
+    def test_overhead_over_budget_returns_empty(self) -> None:
+        packed = pack_context(
+            "AI funding", [RELEVANT], ["long preamble " * 100], max_tokens=50
+        )
+        assert packed == ""
@@ -1,9 +1,28 @@
 """Tests for backend.repo.context_trimmer — RED phase."""
 
+import os
+from unittest.mock import MagicMock, patch
+
+import pytest
+
 from backend.repo.context_trimmer import (
+    TIKTOKEN_CACHE_ENV,
     count_tokens,
+    get_encoding,
+    preload_encodings,
     trim_context,
 )
+from backend.types.errors import TokenizerError
+
+
+def _fake_encoding(round_trips: bool = True) -> MagicMock:
+    encoding = MagicMock()
+    encoding.name = "fake_base"
+    encoding.encode_ordinary.side_effect = lambda text: list(text.encode())
+    encoding.decode.side_effect = (
+        lambda tokens: bytes(tokens).decode() if round_trips else "garbled"
+    )
+    return encoding
 
 
 class TestCountTokens:
@@ -66,3 +85,102 @@ class TestTrimContext:
         context = "Short result"
         result = trim_context(prompt, context)
         assert context in result
+
+    @pytest.mark.parametrize("max_tokens", [50, 333, 1000, 4096])
+    def test_never_exceeds_budget(self, max_tokens: int) -> None:
+        prompt = "Research prompt"
+        context = "\n".join(
+            f"[{i}] Résumé — données 数据 {'x' * (i % 37)} 🚀"
+            for i in range(3000)
+        )
+        result = trim_context(
+            prompt, context, max_fraction=0.75, max_tokens=max_tokens
+        )
+        budget = int(max_tokens * 0.75)
+        assert count_tokens(prompt) + count_tokens(result) <= budget
+
+    def test_cuts_at_line_boundary(self) -> None:
+        lines = [f"Line {i}: Some content here" for i in range(2000)]
+        context = "\n".join(lines)
+        result = trim_context("Prompt", context, max_tokens=1000)
+        kept = result.split("\n")
+        assert kept == lines[: len(kept)]
+        assert len(kept) < len(lines)
+
+    def test_single_oversized_line_returns_empty(self) -> None:
+        context = "word " * 5000
+        assert trim_context("Prompt", context, max_tokens=1000) == ""
+
+
+class TestGetEncoding:
+    def test_encoding_loaded_once_per_model(self) -> None:
+        get_encoding.cache_clear()
+        with patch(
+            "backend.repo.context_trimmer.tiktoken.encoding_for_model"
+        ) as loader:
+            get_encoding("gpt-test")
+            get_encoding("gpt-test")
+        get_encoding.cache_clear()
+        loader.assert_called_once_with("gpt-test")
+
+    def test_unknown_model_falls_back(self) -> None:
+        get_encoding.cache_clear()
+        with (
+            patch(
+                "backend.repo.context_trimmer.tiktoken.encoding_for_model",
+                side_effect=KeyError("unknown"),
+            ),
+            patch(
+                "backend.repo.context_trimmer.tiktoken.get_encoding"
+            ) as fallback,
+        ):
+            get_encoding("mystery-model")
+        get_encoding.cache_clear()
+        fallback.assert_called_once_with("cl100k_base")
+
+
+class TestPreloadEncodings:
+    def test_loads_and_validates(self) -> None:
+        with (
+            patch.dict(os.environ),
+            patch(
+                "backend.repo.context_trimmer.get_encoding",
+                return_value=_fake_encoding(),
+            ) as loader,
+        ):
+            os.environ.pop(TIKTOKEN_CACHE_ENV, None)
+            elapsed = preload_encodings(["gpt-4o"], cache_dir="/bundle")
+            assert os.environ[TIKTOKEN_CACHE_ENV] == "/bundle"
+        loader.assert_called_once_with("gpt-4o")
+        assert elapsed >= 0
+
+    def test_keeps_cache_dir_already_in_env(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv(TIKTOKEN_CACHE_ENV, "/app/.cache/tiktoken")
+        with patch(
+            "backend.repo.context_trimmer.get_encoding",
+            return_value=_fake_encoding(),
+        ):
+            preload_encodings(["gpt-4o"], cache_dir=".cache/tiktoken")
+        assert os.environ[TIKTOKEN_CACHE_ENV] == "/app/.cache/tiktoken"
+
+    def test_load_failure_raises_tokenizer_error(self) -> None:
+        with (
+            patch(
+                "backend.repo.context_trimmer.get_encoding",
+                side_effect=OSError("no network"),
+            ),
+            pytest.raises(TokenizerError, match="no network"),
+        ):
+            preload_encodings(["gpt-4o"])
+
+    def test_round_trip_mismatch_raises(self) -> None:
+        with (
+            patch(
+                "backend.repo.context_trimmer.get_encoding",
+                return_value=_fake_encoding(round_trips=False),
+            ),
+            pytest.raises(TokenizerError, match="failed validation"),
+        ):
+            preload_encodings(["gpt-4o"])
@@ -0,0 +1,64 @@
+"""Tests for backend.repo.deadline."""
+
+import asyncio
+
+import pytest
+
+from backend.repo.deadline import Deadline
+from backend.types.errors import DeadlineExceededError
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestDeadline:
+    def test_remaining_counts_down_and_floors_at_zero(self) -> None:
+        clock = FakeClock()
+        deadline = Deadline(10.0, clock=clock)
+        clock.now += 4.0
+        assert deadline.remaining() == 6.0
+        assert not deadline.expired
+        clock.now += 20.0
+        assert deadline.remaining() == 0.0
+        assert deadline.expired
+
+    @pytest.mark.asyncio
+    async def test_run_returns_result_within_budget(self) -> None:
+        async def work() -> str:
+            return "done"
+
+        assert await Deadline(1.0).run(work(), "work") == "done"
+
+    @pytest.mark.asyncio
+    async def test_run_cancels_work_at_expiry(self) -> None:
+        cancelled: list[bool] = []
+
+        async def hang() -> None:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+
+        with pytest.raises(DeadlineExceededError, match="during search"):
+            await Deadline(0.02).run(hang(), "search")
+        assert cancelled == [True]
+
+    @pytest.mark.asyncio
+    async def test_expired_deadline_does_not_start_work(self) -> None:
+        clock = FakeClock()
+        deadline = Deadline(1.0, clock=clock)
+        clock.now += 5.0
+        started: list[bool] = []
+
+        async def work() -> None:
+            started.append(True)
+
+        with pytest.raises(DeadlineExceededError, match="before section tldr"):
+            await deadline.run(work(), "section tldr")
+        assert started == []
@@ -4,9 +4,11 @@ from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from google.api_core.exceptions import AlreadyExists
 
 from backend.repo.firestore_client import FirestoreRepo
 from backend.types.enums import EngineType, ResearchStatus
+from backend.types.errors import FirestoreError
 from backend.types.report import EngineResult, ResearchReport
 
 
@@ -56,6 +58,86 @@ class TestFirestoreRepo:
         mock_collection.document.assert_called_once_with("rpt-001")
         mock_doc.set.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_create_report_writes_new_document(self) -> None:
+        mock_db = MagicMock()
+        mock_doc = MagicMock()
+        mock_doc.create = AsyncMock()
+        mock_db.collection.return_value.document.return_value = mock_doc
+
+        repo = FirestoreRepo(db=mock_db, collection_name="reports")
+        report = _make_report()
+        assert await repo.create_report(report) is True
+        mock_doc.create.assert_awaited_once_with(report.model_dump(mode="json"))
+        mock_doc.set.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_create_report_leaves_existing_document(self) -> None:
+        mock_db = MagicMock()
+        mock_doc = MagicMock()
+        mock_doc.create = AsyncMock(side_effect=AlreadyExists("exists"))
+        mock_db.collection.return_value.document.return_value = mock_doc
+
+        repo = FirestoreRepo(db=mock_db, collection_name="reports")
+        assert await repo.create_report(_make_report()) is False
+        mock_doc.set.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_create_report_wraps_other_errors(self) -> None:
+        mock_db = MagicMock()
+        mock_doc = MagicMock()
+        mock_doc.create = AsyncMock(side_effect=RuntimeError("down"))
+        mock_db.collection.return_value.document.return_value = mock_doc
+
+        repo = FirestoreRepo(db=mock_db, collection_name="reports")
+        with pytest.raises(FirestoreError):
+            await repo.create_report(_make_report())
+
+    @pytest.mark.asyncio
+    async def test_update_report_writes_only_given_fields(self) -> None:
+        mock_db = MagicMock()
+        mock_doc = MagicMock()
+        mock_doc.update = AsyncMock()
+        mock_db.collection.return_value.document.return_value = mock_doc
+
+        repo = FirestoreRepo(db=mock_db, collection_name="reports")
+        result = _make_report().results[EngineType.GEMINI]
+        await repo.update_report(
+            "rpt-001", status=ResearchStatus.COMPLETED, results=[result]
+        )
+
+        mock_doc.update.assert_awaited_once_with(
+            {
+                "results.gemini": result.model_dump(mode="json"),
+                "status": "completed",
+            }
+        )
+        mock_doc.set.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_update_report_without_fields_is_noop(self) -> None:
+        mock_db = MagicMock()
+        repo = FirestoreRepo(db=mock_db, collection_name="reports")
+        await repo.update_report("rpt-001")
+        mock_db.collection.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_update_report_wraps_errors(self) -> None:
+        mock_db = MagicMock()
+        mock_doc = MagicMock()
+        mock_doc.update = AsyncMock(side_effect=RuntimeError("not found"))
+        mock_db.collection.return_value.document.return_value = mock_doc
+
+        repo = FirestoreRepo(db=mock_db, collection_name="reports")
+        with pytest.raises(FirestoreError):
+            await repo.update_report("rpt-001", status=ResearchStatus.FAILED)
+
+    def test_legacy_document_without_status_reads_completed(self) -> None:
+        data = _make_report().model_dump(mode="json")
+        del data["status"]
+        report = ResearchReport.model_validate(data)
+        assert report.status == ResearchStatus.COMPLETED
+
     @pytest.mark.asyncio
     async def test_get_report_found(self) -> None:
         mock_db = MagicMock()
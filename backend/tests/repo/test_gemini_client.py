@@ -1,5 +1,6 @@
 """Tests for src.repo.gemini_client — RED phase."""
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -15,6 +16,15 @@ class TestGeminiResearchClient:
         )
         assert client.model == "gemini-2.5-flash"
 
+    @pytest.mark.asyncio
+    async def test_aclose_closes_sdk_connections(self) -> None:
+        client = GeminiResearchClient(api_key="test-key", model="m")
+        client._client = MagicMock()
+        client._client.aio.aclose = AsyncMock()
+        await client.aclose()
+        client._client.aio.aclose.assert_awaited_once_with()
+        client._client.close.assert_called_once_with()
+
     @pytest.mark.asyncio
     async def test_run_research_returns_markdown(self) -> None:
         client = GeminiResearchClient(
@@ -41,3 +51,100 @@ class TestGeminiResearchClient:
             mock_exec.side_effect = GeminiApiError("API failure")
             with pytest.raises(GeminiApiError, match="API failure"):
                 await client.run_research("Test prompt")
+
+
+def _fake_genai(delay: float = 0.0, text: str | None = "# Report") -> MagicMock:
+    """Fake genai.Client whose async surface sleeps before answering."""
+
+    async def _generate(**_kwargs: object) -> MagicMock:
+        await asyncio.sleep(delay)
+        response = MagicMock()
+        response.text = text
+        return response
+
+    fake = MagicMock()
+    fake.aio.models.generate_content = AsyncMock(side_effect=_generate)
+    fake.models.generate_content.side_effect = AssertionError(
+        "blocking generate_content must not be used"
+    )
+    return fake
+
+
+class TestGeminiAsyncExecution:
+    @pytest.mark.asyncio
+    async def test_uses_async_client_surface(self) -> None:
+        client = GeminiResearchClient(api_key="k", model="m")
+        client._client = _fake_genai(text="# Async")
+        assert await client.run_research("prompt") == "# Async"
+        client._client.aio.models.generate_content.assert_awaited_once_with(
+            model="m", contents="prompt"
+        )
+
+    @pytest.mark.asyncio
+    async def test_empty_response_raises(self) -> None:
+        client = GeminiResearchClient(api_key="k", model="m")
+        client._client = _fake_genai(text=None)
+        with pytest.raises(GeminiApiError, match="empty response"):
+            await client.run_research("prompt")
+
+    @pytest.mark.asyncio
+    async def test_timeout_raises_gemini_error(self) -> None:
+        client = GeminiResearchClient(
+            api_key="k", model="m", timeout_seconds=0.05
+        )
+        client._client = _fake_genai(delay=5.0)
+        with pytest.raises(GeminiApiError, match="timed out"):
+            await client.run_research("prompt")
+
+    @pytest.mark.asyncio
+    async def test_cancellation_propagates(self) -> None:
+        client = GeminiResearchClient(api_key="k", model="m")
+        client._client = _fake_genai(delay=5.0)
+        task = asyncio.create_task(client.run_research("prompt"))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+
+def _fake_stream(texts: list[str | None], delay: float = 0.0) -> MagicMock:
+    """Fake genai.Client whose async stream yields the given chunk texts."""
+
+    async def _chunks():  # type: ignore[no-untyped-def]
+        for text in texts:
+            await asyncio.sleep(delay)
+            yield MagicMock(text=text)
+
+    fake = MagicMock()
+    fake.aio.models.generate_content_stream = AsyncMock(
+        side_effect=lambda **_kwargs: _chunks()
+    )
+    return fake
+
+
+class TestGeminiStreaming:
+    @pytest.mark.asyncio
+    async def test_yields_text_chunks(self) -> None:
+        client = GeminiResearchClient(api_key="k", model="m")
+        client._client = _fake_stream(["## TL;DR\n", None, "- Item\n"])
+        chunks = [c async for c in client.stream_research("prompt")]
+        assert chunks == ["## TL;DR\n", "- Item\n"]
+
+    @pytest.mark.asyncio
+    async def test_empty_stream_raises(self) -> None:
+        client = GeminiResearchClient(api_key="k", model="m")
+        client._client = _fake_stream([None])
+        with pytest.raises(GeminiApiError, match="empty response"):
+            [c async for c in client.stream_research("prompt")]
+
+    @pytest.mark.asyncio
+    async def test_stream_timeout_covers_whole_stream(self) -> None:
+        client = GeminiResearchClient(
+            api_key="k", model="m", timeout_seconds=0.1
+        )
+        client._client = _fake_stream(["a"] * 10, delay=0.03)
+        received: list[str] = []
+        with pytest.raises(GeminiApiError, match="timed out"):
+            async for chunk in client.stream_research("prompt"):
+                received.append(chunk)
+        assert 0 < len(received) < 10
@@ -0,0 +1,105 @@
+"""Tests for backend.repo.generation_strategy and the strategy graphs."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from backend.repo.generation_strategy import (
+    FAN_OUT,
+    MAP_REDUCE,
+    SINGLE_CALL,
+    chunk_hits,
+)
+from backend.repo.langchain_client import LangChainResearchClient
+from backend.service.report_parser import ReportParser
+
+SECTIONS = {
+    "ONLY the ## TL;DR": "## TL;DR\n- Lab ships model",
+    "ONLY the ## Global Viral Events": (
+        "## Global Viral Events\n### Lab ships model\n"
+        "- **Category**: product_launch\n- **Impact Rating**: 8\n"
+        "- **Confidence**: high\n- **Source**: https://a.com\n"
+        "- **Summary**: A model shipped."
+    ),
+    "ONLY the ## Strategic Deep Dives": (
+        "## Strategic Deep Dives\n### Why it matters\n"
+        "- **Priority**: HIGH\n- **Summary**: Big.\n"
+        "## Completeness Audit\n- **Verified Signals**: 3\n"
+        "- **Sources Checked**: 5\n- **Confidence Score**: 0.8\n"
+        "- **Gaps**: none"
+    ),
+}
+
+
+def _fake_llm_reply(messages: list[dict[str, str]]) -> MagicMock:
+    instruction = messages[-1]["content"]
+    for marker, section in SECTIONS.items():
+        if marker in instruction:
+            return MagicMock(content=section)
+    if "complete report" in instruction:
+        return MagicMock(content="\n\n".join(SECTIONS.values()))
+    return MagicMock(content="- condensed facts")
+
+
+def _client(strategy: str) -> LangChainResearchClient:
+    client = LangChainResearchClient(
+        openai_api_key="k", tavily_api_key="k", model="m", strategy=strategy
+    )
+
+    async def search(query: str, max_results: int) -> list[dict[str, str]]:
+        return [{"url": f"https://{query}.com", "title": query, "content": "c"}]
+
+    async def ainvoke(messages: list[dict[str, str]]) -> MagicMock:
+        return _fake_llm_reply(messages)
+
+    client._search_client.search = search
+    client._llm = MagicMock(ainvoke=MagicMock(side_effect=ainvoke))
+    return client
+
+
+class TestChunkHits:
+    def test_groups_whole_hits_under_limit(self) -> None:
+        with patch(
+            "backend.repo.generation_strategy.count_tokens", side_effect=len
+        ):
+            chunks = chunk_hits(["aaaa", "bbbb", "cccc", "dd"], max_tokens=8)
+        assert chunks == ["aaaa\n---\nbbbb", "cccc\n---\ndd"]
+
+    def test_oversized_hit_is_its_own_chunk(self) -> None:
+        with patch(
+            "backend.repo.generation_strategy.count_tokens", side_effect=len
+        ):
+            chunks = chunk_hits(["a" * 20, "bb"], max_tokens=8)
+        assert chunks == ["a" * 20, "bb"]
+
+    def test_no_hits(self) -> None:
+        assert chunk_hits([]) == []
+
+
+class TestStrategies:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("strategy", "llm_calls"),
+        [(FAN_OUT, 3), (SINGLE_CALL, 1), (MAP_REDUCE, 4)],
+    )
+    async def test_each_strategy_produces_parseable_report(
+        self, strategy: str, llm_calls: int
+    ) -> None:
+        client = _client(strategy)
+        with (
+            patch(
+                "backend.repo.langchain_client.pack_context",
+                side_effect=lambda _p, hits, _pre: "\n---\n".join(hits),
+            ),
+            patch(
+                "backend.repo.langchain_client.chunk_hits",
+                side_effect=lambda hits: ["\n---\n".join(hits)],
+            ),
+        ):
+            markdown = await client.run_research("AI news", use_cache=False)
+        parsed = ReportParser().parse(markdown)
+        assert parsed.tldr == "- Lab ships model"
+        assert len(parsed.viral_events) == 1
+        assert len(parsed.deep_dives) == 1
+        assert parsed.completeness_audit.verified_signals == 3
+        assert client._llm.ainvoke.call_count == llm_calls
@@ -0,0 +1,197 @@
+"""Tests for backend.repo.hedging."""
+
+import asyncio
+import random
+import time
+
+import pytest
+
+from backend.repo.hedging import HedgeBudget, Hedger, LatencyTracker
+from backend.types.resilience import HedgePolicy
+
+
+def _warm(hedger: Hedger, key: str, seconds: float, count: int = 20) -> None:
+    for _ in range(count):
+        hedger._latencies.record(key, seconds)
+        hedger._budget.record_request()
+
+
+class TestLatencyTracker:
+    def test_no_quantile_until_min_samples(self) -> None:
+        tracker = LatencyTracker(window=10, min_samples=3)
+        tracker.record("q", 1.0)
+        tracker.record("q", 2.0)
+        assert tracker.quantile("q", 0.9) is None
+
+    def test_nearest_rank_p90(self) -> None:
+        tracker = LatencyTracker(window=100, min_samples=1)
+        for value in range(1, 11):
+            tracker.record("q", float(value))
+        assert tracker.quantile("q", 0.9) == 9.0
+
+    def test_window_rolls_and_keys_are_separate(self) -> None:
+        tracker = LatencyTracker(window=2, min_samples=1)
+        for value in (9.0, 1.0, 1.0):
+            tracker.record("a", value)
+        tracker.record("b", 5.0)
+        assert tracker.quantile("a", 1.0) == 1.0
+        assert tracker.quantile("b", 1.0) == 5.0
+
+
+class TestHedgeBudget:
+    def test_limits_hedges_to_ratio_of_window(self) -> None:
+        budget = HedgeBudget(ratio=0.1, window=100)
+        for _ in range(20):
+            budget.record_request()
+        assert budget.try_spend()
+        assert budget.try_spend()
+        assert not budget.try_spend()
+
+    def test_empty_window_has_no_budget(self) -> None:
+        assert not HedgeBudget(ratio=0.5, window=10).try_spend()
+
+
+class TestHedger:
+    @pytest.mark.asyncio
+    async def test_cold_key_is_not_hedged(self) -> None:
+        hedger = Hedger()
+        calls: list[int] = []
+
+        async def call() -> str:
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return "ok"
+
+        assert await hedger.run("q", call) == "ok"
+        assert calls == [1]
+        assert hedger.hedges_sent == 0
+
+    @pytest.mark.asyncio
+    async def test_slow_primary_loses_to_hedge_and_is_cancelled(self) -> None:
+        hedger = Hedger()
+        _warm(hedger, "q", 0.01)
+        delays = iter([5.0, 0.01])
+        cancelled: list[bool] = []
+
+        async def call() -> str:
+            delay = next(delays)
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+            return f"after {delay}"
+
+        start = time.monotonic()
+        assert await hedger.run("q", call) == "after 0.01"
+        assert time.monotonic() - start < 1.0
+        await asyncio.sleep(0)
+        assert cancelled == [True]
+        assert (hedger.hedges_sent, hedger.hedges_won) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_fast_primary_sends_no_hedge(self) -> None:
+        hedger = Hedger()
+        _warm(hedger, "q", 0.5)
+
+        async def call() -> str:
+            return "ok"
+
+        assert await hedger.run("q", call) == "ok"
+        assert hedger.hedges_sent == 0
+
+    @pytest.mark.asyncio
+    async def test_exhausted_budget_waits_for_primary(self) -> None:
+        hedger = Hedger(HedgePolicy(budget_ratio=0.0))
+        _warm(hedger, "q", 0.001)
+        calls: list[int] = []
+
+        async def call() -> str:
+            calls.append(1)
+            await asyncio.sleep(0.02)
+            return "ok"
+
+        assert await hedger.run("q", call) == "ok"
+        assert calls == [1]
+
+    @pytest.mark.asyncio
+    async def test_failed_hedge_falls_back_to_primary(self) -> None:
+        hedger = Hedger()
+        _warm(hedger, "q", 0.01)
+        delays = iter([0.05, None])
+
+        async def call() -> str:
+            delay = next(delays)
+            if delay is None:
+                raise RuntimeError("hedge failed")
+            await asyncio.sleep(delay)
+            return "primary"
+
+        assert await hedger.run("q", call) == "primary"
+        assert hedger.hedges_won == 0
+
+    @pytest.mark.asyncio
+    async def test_raises_when_every_copy_fails(self) -> None:
+        hedger = Hedger()
+
+        async def call() -> str:
+            raise RuntimeError("down")
+
+        with pytest.raises(RuntimeError, match="down"):
+            await hedger.run("q", call)
+
+
+class FakeSearchBackend:
+    """Search backend whose latency has a Pareto (heavy) tail."""
+
+    def __init__(self, seed: int) -> None:
+        self._rng = random.Random(seed)
+        self.requests = 0
+
+    def latency(self) -> float:
+        if self._rng.random() < 0.05:
+            return min(0.05 * self._rng.paretovariate(1.5), 0.5)
+        return 0.002 + self._rng.random() * 0.002
+
+    async def search(self) -> list[dict[str, str]]:
+        self.requests += 1
+        await asyncio.sleep(self.latency())
+        return [{"url": "https://a.com"}]
+
+
+async def _simulate(hedger: Hedger | None, rounds: int) -> tuple[list[float], int]:
+    """Run search-node-shaped rounds of 3 queries; return round latencies."""
+    backend = FakeSearchBackend(seed=7)
+    latencies: list[float] = []
+    for _ in range(rounds):
+        start = time.monotonic()
+        if hedger is None:
+            calls = [backend.search() for _ in range(3)]
+        else:
+            calls = [hedger.run(f"query-{i}", backend.search) for i in range(3)]
+        await asyncio.gather(*calls)
+        latencies.append(time.monotonic() - start)
+    return latencies, backend.requests
+
+
+def _p95(values: list[float]) -> float:
+    ordered = sorted(values)
+    return ordered[int(0.95 * len(ordered)) - 1]
+
+
+class TestHeavyTailSimulation:
+    @pytest.mark.asyncio
+    async def test_hedging_cuts_tail_within_budget(self) -> None:
+        rounds = 60
+        policy = HedgePolicy(min_samples=10, budget_ratio=0.15)
+        hedger = Hedger(policy)
+
+        plain, plain_requests = await _simulate(None, rounds)
+        hedged, hedged_requests = await _simulate(hedger, rounds)
+
+        assert plain_requests == 3 * rounds
+        extra = hedged_requests - 3 * rounds
+        assert extra == hedger.hedges_sent
+        assert extra <= policy.budget_ratio * 3 * rounds
+        assert hedger.hedges_won > 0
+        assert _p95(hedged) < _p95(plain) / 2
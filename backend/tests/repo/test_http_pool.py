@@ -0,0 +1,116 @@
+"""Tests for backend.repo.http_pool — connection reuse end to end."""
+
+import asyncio
+import json
+from unittest.mock import patch
+
+import pytest
+
+from backend.repo.http_pool import build_async_http_client
+from backend.repo.langchain_client import LangChainResearchClient
+
+CHAT_COMPLETION = {
+    "id": "chatcmpl-1",
+    "object": "chat.completion",
+    "created": 0,
+    "model": "gpt-test",
+    "choices": [
+        {
+            "index": 0,
+            "message": {"role": "assistant", "content": "## TL;DR\n- ok"},
+            "finish_reason": "stop",
+        }
+    ],
+    "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+}
+
+SEARCH_RESULTS = {
+    "results": [{"url": "https://a.com", "title": "A", "content": "Ca"}]
+}
+
+
+class FakeProviderServer:
+    """Keep-alive HTTP/1.1 server faking OpenAI and Tavily endpoints."""
+
+    def __init__(self) -> None:
+        self.connections = 0
+        self.requests: list[str] = []
+        self._server: asyncio.Server | None = None
+
+    @property
+    def base_url(self) -> str:
+        port = self._server.sockets[0].getsockname()[1]
+        return f"http://127.0.0.1:{port}"
+
+    async def __aenter__(self) -> "FakeProviderServer":
+        self._server = await asyncio.start_server(
+            self._handle, "127.0.0.1", 0
+        )
+        return self
+
+    async def __aexit__(self, *_exc: object) -> None:
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self.connections += 1
+        try:
+            while request_line := await reader.readline():
+                headers: dict[str, str] = {}
+                while (line := await reader.readline()) not in (b"\r\n", b""):
+                    name, _, value = line.decode().partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                await reader.readexactly(int(headers.get("content-length", 0)))
+                path = request_line.decode().split()[1]
+                self.requests.append(path)
+                body = json.dumps(
+                    SEARCH_RESULTS if path.endswith("/search")
+                    else CHAT_COMPLETION
+                ).encode()
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                    b"Connection: keep-alive\r\n"
+                    + f"Content-Length: {len(body)}\r\n\r\n".encode()
+                    + body
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionResetError):
+            pass
+        finally:
+            writer.close()
+
+
+class TestBuildAsyncHttpClient:
+    @pytest.mark.asyncio
+    async def test_enables_http2_and_keepalive(self) -> None:
+        client = build_async_http_client(max_keepalive=7)
+        pool = client._transport._pool
+        assert pool._http2 is True
+        assert pool._max_keepalive_connections == 7
+        await client.aclose()
+
+
+class TestConnectionReuse:
+    @pytest.mark.asyncio
+    async def test_connections_reused_across_sections_and_runs(self) -> None:
+        async with FakeProviderServer() as server:
+            client = LangChainResearchClient(
+                openai_api_key="sk-test",
+                tavily_api_key="tvly-test",
+                model="gpt-test",
+                openai_base_url=f"{server.base_url}/v1",
+                tavily_base_url=server.base_url,
+            )
+            with patch(
+                "backend.repo.langchain_client.pack_context",
+                side_effect=lambda _prompt, hits, _preambles: "".join(hits),
+            ):
+                await client.run_research("AI news")
+                await client.run_research("AI news")
+            await client.aclose()
+
+        assert len(server.requests) == 12
+        assert server.requests.count("/search") == 6
+        assert server.connections <= 3
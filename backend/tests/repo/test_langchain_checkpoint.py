@@ -0,0 +1,134 @@
+"""Tests for resumable LangGraph runs backed by the SQLite checkpointer."""
+
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from backend.repo.langchain_client import LangChainResearchClient
+from backend.types.enums import ProgressKind
+from backend.types.errors import LangChainError
+
+SEARCH_RESULTS = [{"url": "https://a.com", "title": "A", "content": "Ca"}]
+
+
+def _make_client(checkpoint_path: str) -> LangChainResearchClient:
+    client = LangChainResearchClient(
+        openai_api_key="k",
+        tavily_api_key="k",
+        model="m",
+        checkpoint_path=checkpoint_path,
+    )
+    client._search_client.search = AsyncMock(return_value=SEARCH_RESULTS)
+    client._llm = AsyncMock()
+    return client
+
+
+def _no_packing() -> object:
+    return patch(
+        "backend.repo.langchain_client.pack_context",
+        side_effect=lambda _prompt, hits, _preambles: "\n---\n".join(hits),
+    )
+
+
+class TestResumableRuns:
+    @pytest.mark.asyncio
+    async def test_crash_in_generate_section_resumes_without_search(
+        self, tmp_path: Path
+    ) -> None:
+        path = str(tmp_path / "checkpoints.sqlite3")
+        crashing = _make_client(path)
+        crashing._llm.ainvoke.side_effect = RuntimeError("LLM 500")
+        with _no_packing(), pytest.raises(LangChainError, match="LLM 500"):
+            await crashing.run_research("AI news", run_id="run-1")
+        await crashing.aclose()
+
+        retry = _make_client(path)
+        retry._llm.ainvoke.return_value = MagicMock(content="## TL;DR\n- ok")
+        with _no_packing():
+            markdown = await retry.resume_research("run-1")
+        await retry.aclose()
+
+        retry._search_client.search.assert_not_called()
+        assert retry._llm.ainvoke.await_count == 3
+        assert markdown.count("## TL;DR") == 3
+
+    @pytest.mark.asyncio
+    async def test_run_research_with_same_id_resumes(
+        self, tmp_path: Path
+    ) -> None:
+        path = str(tmp_path / "checkpoints.sqlite3")
+        client = _make_client(path)
+        client._llm.ainvoke.side_effect = [
+            RuntimeError("LLM 500"),
+            MagicMock(content="x"),
+            MagicMock(content="x"),
+        ] + [MagicMock(content="## TL;DR")] * 3
+        with _no_packing():
+            with pytest.raises(LangChainError):
+                await client.run_research("AI news", run_id="run-2")
+            await client.run_research("AI news", run_id="run-2")
+        await client.aclose()
+        assert client._search_client.search.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_rerunning_completed_id_does_fresh_research(
+        self, tmp_path: Path
+    ) -> None:
+        path = str(tmp_path / "checkpoints.sqlite3")
+        client = _make_client(path)
+        client._llm.ainvoke.side_effect = [
+            MagicMock(content="## TL;DR\n- old")
+        ] * 3 + [MagicMock(content="## TL;DR\n- new")] * 3
+        with _no_packing():
+            first = await client.run_research("AI news", run_id="run-3")
+            second = await client.run_research("AI news", run_id="run-3")
+        await client.aclose()
+
+        assert "- old" in first
+        assert "- new" in second
+        assert "- old" not in second
+        assert client._search_client.search.await_count == 6
+        assert client._llm.ainvoke.await_count == 6
+
+    @pytest.mark.asyncio
+    async def test_resume_unknown_run_raises(self, tmp_path: Path) -> None:
+        client = _make_client(str(tmp_path / "checkpoints.sqlite3"))
+        with pytest.raises(LangChainError, match="No interrupted run"):
+            await client.resume_research("missing")
+        await client.aclose()
+
+
+class TestProgressEvents:
+    @pytest.mark.asyncio
+    async def test_streams_search_and_section_milestones(
+        self, tmp_path: Path
+    ) -> None:
+        client = _make_client(str(tmp_path / "checkpoints.sqlite3"))
+        client._llm.ainvoke.return_value = MagicMock(content="## TL;DR\n- ok")
+        events: list[tuple[ProgressKind, dict[str, object]]] = []
+
+        async def on_progress(
+            kind: ProgressKind, data: dict[str, object]
+        ) -> None:
+            events.append((kind, data))
+
+        with _no_packing():
+            markdown = await client.run_research(
+                "AI news", run_id="run-3", on_progress=on_progress
+            )
+        await client.aclose()
+
+        kinds = [kind for kind, _ in events]
+        assert kinds[:2] == [
+            ProgressKind.SEARCH_STARTED,
+            ProgressKind.SEARCH_FINISHED,
+        ]
+        assert events[1][1] == {"hits": 1}
+        sections = [
+            data["section"]
+            for kind, data in events
+            if kind is ProgressKind.SECTION_GENERATED
+        ]
+        assert len(sections) == 3
+        assert markdown.count("## TL;DR") == 3
@@ -1,11 +1,27 @@
 """Tests for backend.repo.langchain_client — LangGraph upgrade."""
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from backend.repo.langchain_client import LangChainResearchClient
-from backend.types.errors import LangChainError
+from backend.config.prompts import ANALYST_ROLE
+from backend.repo.deadline import Deadline
+from backend.repo.hedging import Hedger
+from backend.repo.langchain_client import (
+    PREAMBLE_FIRST_LAYOUT,
+    SECTION_PREAMBLES,
+    LangChainResearchClient,
+)
+from backend.repo.llm_cache import InMemoryLLMCache
+from backend.repo.search_cache import SearchCache
+from backend.types.errors import (
+    CircuitOpenError,
+    DeadlineExceededError,
+    LangChainError,
+)
+from backend.types.routing import SectionRoute
 
 
 class TestLangChainResearchClientInit:
@@ -17,6 +33,15 @@ class TestLangChainResearchClientInit:
         )
         assert client.model == "gpt-5-mini"
 
+    def test_init_rejects_unknown_message_layout(self) -> None:
+        with pytest.raises(ValueError, match="layout"):
+            LangChainResearchClient(
+                openai_api_key="k",
+                tavily_api_key="k",
+                model="m",
+                message_layout="sideways",
+            )
+
     def test_init_accepts_checkpoint_path(self) -> None:
         client = LangChainResearchClient(
             openai_api_key="test-openai",
@@ -43,6 +68,8 @@ def _make_state(
     base: dict[str, object] = {
         "prompt": prompt,
         "search_context": "",
+        "search_hits": [],
+        "duplicate_tokens_saved": 0,
         "full_prompt": "",
         "section_results": [],
         "combined_markdown": "",
@@ -53,14 +80,13 @@ def _make_state(
     return base
 
 
-def _patch_tavily(
-    side_effect: object = None,
-) -> tuple[AsyncMock, MagicMock]:
-    """Create a mock TavilySearch for patching."""
+def _patch_search(
+    client: LangChainResearchClient, side_effect: object = None
+) -> AsyncMock:
+    """Replace the client's Tavily search with an AsyncMock."""
     mock_fn = AsyncMock(side_effect=side_effect, return_value=[])
-    instance = MagicMock()
-    instance.ainvoke = mock_fn
-    return mock_fn, instance
+    client._search_client.search = mock_fn
+    return mock_fn
 
 
 class TestRunResearch:
@@ -111,26 +137,164 @@ def _make_search_results() -> list[list[dict[str, str]]]:
 class TestSearchNode:
     @pytest.mark.asyncio
     async def test_parallel_search_deduplicates_urls(self) -> None:
-        mock_fn, instance = _patch_tavily(
-            side_effect=_make_search_results()
+        client = _make_client()
+        _patch_search(client, side_effect=_make_search_results())
+        ctx = (await client._search_node(
+            _make_state(prompt="AI research")
+        ))["search_context"]
+        assert ctx.count("https://a.com") == 1
+        assert "https://b.com" in ctx
+        assert "https://c.com" in ctx
+        assert "https://d.com" in ctx
+
+    @pytest.mark.asyncio
+    async def test_keeps_each_hit_separately(self) -> None:
+        client = _make_client()
+        _patch_search(client, side_effect=_make_search_results())
+        update = await client._search_node(_make_state(prompt="AI research"))
+        hits = update["search_hits"]
+        assert len(hits) == 4
+        assert hits[0] == "Title: A\nURL: https://a.com\nContent: Ca"
+        assert update["search_context"] == "\n---\n".join(hits)
+
+    @pytest.mark.asyncio
+    async def test_drops_syndicated_copies_and_records_savings(self) -> None:
+        story = (
+            "OpenAI released a new reasoning model on Tuesday that tops "
+            "coding and math benchmarks at a lower price, the company said."
+        )
+        batches = [
+            [{"url": "https://blog.example/x", "title": "T", "content": story}],
+            [{"url": "https://www.reuters.com/x", "title": "T", "content": story}],
+            [{"url": "https://d.com", "title": "D", "content": "Cd"}],
+        ]
+        client = _make_client()
+        _patch_search(client, side_effect=batches)
+        with patch(
+            "backend.repo.langchain_client.count_tokens", return_value=42
+        ):
+            update = await client._search_node(_make_state(prompt="AI"))
+        urls = " ".join(update["search_hits"])
+        assert "https://www.reuters.com/x" in urls
+        assert "https://blog.example/x" not in urls
+        assert update["duplicate_tokens_saved"] == 42
+
+    @pytest.mark.parametrize(
+        ("strategy", "expected"),
+        [
+            ("fan-out", "(126 across 3 sections)"),
+            ("single-call", "(42 across 1 sections)"),
+            ("map-reduce", "saving 42 summarizer tokens"),
+        ],
+    )
+    def test_savings_log_matches_strategy(
+        self, strategy: str, expected: str, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        story = "OpenAI released a new reasoning model that tops benchmarks."
+        items = [
+            {"url": "https://blog.example/x", "title": "T", "content": story},
+            {"url": "https://www.reuters.com/x", "title": "T", "content": story},
+        ]
+        client = LangChainResearchClient(
+            openai_api_key="k", tavily_api_key="k", model="m",
+            strategy=strategy,
+        )
+        with (
+            patch("backend.repo.langchain_client.count_tokens", return_value=42),
+            caplog.at_level("INFO", logger="backend.repo.langchain_client"),
+        ):
+            client._drop_near_duplicates(items)
+        assert expected in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_near_duplicate_filter_can_be_disabled(self) -> None:
+        client = LangChainResearchClient(
+            openai_api_key="k",
+            tavily_api_key="k",
+            model="m",
+            near_duplicate_threshold=None,
+        )
+        same = {"title": "T", "content": "identical syndicated wire copy text"}
+        _patch_search(
+            client,
+            side_effect=[
+                [{"url": "https://a.com", **same}],
+                [{"url": "https://b.com", **same}],
+                [],
+            ],
+        )
+        update = await client._search_node(_make_state(prompt="AI"))
+        assert len(update["search_hits"]) == 2
+        assert update["duplicate_tokens_saved"] == 0
+
+    @pytest.mark.asyncio
+    async def test_one_failed_query_keeps_the_rest(self) -> None:
+        client = _make_client()
+        batches = _make_search_results()
+        _patch_search(client, side_effect=[*batches[:2], RuntimeError("502")])
+        update = await client._search_node(_make_state(prompt="AI"))
+        assert len(update["search_hits"]) == 3
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_fails_the_search(self) -> None:
+        client = _make_client()
+        batches = _make_search_results()
+        _patch_search(
+            client,
+            side_effect=[*batches[:2], CircuitOpenError("tavily circuit open")],
         )
-        with patch("langchain_tavily.TavilySearch", return_value=instance):
-            ctx = (await _make_client()._search_node(
-                _make_state(prompt="AI research")
-            ))["search_context"]
-            assert ctx.count("https://a.com") == 1
-            assert "https://b.com" in ctx
-            assert "https://c.com" in ctx
-            assert "https://d.com" in ctx
+        with pytest.raises(CircuitOpenError):
+            await client._search_node(_make_state(prompt="AI"))
+
+    @pytest.mark.asyncio
+    async def test_every_query_failing_fails_the_search(self) -> None:
+        client = _make_client()
+        _patch_search(client, side_effect=RuntimeError("502"))
+        with pytest.raises(LangChainError, match="All 3 searches failed"):
+            await client._search_node(_make_state(prompt="AI"))
 
     @pytest.mark.asyncio
     async def test_search_uses_three_queries(self) -> None:
-        mock_fn, instance = _patch_tavily()
-        with patch("langchain_tavily.TavilySearch", return_value=instance):
-            await _make_client()._search_node(
-                _make_state(prompt="AI research")
-            )
-            assert mock_fn.call_count == 3
+        client = _make_client()
+        mock_fn = _patch_search(client)
+        await client._search_node(_make_state(prompt="AI research"))
+        assert mock_fn.call_count == 3
+
+
+    @pytest.mark.asyncio
+    async def test_search_cache_consulted_first(self) -> None:
+        client = LangChainResearchClient(
+            openai_api_key="k",
+            tavily_api_key="k",
+            model="m",
+            search_cache=SearchCache(),
+        )
+        mock_fn = _patch_search(client, side_effect=_make_search_results())
+        state = _make_state(prompt="AI research")
+        first = await client._search_node(state)
+        second = await client._search_node(state)
+        assert mock_fn.call_count == 3
+        assert first == second
+        assert client._search_cache.stats()["hits"] == 3
+
+    @pytest.mark.asyncio
+    async def test_hedger_tracks_each_query_slot(self) -> None:
+        hedger = Hedger()
+        client = LangChainResearchClient(
+            openai_api_key="k",
+            tavily_api_key="k",
+            model="m",
+            search_hedger=hedger,
+        )
+        mock_fn = _patch_search(client, side_effect=_make_search_results())
+        update = await client._search_node(_make_state(prompt="AI research"))
+        assert mock_fn.call_count == 3
+        assert len(update["search_hits"]) == 4
+        assert set(hedger._latencies._samples) == {
+            "query-0",
+            "query-1",
+            "query-2",
+        }
 
 
 class TestComposeContextNode:
@@ -144,6 +308,25 @@ class TestComposeContextNode:
         assert "Research prompt" in result["full_prompt"]
         assert "Search result data" in result["full_prompt"]
 
+    def test_packs_hits_with_section_preambles(self) -> None:
+        client = _make_client()
+        state = _make_state(
+            prompt="AI funding news",
+            search_hits=["Title: funding round", "Title: weather"],
+        )
+        with patch(
+            "backend.repo.langchain_client.pack_context",
+            return_value="Title: funding round",
+        ) as packer:
+            result = client._compose_context_node(state)
+        args = packer.call_args.args
+        assert args[0] == "AI funding news"
+        assert args[1] == ["Title: funding round", "Title: weather"]
+        assert len(list(args[2])) == 3
+        assert result["full_prompt"] == (
+            "AI funding news\n\nSearch context:\nTitle: funding round"
+        )
+
 
 class TestGenerateSectionNode:
     @pytest.mark.asyncio
@@ -152,22 +335,258 @@ class TestGenerateSectionNode:
         mock_response = MagicMock()
         mock_response.content = "## TL;DR\n- Item 1"
 
-        with patch(
-            "langchain_openai.ChatOpenAI"
-        ) as mock_llm_cls:
-            mock_llm = AsyncMock()
-            mock_llm.ainvoke.return_value = mock_response
-            mock_llm_cls.return_value = mock_llm
-
-            section_state = {
-                "section_name": "tldr",
-                "preamble": "Produce TL;DR only",
-                "full_prompt": "Full research prompt",
-            }
-            result = await client._generate_section_node(section_state)
-            assert len(result["section_results"]) == 1
-            assert result["section_results"][0]["section_name"] == "tldr"
-            assert "TL;DR" in result["section_results"][0]["content"]
+        client._llm = AsyncMock()
+        client._llm.ainvoke.return_value = mock_response
+
+        section_state = {
+            "section_name": "tldr",
+            "preamble": "Produce TL;DR only",
+            "full_prompt": "Full research prompt",
+        }
+        result = await client._generate_section_node(section_state)
+        assert len(result["section_results"]) == 1
+        assert result["section_results"][0]["section_name"] == "tldr"
+        assert "TL;DR" in result["section_results"][0]["content"]
+
+
+    @pytest.mark.asyncio
+    async def test_response_cache_skips_repeat_calls(self) -> None:
+        client = LangChainResearchClient(
+            openai_api_key="k",
+            tavily_api_key="k",
+            model="m",
+            llm_cache=InMemoryLLMCache(),
+        )
+        client._llm = AsyncMock()
+        client._llm.ainvoke.return_value = MagicMock(content="## TL;DR")
+        state = {
+            "section_name": "tldr",
+            "preamble": "Produce TL;DR only",
+            "full_prompt": "Full research prompt",
+        }
+        first = await client._generate_section_node(state)
+        second = await client._generate_section_node(state)
+        content = [r["section_results"][0]["content"] for r in (first, second)]
+        assert content == ["## TL;DR", "## TL;DR"]
+        client._llm.ainvoke.assert_awaited_once()
+        assert client._llm_cache.stats()["hit_rate"] == 0.5
+
+    @pytest.mark.asyncio
+    async def test_response_cache_opt_out_per_run(self) -> None:
+        cache = InMemoryLLMCache()
+        client = LangChainResearchClient(
+            openai_api_key="k", tavily_api_key="k", model="m", llm_cache=cache
+        )
+        client._llm = AsyncMock()
+        client._llm.ainvoke.return_value = MagicMock(content="## TL;DR")
+        state = {
+            "section_name": "tldr",
+            "preamble": "Produce TL;DR only",
+            "full_prompt": "Full research prompt",
+        }
+        config = client._build_run_config("r1", use_cache=False)
+        await client._generate_section_node(state, config)
+        await client._generate_section_node(state, config)
+        assert client._llm.ainvoke.await_count == 2
+        assert cache.stats()["hits"] + cache.stats()["misses"] == 0
+
+
+class TestSectionMessageLayout:
+    def _messages(self, client: LangChainResearchClient) -> list[list[dict]]:
+        return [
+            client._build_section_messages(
+                {
+                    "section_name": name,
+                    "preamble": preamble,
+                    "full_prompt": "Shared prompt and search context",
+                }
+            )
+            for name, preamble in SECTION_PREAMBLES.items()
+        ]
+
+    def test_shared_prefix_puts_common_prompt_first(self) -> None:
+        calls = self._messages(_make_client())
+        assert all(msgs[:2] == calls[0][:2] for msgs in calls)
+        assert calls[0][1] == {
+            "role": "user",
+            "content": "Shared prompt and search context",
+        }
+        assert [msgs[-1]["content"] for msgs in calls] == [
+            preamble.removeprefix(ANALYST_ROLE).strip()
+            for preamble in SECTION_PREAMBLES.values()
+        ]
+
+    def test_shared_prefix_keeps_system_role_first(self) -> None:
+        for msgs in self._messages(_make_client()):
+            assert [m["role"] for m in msgs] == ["system", "user", "user"]
+            assert msgs[0]["content"] == ANALYST_ROLE
+            assert msgs[-1]["content"].startswith("Produce")
+
+    def test_preamble_first_layout_keeps_legacy_order(self) -> None:
+        client = LangChainResearchClient(
+            openai_api_key="k",
+            tavily_api_key="k",
+            model="m",
+            message_layout=PREAMBLE_FIRST_LAYOUT,
+        )
+        msgs = self._messages(client)[0]
+        assert msgs[0]["role"] == "system"
+        assert msgs[1]["content"] == "Shared prompt and search context"
+
+    @pytest.mark.asyncio
+    async def test_records_cached_token_usage(self) -> None:
+        client = _make_client()
+        response = MagicMock(content="## TL;DR\n- Item")
+        response.usage_metadata = {
+            "input_tokens": 5000,
+            "output_tokens": 300,
+            "total_tokens": 5300,
+            "input_token_details": {"cache_read": 4096},
+        }
+        client._llm = AsyncMock()
+        client._llm.ainvoke.return_value = response
+        result = await client._generate_section_node(
+            {"section_name": "tldr", "preamble": "p", "full_prompt": "f"}
+        )
+        section = result["section_results"][0]
+        assert section["input_tokens"] == 5000
+        assert section["cached_tokens"] == 4096
+        assert section["output_tokens"] == 300
+
+
+class TestSectionRouting:
+    def _routed_client(self) -> LangChainResearchClient:
+        return LangChainResearchClient(
+            openai_api_key="k",
+            tavily_api_key="k",
+            model="gpt-4.1",
+            section_routes={
+                "tldr": SectionRoute(model="gpt-4.1-nano", max_tokens=500),
+                "dives_audit": SectionRoute(temperature=0.2),
+            },
+        )
+
+    def test_routes_build_per_section_models(self) -> None:
+        client = self._routed_client()
+        model, llm, params = client._llm_for("tldr")
+        assert model == "gpt-4.1-nano"
+        assert llm.model_name == "gpt-4.1-nano"
+        assert params["max_tokens"] == 500
+        model, _, params = client._llm_for("dives_audit")
+        assert model == "gpt-4.1"
+        assert params["temperature"] == 0.2
+
+    def test_unrouted_section_uses_default_llm(self) -> None:
+        client = self._routed_client()
+        assert client._llm_for("events") == (
+            "gpt-4.1",
+            client._llm,
+            client._generation_params,
+        )
+
+    @pytest.mark.asyncio
+    async def test_section_uses_routed_llm_and_records_metrics(self) -> None:
+        client = self._routed_client()
+        routed = AsyncMock()
+        routed.ainvoke.return_value = MagicMock(content="## TL;DR\n- x")
+        model, _, params = client._section_llms["tldr"]
+        client._section_llms["tldr"] = (model, routed, params)
+        client._llm = AsyncMock()
+        result = await client._generate_section_node(
+            {"section_name": "tldr", "preamble": "p", "full_prompt": "f"}
+        )
+        routed.ainvoke.assert_awaited_once()
+        client._llm.ainvoke.assert_not_awaited()
+        section = result["section_results"][0]
+        assert section["model"] == "gpt-4.1-nano"
+        assert section["latency_seconds"] >= 0
+
+    @pytest.mark.asyncio
+    async def test_cache_key_includes_routed_model(self) -> None:
+        cache = InMemoryLLMCache()
+        client = LangChainResearchClient(
+            openai_api_key="k",
+            tavily_api_key="k",
+            model="gpt-5-mini",
+            llm_cache=cache,
+            section_routes={"events": SectionRoute(model="gpt-5")},
+        )
+        for name in ("tldr", "events"):
+            model, _, params = client._llm_for(name)
+            llm = AsyncMock()
+            llm.ainvoke.return_value = MagicMock(content=f"from {model}")
+            if name in client._section_llms:
+                client._section_llms[name] = (model, llm, params)
+            else:
+                client._llm = llm
+        messages = [{"role": "user", "content": "same prompt"}]
+        default, _ = await client._invoke_llm(messages, None, "tldr")
+        routed, _ = await client._invoke_llm(messages, None, "events")
+        assert (default, routed) == ("from gpt-5-mini", "from gpt-5")
+
+
+def _deadline_config(
+    deadline: Deadline, timings: dict[str, float]
+) -> dict[str, object]:
+    return {"configurable": {"deadline": deadline, "timings": timings}}
+
+
+class TestDeadlinePropagation:
+    @pytest.mark.asyncio
+    async def test_search_is_bounded_by_remaining_budget(self) -> None:
+        client = _make_client()
+
+        async def hang(*_args: object, **_kwargs: object) -> list[object]:
+            await asyncio.sleep(10)
+            return []
+
+        _patch_search(client, side_effect=hang)
+        timings: dict[str, float] = {}
+        config = _deadline_config(Deadline(0.02), timings)
+        with pytest.raises(DeadlineExceededError, match="search"):
+            await client._search_node(_make_state(prompt="AI"), config)
+        assert timings == {}
+
+    @pytest.mark.asyncio
+    async def test_expired_deadline_starts_no_searches(self) -> None:
+        client = _make_client()
+        search = _patch_search(client, side_effect=_make_search_results())
+        config = _deadline_config(Deadline(0.0), {})
+        before = asyncio.all_tasks()
+        with pytest.raises(DeadlineExceededError, match="search"):
+            await client._search_node(_make_state(prompt="AI"), config)
+        await asyncio.sleep(0)
+        assert asyncio.all_tasks() == before
+        search.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_search_records_its_timing(self) -> None:
+        client = _make_client()
+        _patch_search(client, side_effect=_make_search_results())
+        timings: dict[str, float] = {}
+        config = _deadline_config(Deadline(5.0), timings)
+        await client._search_node(_make_state(prompt="AI"), config)
+        assert list(timings) == ["search"]
+
+    @pytest.mark.asyncio
+    async def test_expired_deadline_skips_llm_call(self) -> None:
+        client = _make_client()
+        client._llm = AsyncMock()
+        deadline = Deadline(0.0)
+        messages = [{"role": "user", "content": "p"}]
+        config = _deadline_config(deadline, {})
+        with pytest.raises(DeadlineExceededError, match="section tldr"):
+            await client._invoke_llm(messages, config, "tldr")
+        client._llm.ainvoke.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_deadline_error_is_not_wrapped(self) -> None:
+        client = _make_client()
+        client._execute_research = AsyncMock(
+            side_effect=DeadlineExceededError("expired")
+        )
+        with pytest.raises(DeadlineExceededError):
+            await client.run_research("p", deadline=Deadline(1.0))
 
 
 class TestCombineResultsNode:
@@ -189,6 +608,28 @@ class TestCombineResultsNode:
         result = _make_client()._combine_results_node(state)
         assert "TL;DR" in result["combined_markdown"]
 
+    def test_single_call_report_used_as_is(self) -> None:
+        state = _make_state(section_results=[
+            {"section_name": "full_report", "content": "## TL;DR\n- All"},
+        ])
+        result = _make_client()._combine_results_node(state)
+        assert result["combined_markdown"] == "## TL;DR\n- All"
+
+    def test_totals_token_usage_across_sections(self) -> None:
+        state = _make_state(section_results=[
+            {"section_name": "tldr", "content": "a", "input_tokens": 100,
+             "cached_tokens": 0, "output_tokens": 10},
+            {"section_name": "events", "content": "b", "input_tokens": 100,
+             "cached_tokens": 80, "output_tokens": 20},
+            {"section_name": "dives_audit", "content": "c"},
+        ])
+        usage = _make_client()._combine_results_node(state)["token_usage"]
+        assert usage == {
+            "input_tokens": 200,
+            "cached_tokens": 80,
+            "output_tokens": 30,
+        }
+
 
 class TestGraphRouting:
     def test_route_to_sections_returns_three_sends(self) -> None:
@@ -207,8 +648,94 @@ class TestGraphRouting:
         assert len(set(s.arg["preamble"] for s in sends)) == 3
 
 
+    def test_single_call_routes_one_full_report(self) -> None:
+        client = LangChainResearchClient(
+            openai_api_key="k", tavily_api_key="k", model="m",
+            strategy="single-call",
+        )
+        sends = client._route_to_sections(_make_state(full_prompt="Prompt"))
+        assert [s.arg["section_name"] for s in sends] == ["full_report"]
+
+    def test_map_reduce_routes_chunks_to_summarizers(self) -> None:
+        client = LangChainResearchClient(
+            openai_api_key="k", tavily_api_key="k", model="m",
+            strategy="map-reduce",
+        )
+        state = _make_state(prompt="P", search_hits=["h1", "h2", "h3"])
+        with patch(
+            "backend.repo.langchain_client.chunk_hits",
+            return_value=["h1\n---\nh2", "h3"],
+        ):
+            sends = client._route_from_context(state)
+        assert [s.node for s in sends] == ["summarize_chunk"] * 2
+        assert [s.arg["chunk_index"] for s in sends] == [0, 1]
+
+    def test_map_reduce_without_hits_goes_to_sections(self) -> None:
+        client = LangChainResearchClient(
+            openai_api_key="k", tavily_api_key="k", model="m",
+            strategy="map-reduce",
+        )
+        sends = client._route_from_context(_make_state(full_prompt="P"))
+        assert {s.node for s in sends} == {"generate_section"}
+
+    def test_condense_orders_chunk_summaries(self) -> None:
+        state = _make_state(prompt="P", chunk_summaries=[
+            {"chunk_index": 1, "summary": "second"},
+            {"chunk_index": 0, "summary": "first"},
+        ])
+        result = _make_client()._condense_context_node(state)
+        assert result["full_prompt"] == (
+            "P\n\nSearch context:\nfirst\n---\nsecond"
+        )
+
+    def test_unknown_strategy_rejected(self) -> None:
+        with pytest.raises(ValueError, match="strategy"):
+            LangChainResearchClient(
+                openai_api_key="k", tavily_api_key="k", model="m",
+                strategy="round-robin",
+            )
+
+
 class TestGraphCompilation:
     def test_build_graph_returns_compiled_graph(self) -> None:
         graph = _make_client()._build_graph()
         assert graph is not None
         assert hasattr(graph, "ainvoke")
+
+    def test_graph_is_compiled_once(self) -> None:
+        client = _make_client()
+        with patch.object(
+            client, "_build_graph", wraps=client._build_graph
+        ) as mock_build:
+            first = client.graph
+            second = client.graph
+        assert first is second
+        mock_build.assert_called_once()
+
+    def test_graph_built_once_under_concurrent_access(self) -> None:
+        client = _make_client()
+        with patch.object(
+            client, "_build_graph", wraps=client._build_graph
+        ) as mock_build:
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                graphs = list(pool.map(lambda _: client.graph, range(32)))
+        assert all(g is graphs[0] for g in graphs)
+        mock_build.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_execute_research_reuses_graph(self) -> None:
+        client = _make_client()
+        fake_graph = MagicMock()
+        fake_graph.ainvoke = AsyncMock(
+            return_value={"combined_markdown": "## TL;DR"}
+        )
+        fake_graph.aget_state = AsyncMock(
+            return_value=MagicMock(next=(), values={})
+        )
+        client._checkpointer = MagicMock()
+        client._graph = fake_graph
+        with patch.object(client, "_build_graph") as mock_build:
+            await client._execute_research("p1")
+            await client._execute_research("p2")
+        mock_build.assert_not_called()
+        assert fake_graph.ainvoke.await_count == 2
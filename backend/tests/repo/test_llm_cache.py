@@ -0,0 +1,78 @@
+"""Tests for backend.repo.llm_cache."""
+
+from pathlib import Path
+
+import pytest
+
+from backend.repo.llm_cache import (
+    InMemoryLLMCache,
+    LLMResponseCache,
+    SqliteLLMCache,
+    build_llm_cache,
+    make_cache_key,
+)
+
+MESSAGES = [
+    {"role": "system", "content": "Produce TL;DR"},
+    {"role": "user", "content": "Prompt"},
+]
+
+
+class TestMakeCacheKey:
+    def test_stable_for_same_inputs(self) -> None:
+        params = {"temperature": 0.2, "max_tokens": 100}
+        assert make_cache_key("m", MESSAGES, params) == make_cache_key(
+            "m", list(MESSAGES), dict(reversed(params.items()))
+        )
+
+    def test_changes_with_model_messages_or_params(self) -> None:
+        base = make_cache_key("m", MESSAGES, {})
+        assert make_cache_key("m2", MESSAGES, {}) != base
+        assert make_cache_key("m", MESSAGES[:1], {}) != base
+        assert make_cache_key("m", MESSAGES, {"temperature": 1}) != base
+
+
+class TestLLMResponseCache:
+    def test_backend_methods_are_abstract(self) -> None:
+        with pytest.raises(TypeError):
+            LLMResponseCache()  # type: ignore[abstract]
+
+
+class TestInMemoryLLMCache:
+    def test_hit_rate(self) -> None:
+        cache = InMemoryLLMCache()
+        assert cache.get("k") is None
+        cache.set("k", "response")
+        assert cache.get("k") == "response"
+        assert cache.stats() == {"hits": 1, "misses": 1, "hit_rate": 0.5}
+
+    def test_lru_eviction(self) -> None:
+        cache = InMemoryLLMCache(max_entries=2)
+        cache.set("a", "1")
+        cache.set("b", "2")
+        cache.get("a")
+        cache.set("c", "3")
+        assert cache.get("b") is None
+        assert cache.get("a") == "1"
+
+
+class TestSqliteLLMCache:
+    def test_persists_across_instances(self, tmp_path: Path) -> None:
+        path = str(tmp_path / "llm.sqlite3")
+        SqliteLLMCache(path=path).set("k", "response")
+        assert SqliteLLMCache(path=path).get("k") == "response"
+
+    def test_size_bounded(self) -> None:
+        cache = SqliteLLMCache(path=":memory:", max_entries=1)
+        cache.set("a", "1")
+        cache.set("b", "2")
+        assert cache.get("a") is None
+        assert cache.get("b") == "2"
+
+
+class TestBuildLLMCache:
+    def test_backends(self, tmp_path: Path) -> None:
+        path = str(tmp_path / "llm.sqlite3")
+        assert isinstance(build_llm_cache("memory", path), InMemoryLLMCache)
+        assert isinstance(build_llm_cache("sqlite", path), SqliteLLMCache)
+        assert build_llm_cache("none", path) is None
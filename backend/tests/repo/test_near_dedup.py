@@ -0,0 +1,134 @@
+"""Tests for backend.repo.near_dedup."""
+
+import pytest
+
+from backend.repo.near_dedup import (
+    MinHasher,
+    authority,
+    filter_near_duplicates,
+    jaccard,
+    lsh_shape,
+    shingles,
+)
+
+WIRE_STORY = (
+    "OpenAI announced on Tuesday a new reasoning model that beats previous "
+    "systems on math and coding benchmarks while costing less to run, the "
+    "company said in a statement released to developers worldwide."
+)
+
+
+def _item(url: str, content: str, score: float = 0.5) -> dict[str, object]:
+    return {
+        "url": url,
+        "title": "OpenAI ships new reasoning model",
+        "content": content,
+        "score": score,
+    }
+
+
+class TestShingles:
+    def test_word_shingles_ignore_case_and_punctuation(self) -> None:
+        assert shingles("The new model!") == shingles("the NEW model")
+
+    def test_short_text_is_one_shingle(self) -> None:
+        assert len(shingles("two words")) == 1
+
+    def test_empty_text(self) -> None:
+        assert shingles("") == set()
+
+
+class TestJaccard:
+    def test_identical_sets(self) -> None:
+        assert jaccard({1, 2}, {1, 2}) == 1.0
+
+    def test_disjoint_and_empty_sets(self) -> None:
+        assert jaccard({1}, {2}) == 0.0
+        assert jaccard(set(), set()) == 0.0
+
+
+class TestMinHasher:
+    def test_signature_estimates_jaccard(self) -> None:
+        a = set(range(0, 1000))
+        b = set(range(200, 1200))
+        hasher = MinHasher(num_perm=256)
+        sig_a, sig_b = hasher.signature(a), hasher.signature(b)
+        estimate = sum(x == y for x, y in zip(sig_a, sig_b)) / 256
+        assert estimate == pytest.approx(jaccard(a, b), abs=0.1)
+
+    def test_empty_set_has_empty_signature(self) -> None:
+        assert MinHasher().signature(set()) == ()
+
+
+class TestAuthority:
+    def test_wire_service_outranks_higher_score(self) -> None:
+        wire = authority({"url": "https://www.reuters.com/x", "score": 0.1})
+        blog = authority({"url": "https://blog.example.com/x", "score": 0.9})
+        assert wire > blog
+
+    def test_missing_or_bad_score(self) -> None:
+        assert authority({"url": "https://a.com", "score": "n/a"}) == (0, 0.0)
+        assert authority({}) == (0, 0.0)
+
+
+class TestLshShape:
+    @pytest.mark.parametrize("threshold", [0.5, 0.8, 0.95])
+    def test_shape_covers_all_permutations(self, threshold: float) -> None:
+        bands, rows = lsh_shape(64, threshold)
+        assert bands * rows == 64
+        assert 1 - (1 - threshold**rows) ** bands >= 0.95
+
+    def test_higher_threshold_uses_more_rows(self) -> None:
+        assert lsh_shape(64, 0.95)[1] >= lsh_shape(64, 0.5)[1]
+
+
+class TestFilterNearDuplicates:
+    def test_keeps_most_authoritative_copy(self) -> None:
+        items = [
+            _item("https://aggregator.example/a", WIRE_STORY + " Via wire."),
+            _item("https://www.reuters.com/tech/a", WIRE_STORY, score=0.2),
+            _item("https://news.example/b", WIRE_STORY, score=0.9),
+        ]
+        kept, dropped = filter_near_duplicates(items, threshold=0.8)
+        assert kept == [1]
+        assert sorted(dropped) == [0, 2]
+
+    def test_falls_back_to_score_and_position(self) -> None:
+        items = [
+            _item("https://a.example/1", WIRE_STORY, score=0.3),
+            _item("https://b.example/2", WIRE_STORY, score=0.7),
+            _item("https://c.example/3", WIRE_STORY, score=0.7),
+        ]
+        kept, _ = filter_near_duplicates(items)
+        assert kept == [1]
+
+    def test_distinct_stories_are_kept_in_order(self) -> None:
+        items = [
+            _item("https://a.example", "Anthropic raises a funding round."),
+            _item("https://b.example", WIRE_STORY),
+            _item("https://c.example", "EU passes new AI regulation today."),
+        ]
+        kept, dropped = filter_near_duplicates(items)
+        assert kept == [0, 1, 2]
+        assert dropped == []
+
+    def test_threshold_is_configurable(self) -> None:
+        edited = WIRE_STORY.replace("Tuesday", "Wednesday").replace(
+            "worldwide", "everywhere in the world"
+        )
+        items = [
+            _item("https://a.example", WIRE_STORY),
+            _item("https://b.example", edited),
+        ]
+        similarity = jaccard(
+            shingles(f"{items[0]['title']} {WIRE_STORY}"),
+            shingles(f"{items[1]['title']} {edited}"),
+        )
+        assert filter_near_duplicates(items, threshold=similarity - 0.05)[1]
+        assert not filter_near_duplicates(items, threshold=similarity + 0.05)[1]
+
+    def test_empty_hits_are_kept(self) -> None:
+        items = [{"url": "https://a.example"}, {"url": "https://b.example"}]
+        kept, dropped = filter_near_duplicates(items)
+        assert kept == [0, 1]
+        assert dropped == []
@@ -0,0 +1,211 @@
+"""Tests for backend.repo.rate_limiter."""
+
+import httpx
+import pytest
+
+from backend.repo.circuit_breaker import CircuitBreaker
+from backend.repo.rate_limiter import (
+    ProviderLimiter,
+    TokenBucket,
+    is_retryable,
+    retry_after_of,
+    status_code_of,
+)
+from backend.types.errors import CircuitOpenError
+from backend.types.resilience import CircuitPolicy, RetryPolicy
+
+
+class FakeClock:
+    """Manual clock whose sleep advances time instead of blocking."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def _status_error(status: int, headers: dict[str, str] | None = None) -> Exception:
+    request = httpx.Request("POST", "https://api.test")
+    response = httpx.Response(status, headers=headers, request=request)
+    return httpx.HTTPStatusError("boom", request=request, response=response)
+
+
+def _limiter(clock: FakeClock, **kwargs: object) -> ProviderLimiter:
+    return ProviderLimiter(
+        "test", clock=clock, sleep=clock.sleep, jitter=lambda: 1.0, **kwargs
+    )
+
+
+class TestErrorClassification:
+    def test_reads_status_from_response(self) -> None:
+        assert status_code_of(_status_error(503)) == 503
+
+    def test_reads_status_attribute(self) -> None:
+        exc = Exception("x")
+        exc.status_code = 429  # type: ignore[attr-defined]
+        assert status_code_of(exc) == 429
+
+    def test_throttling_and_server_errors_retry(self) -> None:
+        assert is_retryable(_status_error(429))
+        assert is_retryable(_status_error(502))
+        assert is_retryable(httpx.ConnectError("down"))
+
+    def test_client_errors_do_not_retry(self) -> None:
+        assert not is_retryable(_status_error(400))
+        assert not is_retryable(ValueError("bad"))
+
+    def test_retry_after_seconds(self) -> None:
+        assert retry_after_of(_status_error(429, {"retry-after": "7"})) == 7.0
+
+    def test_retry_after_ms_wins(self) -> None:
+        exc = _status_error(429, {"retry-after-ms": "250", "retry-after": "7"})
+        assert retry_after_of(exc) == 0.25
+
+    def test_retry_after_http_date_in_past(self) -> None:
+        exc = _status_error(
+            429, {"retry-after": "Wed, 21 Oct 2015 07:28:00 GMT"}
+        )
+        assert retry_after_of(exc) == 0.0
+
+    def test_missing_retry_after(self) -> None:
+        assert retry_after_of(_status_error(429)) is None
+
+
+class TestTokenBucket:
+    def test_full_bucket_does_not_wait(self) -> None:
+        clock = FakeClock()
+        bucket = TokenBucket(60, clock)
+        assert bucket.reserve(60) == 0.0
+
+    def test_empty_bucket_queues_callers_in_order(self) -> None:
+        clock = FakeClock()
+        bucket = TokenBucket(60, clock)
+        bucket.reserve(60)
+        assert bucket.reserve(1) == pytest.approx(1.0)
+        assert bucket.reserve(1) == pytest.approx(2.0)
+
+    def test_refills_over_time(self) -> None:
+        clock = FakeClock()
+        bucket = TokenBucket(60, clock)
+        bucket.reserve(60)
+        clock.now = 30.0
+        assert bucket.reserve(30) == 0.0
+
+    def test_refund_returns_tokens(self) -> None:
+        clock = FakeClock()
+        bucket = TokenBucket(60, clock)
+        bucket.reserve(60)
+        bucket.adjust(-10)
+        assert bucket.reserve(10) == 0.0
+
+
+class TestProviderLimiter:
+    @pytest.mark.asyncio
+    async def test_queues_when_rpm_exhausted(self) -> None:
+        clock = FakeClock()
+        limiter = _limiter(clock, rpm=2)
+
+        async def call() -> str:
+            return "ok"
+
+        for _ in range(3):
+            assert await limiter.run(call) == "ok"
+        assert clock.sleeps == [pytest.approx(30.0)]
+
+    @pytest.mark.asyncio
+    async def test_token_quota_uses_estimate_then_settles(self) -> None:
+        clock = FakeClock()
+        limiter = _limiter(clock, tpm=1000)
+        await limiter.acquire(900)
+        limiter.settle(900, 100)
+        await limiter.acquire(800)
+        assert clock.sleeps == []
+
+    @pytest.mark.asyncio
+    async def test_honours_retry_after_and_pauses_provider(self) -> None:
+        clock = FakeClock()
+        limiter = _limiter(clock)
+        outcomes = [_status_error(429, {"retry-after": "5"}), "ok"]
+
+        async def call() -> str:
+            outcome = outcomes.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        assert await limiter.run(call) == "ok"
+        assert clock.sleeps == [5.0]
+
+        limiter.pause(3.0)
+        await limiter.acquire()
+        assert clock.sleeps[-1] == pytest.approx(3.0)
+
+    @pytest.mark.asyncio
+    async def test_exponential_backoff_is_capped(self) -> None:
+        clock = FakeClock()
+        policy = RetryPolicy(
+            max_attempts=5, base_delay_seconds=1.0, max_delay_seconds=3.0
+        )
+        limiter = _limiter(clock, policy=policy)
+
+        async def call() -> None:
+            raise _status_error(503)
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await limiter.run(call)
+        assert clock.sleeps == [1.0, 2.0, 3.0, 3.0]
+
+    def test_full_jitter_scales_backoff(self) -> None:
+        limiter = ProviderLimiter("test", jitter=lambda: 0.5)
+        assert limiter.backoff_seconds(3, None) == 2.0
+
+    @pytest.mark.asyncio
+    async def test_non_retryable_raises_immediately(self) -> None:
+        clock = FakeClock()
+        limiter = _limiter(clock)
+        calls: list[int] = []
+
+        async def call() -> None:
+            calls.append(1)
+            raise ValueError("bad request")
+
+        with pytest.raises(ValueError):
+            await limiter.run(call)
+        assert calls == [1]
+        assert clock.sleeps == []
+
+
+class TestLimiterWithBreaker:
+    @pytest.mark.asyncio
+    async def test_failed_attempts_open_breaker_and_stop_retries(self) -> None:
+        clock = FakeClock()
+        breaker = CircuitBreaker("test", CircuitPolicy(min_calls=2), clock)
+        limiter = _limiter(clock, breaker=breaker)
+        calls: list[int] = []
+
+        async def call() -> None:
+            calls.append(1)
+            raise _status_error(503)
+
+        with pytest.raises(CircuitOpenError):
+            await limiter.run(call)
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_client_errors_do_not_count_as_failures(self) -> None:
+        clock = FakeClock()
+        breaker = CircuitBreaker("test", CircuitPolicy(min_calls=1), clock)
+        limiter = _limiter(clock, breaker=breaker)
+
+        async def call() -> None:
+            raise ValueError("bad request")
+
+        with pytest.raises(ValueError):
+            await limiter.run(call)
+        assert breaker.status().failure_rate == 0.0
@@ -0,0 +1,75 @@
+"""Tests for backend.repo.run_store."""
+
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from backend.repo.run_store import RunStore
+from backend.types.enums import ResearchStatus
+from backend.types.runs import ResearchRun
+
+T0 = datetime(2026, 2, 28, tzinfo=timezone.utc)
+
+
+def _run(
+    run_id: str,
+    date: str = "2026-02-28",
+    status: ResearchStatus = ResearchStatus.PENDING,
+    offset: int = 0,
+) -> ResearchRun:
+    return ResearchRun(
+        run_id=run_id,
+        date=date,
+        report_id=f"rpt-{date}",
+        status=status,
+        created_at=T0 + timedelta(seconds=offset),
+    )
+
+
+class TestRunStore:
+    def test_save_and_get_round_trip(self) -> None:
+        store = RunStore()
+        run = _run("run-1")
+        store.save(run)
+        assert store.get("run-1") == run
+        assert store.get("run-missing") is None
+
+    def test_save_updates_existing_run(self) -> None:
+        store = RunStore()
+        store.save(_run("run-1"))
+        store.save(_run("run-1", status=ResearchStatus.COMPLETED))
+        assert store.get("run-1").status == ResearchStatus.COMPLETED
+        assert store.list_by_status(ResearchStatus.PENDING) == []
+
+    def test_list_by_status_oldest_first(self) -> None:
+        store = RunStore()
+        store.save(_run("run-b", offset=2))
+        store.save(_run("run-a", offset=1))
+        store.save(_run("run-c", status=ResearchStatus.FAILED))
+        pending = store.list_by_status(ResearchStatus.PENDING)
+        assert [r.run_id for r in pending] == ["run-a", "run-b"]
+
+    def test_find_active_ignores_finished_runs(self) -> None:
+        store = RunStore()
+        store.save(_run("run-1", status=ResearchStatus.COMPLETED))
+        assert store.find_active("2026-02-28") is None
+        store.save(_run("run-2", status=ResearchStatus.RUNNING))
+        assert store.find_active("2026-02-28").run_id == "run-2"
+        assert store.find_active("2026-03-01") is None
+
+    def test_requeue_interrupted_runs(self) -> None:
+        store = RunStore()
+        running = _run("run-1", status=ResearchStatus.RUNNING)
+        store.save(running.model_copy(update={"started_at": T0}))
+        assert store.requeue_interrupted() == 1
+        run = store.get("run-1")
+        assert run.status == ResearchStatus.PENDING
+        assert run.started_at is None
+
+    def test_persists_across_reopen(self, tmp_path: Path) -> None:
+        path = str(tmp_path / "nested" / "runs.sqlite3")
+        store = RunStore(path)
+        store.save(_run("run-1"))
+        store.close()
+        reopened = RunStore(path)
+        assert reopened.get("run-1") is not None
+        reopened.close()
@@ -0,0 +1,71 @@
+"""Tests for backend.repo.search_cache."""
+
+from pathlib import Path
+
+from backend.repo.search_cache import SearchCache, normalize_query
+
+RESULTS = [{"url": "https://a.com", "title": "A", "content": "Ca"}]
+
+
+class FakeClock:
+    def __init__(self, now: float = 1_000_000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestNormalizeQuery:
+    def test_collapses_case_and_whitespace(self) -> None:
+        assert normalize_query("  AI   News\nToday ") == "ai news today"
+
+
+class TestSearchCache:
+    def test_miss_then_hit(self) -> None:
+        cache = SearchCache()
+        assert cache.get("AI news", 10) is None
+        cache.set("AI news", 10, RESULTS)
+        assert cache.get("ai  NEWS", 10) == RESULTS
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+        assert cache.stats()["hit_rate"] == 0.5
+
+    def test_key_includes_max_results(self) -> None:
+        cache = SearchCache()
+        cache.set("AI news", 10, RESULTS)
+        assert cache.get("AI news", 5) is None
+
+    def test_entries_expire_after_ttl(self) -> None:
+        clock = FakeClock()
+        cache = SearchCache(ttl_seconds=60, bucket_seconds=3600, clock=clock)
+        cache.set("q", 10, RESULTS)
+        clock.now += 61
+        assert cache.get("q", 10) is None
+
+    def test_new_date_bucket_misses(self) -> None:
+        clock = FakeClock(now=86_400 * 10)
+        cache = SearchCache(ttl_seconds=86_400 * 7, clock=clock)
+        cache.set("q", 10, RESULTS)
+        clock.now += 86_400
+        assert cache.get("q", 10) is None
+
+    def test_evicts_least_recently_used(self) -> None:
+        clock = FakeClock()
+        cache = SearchCache(max_entries=2, clock=clock)
+        cache.set("a", 10, RESULTS)
+        clock.now += 1
+        cache.set("b", 10, RESULTS)
+        clock.now += 1
+        cache.get("a", 10)
+        clock.now += 1
+        cache.set("c", 10, RESULTS)
+        assert len(cache) == 2
+        assert cache.get("a", 10) == RESULTS
+        assert cache.get("b", 10) is None
+
+    def test_persists_across_instances(self, tmp_path: Path) -> None:
+        path = str(tmp_path / "nested" / "cache.sqlite3")
+        first = SearchCache(path=path)
+        first.set("q", 10, RESULTS)
+        first.close()
+        assert SearchCache(path=path).get("q", 10) == RESULTS
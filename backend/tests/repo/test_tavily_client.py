@@ -0,0 +1,79 @@
+"""Tests for backend.repo.tavily_client."""
+
+import json
+import os
+
+import httpx
+import pytest
+
+from backend.repo.rate_limiter import ProviderLimiter
+from backend.repo.tavily_client import TavilySearchClient
+from backend.types.errors import SearchError
+
+
+async def _no_sleep(_seconds: float) -> None:
+    return None
+
+
+def _client(handler: object) -> TavilySearchClient:
+    http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return TavilySearchClient(
+        api_key="tvly-key",
+        http_client=http,
+        base_url="https://tavily.test",
+        limiter=ProviderLimiter("tavily", sleep=_no_sleep),
+    )
+
+
+class TestTavilySearchClient:
+    @pytest.mark.asyncio
+    async def test_returns_results_list(self) -> None:
+        seen: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            return httpx.Response(
+                200, json={"results": [{"url": "https://a.com"}]}
+            )
+
+        results = await _client(handler).search("ai news", max_results=5)
+        assert results == [{"url": "https://a.com"}]
+        assert seen[0].url == "https://tavily.test/search"
+        assert seen[0].headers["Authorization"] == "Bearer tvly-key"
+        assert json.loads(seen[0].content) == {
+            "query": "ai news",
+            "max_results": 5,
+        }
+
+    @pytest.mark.asyncio
+    async def test_does_not_touch_environment(self) -> None:
+        before = dict(os.environ)
+        await _client(lambda _r: httpx.Response(200, json={})).search("q")
+        assert dict(os.environ) == before
+
+    @pytest.mark.asyncio
+    async def test_http_error_raises_search_error(self) -> None:
+        client = _client(lambda _r: httpx.Response(429, json={}))
+        with pytest.raises(SearchError, match="429"):
+            await client.search("q")
+
+    @pytest.mark.asyncio
+    async def test_retries_throttled_request(self) -> None:
+        statuses = iter([429, 503, 200])
+
+        def handler(_request: httpx.Request) -> httpx.Response:
+            return httpx.Response(next(statuses), json={"results": [{"n": 1}]})
+
+        assert await _client(handler).search("q") == [{"n": 1}]
+
+    @pytest.mark.asyncio
+    async def test_client_error_is_not_retried(self) -> None:
+        calls: list[int] = []
+
+        def handler(_request: httpx.Request) -> httpx.Response:
+            calls.append(1)
+            return httpx.Response(401, json={})
+
+        with pytest.raises(SearchError, match="401"):
+            await _client(handler).search("q")
+        assert len(calls) == 1
@@ -1,7 +1,10 @@
 """Tests for src.runtime.app — RED phase."""
 
+from unittest.mock import AsyncMock, patch
+
 from fastapi.testclient import TestClient
 
+from backend.runtime.dependencies import get_run_queue
 from backend.ui.app_factory import create_app
 
 
@@ -22,3 +25,22 @@ class TestCreateApp:
             },
         )
         assert resp.status_code in (200, 204)
+
+    def test_shutdown_closes_clients_after_queue(self) -> None:
+        app = create_app()
+        queue = AsyncMock()
+        app.dependency_overrides[get_run_queue] = lambda: queue
+        with patch(
+            "backend.ui.app_factory.close_clients", new_callable=AsyncMock
+        ) as close:
+            with TestClient(app):
+                close.assert_not_awaited()
+        queue.stop.assert_awaited_once_with()
+        close.assert_awaited_once_with()
+
+    def test_preloads_tokenizer_at_startup(self) -> None:
+        with patch(
+            "backend.ui.app_factory.preload_tokenizer"
+        ) as preload:
+            create_app()
+        preload.assert_called_once_with()
@@ -1,13 +1,27 @@
 """Tests for src.runtime.dependencies."""
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
 
 from backend.config.settings import Settings
 from backend.runtime.dependencies import (
+    build_search_hedger,
+    close_clients,
     get_auth_service,
+    get_circuit_breaker,
+    get_engine_registry,
     get_firestore_repo,
+    get_gemini_client,
+    get_langchain_client,
+    get_rate_limiter,
+    get_run_flights,
+    get_search_cache,
     get_settings,
+    preload_tokenizer,
 )
+from backend.types.enums import EngineType
+from backend.types.errors import TokenizerError
 
 
 class TestGetSettings:
@@ -31,3 +45,105 @@ class TestGetFirestoreRepo:
             repo = get_firestore_repo()
             assert repo is not None
             assert repo.collection_name == "research_reports"
+
+
+class TestGetRateLimiter:
+    def test_shared_per_provider(self) -> None:
+        assert get_rate_limiter("openai") is get_rate_limiter("openai")
+        assert get_rate_limiter("openai") is not get_rate_limiter("tavily")
+
+    def test_limiter_reports_to_provider_breaker(self) -> None:
+        assert get_rate_limiter("tavily").breaker is get_circuit_breaker("tavily")
+
+    def test_uses_retry_settings(self) -> None:
+        limiter = get_rate_limiter("gemini")
+        assert limiter.name == "gemini"
+        assert limiter.policy.max_attempts == get_settings().retry_max_attempts
+
+
+class TestGetEngineRegistry:
+    def test_registers_both_engines_without_building_clients(self) -> None:
+        registry = get_engine_registry()
+        assert registry.engines == (EngineType.GEMINI, EngineType.LANGCHAIN)
+        assert registry.get(EngineType.GEMINI)._client is None
+        assert get_engine_registry() is registry
+
+
+class TestCloseClients:
+    @pytest.mark.asyncio
+    async def test_closes_only_built_clients(self) -> None:
+        get_langchain_client.cache_clear()
+        get_gemini_client.cache_clear()
+        get_search_cache.cache_clear()
+        with (
+            patch(
+                "backend.runtime.dependencies.LangChainResearchClient"
+            ) as langchain_cls,
+            patch("backend.runtime.dependencies.GeminiResearchClient") as gemini_cls,
+            patch("backend.runtime.dependencies.SearchCache") as cache_cls,
+        ):
+            langchain_cls.return_value.aclose = AsyncMock()
+            get_langchain_client()
+            await close_clients()
+
+        langchain_cls.return_value.aclose.assert_awaited_once_with()
+        gemini_cls.assert_not_called()
+        assert get_langchain_client.cache_info().currsize == 0
+        cache_cls.return_value.close.assert_called_once_with()
+        assert get_search_cache.cache_info().currsize == 0
+
+    @pytest.mark.asyncio
+    async def test_unbuilt_search_cache_is_not_opened(self) -> None:
+        get_search_cache.cache_clear()
+        with patch("backend.runtime.dependencies.SearchCache") as cache_cls:
+            await close_clients()
+        cache_cls.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_close_failure_is_not_raised(self) -> None:
+        get_gemini_client.cache_clear()
+        with patch("backend.runtime.dependencies.GeminiResearchClient") as cls:
+            cls.return_value.aclose = AsyncMock(side_effect=OSError("gone"))
+            get_gemini_client()
+            await close_clients()
+        assert get_gemini_client.cache_info().currsize == 0
+
+
+class TestGetRunFlights:
+    def test_shared_across_orchestrators(self) -> None:
+        assert get_run_flights() is get_run_flights()
+
+
+class TestBuildSearchHedger:
+    def test_disabled_by_default(self) -> None:
+        assert build_search_hedger() is None
+
+    def test_uses_configured_policy(self) -> None:
+        settings = get_settings().model_copy(
+            update={"tavily_hedging": True, "tavily_hedge_budget": 0.05}
+        )
+        with patch(
+            "backend.runtime.dependencies.get_settings", return_value=settings
+        ):
+            hedger = build_search_hedger()
+        assert hedger is not None
+        assert hedger.policy.budget_ratio == 0.05
+
+
+class TestPreloadTokenizer:
+    def test_preloads_from_configured_cache_dir(self) -> None:
+        with patch(
+            "backend.runtime.dependencies.preload_encodings",
+            return_value=0.01,
+        ) as preload:
+            assert preload_tokenizer() is True
+        preload.assert_called_once_with(
+            cache_dir=get_settings().tiktoken_cache_dir
+        )
+
+    def test_failure_is_logged_not_raised(self) -> None:
+        with patch(
+            "backend.runtime.dependencies.preload_encodings",
+            side_effect=TokenizerError("missing bundle"),
+        ):
+            assert preload_tokenizer() is False
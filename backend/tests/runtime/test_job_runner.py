@@ -1,10 +1,36 @@
 """Tests for backend.runtime.job_runner — RED phase."""
 
+from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from backend.runtime.job_runner import run_daily_job
+from backend.runtime.job_runner import main, resume_job, run_daily_job
+from backend.types.enums import EngineType, ResearchStatus
+from backend.types.report import EngineResult, ResearchReport
+
+
+def _report(**statuses: ResearchStatus) -> ResearchReport:
+    now = datetime(2026, 2, 28, tzinfo=timezone.utc)
+    results = {
+        EngineType(engine): EngineResult(
+            engine=EngineType(engine),
+            status=status,
+            raw_markdown="",
+            tldr=None,
+            viral_events=[],
+            deep_dives=[],
+            completeness_audit=None,
+            started_at=now,
+            completed_at=now,
+            duration_seconds=1.0,
+            error_message=None,
+        )
+        for engine, status in statuses.items()
+    }
+    return ResearchReport(
+        report_id="rpt-2026-02-28", run_date=now, created_at=now, results=results
+    )
 
 
 class TestRunDailyJob:
@@ -23,3 +49,81 @@ class TestRunDailyJob:
             mock_orchestrator.run_daily_research.assert_called_once_with(
                 "2026-02-28"
             )
+
+    @pytest.mark.asyncio
+    async def test_exit_code_reflects_engine_outcomes(self) -> None:
+        mock_orchestrator = AsyncMock()
+        with patch(
+            "backend.runtime.job_runner._build_orchestrator",
+            return_value=mock_orchestrator,
+        ):
+            mock_orchestrator.run_daily_research.return_value = _report(
+                gemini=ResearchStatus.COMPLETED,
+                langchain=ResearchStatus.COMPLETED,
+            )
+            assert await run_daily_job("2026-02-28") == 0
+            for status in (ResearchStatus.FAILED, ResearchStatus.TIMED_OUT):
+                mock_orchestrator.run_daily_research.return_value = _report(
+                    gemini=ResearchStatus.COMPLETED, langchain=status
+                )
+                assert await run_daily_job("2026-02-28") == 1
+
+
+class TestResumeJob:
+    @pytest.mark.asyncio
+    async def test_resumes_run(self) -> None:
+        mock_orchestrator = AsyncMock()
+        mock_orchestrator.resume_langchain_run.return_value = MagicMock(
+            report_id="rpt-2026-02-28"
+        )
+        with patch(
+            "backend.runtime.job_runner._build_orchestrator",
+            return_value=mock_orchestrator,
+        ):
+            await resume_job("rpt-2026-02-28:langchain")
+        mock_orchestrator.resume_langchain_run.assert_awaited_once_with(
+            "rpt-2026-02-28:langchain"
+        )
+
+    @pytest.mark.asyncio
+    async def test_failed_resume_exits_non_zero(self) -> None:
+        mock_orchestrator = AsyncMock()
+        mock_orchestrator.resume_langchain_run.return_value = _report(
+            langchain=ResearchStatus.FAILED
+        )
+        with patch(
+            "backend.runtime.job_runner._build_orchestrator",
+            return_value=mock_orchestrator,
+        ):
+            assert await resume_job("rpt-2026-02-28:langchain") == 1
+
+
+class TestMain:
+    def test_resume_command(self) -> None:
+        with patch(
+            "backend.runtime.job_runner.resume_job", new=AsyncMock()
+        ) as mock_resume:
+            main(["resume", "rpt-2026-02-28:langchain"])
+        mock_resume.assert_awaited_once_with("rpt-2026-02-28:langchain")
+
+    def test_preloads_tokenizer_before_running(self) -> None:
+        with (
+            patch("backend.runtime.job_runner.preload_tokenizer") as preload,
+            patch("backend.runtime.job_runner.run_daily_job", new=AsyncMock()),
+        ):
+            main([])
+        preload.assert_called_once_with()
+
+    def test_default_runs_daily_job(self) -> None:
+        with patch(
+            "backend.runtime.job_runner.run_daily_job", new=AsyncMock()
+        ) as mock_run:
+            main(["--date", "2026-02-28"])
+        mock_run.assert_awaited_once_with("2026-02-28")
+
+    def test_returns_job_exit_code(self) -> None:
+        with patch(
+            "backend.runtime.job_runner.run_daily_job",
+            new=AsyncMock(return_value=1),
+        ):
+            assert main([]) == 1
@@ -0,0 +1,143 @@
+"""Tests for backend.service.engine_registry."""
+
+import asyncio
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock
+
+import pytest
+
+from backend.repo.gemini_client import GeminiResearchClient
+from backend.repo.langchain_client import LangChainResearchClient
+from backend.service.engine_registry import (
+    EngineHooks,
+    EngineRegistry,
+    EngineSpec,
+    gemini_engine,
+    langchain_engine,
+)
+from backend.types.enums import EngineType, ResearchStatus
+from backend.types.report import EngineResult
+
+
+def _result(engine: EngineType) -> EngineResult:
+    now = datetime.now(timezone.utc)
+    return EngineResult(
+        engine=engine,
+        status=ResearchStatus.COMPLETED,
+        raw_markdown="",
+        tldr=None,
+        viral_events=[],
+        deep_dives=[],
+        completeness_audit=None,
+        started_at=now,
+        completed_at=now,
+        duration_seconds=0.0,
+        error_message=None,
+    )
+
+
+class TestEngineRegistry:
+    def test_select_defaults_to_all_in_registration_order(self) -> None:
+        registry = EngineRegistry(
+            [langchain_engine(object), gemini_engine(object)]
+        )
+        assert registry.engines == (EngineType.LANGCHAIN, EngineType.GEMINI)
+        assert [s.engine for s in registry.select()] == list(registry.engines)
+
+    def test_select_subset_without_duplicates(self) -> None:
+        registry = EngineRegistry(
+            [gemini_engine(object), langchain_engine(object)]
+        )
+        selected = registry.select([EngineType.LANGCHAIN, EngineType.LANGCHAIN])
+        assert [s.engine for s in selected] == [EngineType.LANGCHAIN]
+
+    def test_unknown_engine_is_rejected(self) -> None:
+        registry = EngineRegistry([gemini_engine(object)])
+        with pytest.raises(ValueError, match="langchain"):
+            registry.select([EngineType.LANGCHAIN])
+
+    def test_duplicate_registration_is_rejected(self) -> None:
+        registry = EngineRegistry([gemini_engine(object)])
+        with pytest.raises(ValueError, match="already registered"):
+            registry.register(gemini_engine(object))
+
+
+class TestEngineSpec:
+    def test_client_is_built_once_on_first_use(self) -> None:
+        built: list[object] = []
+
+        def factory() -> object:
+            built.append(object())
+            return built[-1]
+
+        spec = gemini_engine(factory)
+        assert built == []
+        assert spec.client is spec.client
+        assert len(built) == 1
+
+    def test_rejects_non_positive_concurrency(self) -> None:
+        with pytest.raises(ValueError):
+            gemini_engine(object, max_concurrency=0)
+
+    @pytest.mark.asyncio
+    async def test_concurrency_limit_spans_reports(self) -> None:
+        active = 0
+        peak = 0
+
+        async def run(
+            _client: object, _prompt: str, _hooks: EngineHooks
+        ) -> EngineResult:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return _result(EngineType.GEMINI)
+
+        spec = EngineSpec(EngineType.GEMINI, object, run, max_concurrency=2)
+        await asyncio.gather(
+            *(spec.execute("p", EngineHooks(f"rpt-{i}")) for i in range(5))
+        )
+        assert peak == 2
+
+
+class TestBuiltInEngines:
+    @pytest.mark.asyncio
+    async def test_streaming_gemini_reports_partials(self) -> None:
+        async def stream(_prompt: str):  # type: ignore[no-untyped-def]
+            yield "## TL;DR\n- Item\n\n## Global Viral Events\n"
+
+        client = AsyncMock(spec=GeminiResearchClient)
+        client.stream_research = stream
+        partials: list[EngineResult] = []
+
+        async def on_partial(partial: EngineResult) -> None:
+            partials.append(partial)
+
+        spec = gemini_engine(lambda: client, stream=True)
+        result = await spec.execute(
+            "p", EngineHooks("rpt-1", on_partial=on_partial)
+        )
+        assert result.status == ResearchStatus.COMPLETED
+        assert [p.status for p in partials] == [ResearchStatus.RUNNING]
+
+    @pytest.mark.asyncio
+    async def test_langchain_checkpoints_under_report_run_id(self) -> None:
+        client = AsyncMock(spec=LangChainResearchClient)
+        client.run_research.return_value = "# LC"
+
+        spec = langchain_engine(lambda: client)
+        result = await spec.execute("p", EngineHooks("rpt-2026-02-28"))
+        assert result.engine is EngineType.LANGCHAIN
+        kwargs = client.run_research.call_args.kwargs
+        assert kwargs["run_id"] == "rpt-2026-02-28:langchain"
+        assert kwargs["use_cache"] is True
+
+    @pytest.mark.asyncio
+    async def test_langchain_honours_cache_opt_out(self) -> None:
+        client = AsyncMock(spec=LangChainResearchClient)
+        client.run_research.return_value = "# LC"
+
+        spec = langchain_engine(lambda: client)
+        await spec.execute("p", EngineHooks("rpt-1", use_cache=False))
+        assert client.run_research.call_args.kwargs["use_cache"] is False
@@ -1,14 +1,34 @@
 """Tests for src.service.engine_runner — RED phase."""
 
+import asyncio
+from pathlib import Path
 from unittest.mock import AsyncMock
 
 import pytest
 
+from backend.repo.circuit_breaker import CircuitBreaker
+from backend.repo.deadline import Deadline
 from backend.repo.gemini_client import GeminiResearchClient
 from backend.repo.langchain_client import LangChainResearchClient
-from backend.service.engine_runner import run_gemini_engine, run_langchain_engine
+from backend.service.engine_runner import (
+    run_gemini_engine,
+    run_langchain_engine,
+    stream_gemini_engine,
+)
 from backend.types.enums import EngineType, ResearchStatus
-from backend.types.errors import GeminiApiError, LangChainError
+from backend.types.errors import (
+    CircuitOpenError,
+    GeminiApiError,
+    LangChainError,
+)
+from backend.types.report import EngineResult
+from backend.types.resilience import CircuitPolicy
+
+
+def _open_breaker(name: str) -> CircuitBreaker:
+    breaker = CircuitBreaker(name, CircuitPolicy(min_calls=1))
+    breaker.record_failure()
+    return breaker
 
 
 class TestRunGeminiEngine:
@@ -56,3 +76,188 @@ class TestRunLangChainEngine:
         assert result.engine == EngineType.LANGCHAIN
         assert result.status == ResearchStatus.FAILED
         assert "failed" in result.error_message
+
+
+STREAMED_CHUNKS = [
+    "## TL;DR\n- First item\n",
+    "\n## Global Viral Events\n### Launch\n- **Category**: funding\n",
+    "\n## Completeness Audit\n- **Verified Signals**: 3\n",
+]
+
+
+def _stream_of(chunks: list[str], error: Exception | None = None) -> object:
+    """Build a stream_research replacement yielding the given chunks."""
+
+    async def _stream(_prompt: str):  # type: ignore[no-untyped-def]
+        for chunk in chunks:
+            yield chunk
+        if error is not None:
+            raise error
+
+    return _stream
+
+
+class TestStreamGeminiEngine:
+    @pytest.mark.asyncio
+    async def test_reports_each_closed_section(self) -> None:
+        client = AsyncMock(spec=GeminiResearchClient)
+        client.stream_research = _stream_of(STREAMED_CHUNKS)
+        partials = []
+
+        async def on_section(partial: object) -> None:
+            partials.append(partial)
+
+        result = await stream_gemini_engine(client, "p", on_section)
+        assert [p.status for p in partials] == [ResearchStatus.RUNNING] * 2
+        assert partials[0].tldr == "- First item"
+        assert partials[0].viral_events == []
+        assert partials[1].viral_events[0].headline == "Launch"
+        assert partials[0].raw_markdown == STREAMED_CHUNKS[0]
+        assert partials[1].raw_markdown == "".join(STREAMED_CHUNKS[:2])
+        assert result.status == ResearchStatus.COMPLETED
+        assert result.completeness_audit is not None
+        assert result.raw_markdown == "".join(STREAMED_CHUNKS)
+
+    @pytest.mark.asyncio
+    async def test_late_failure_keeps_closed_sections(self) -> None:
+        client = AsyncMock(spec=GeminiResearchClient)
+        client.stream_research = _stream_of(
+            STREAMED_CHUNKS, error=GeminiApiError("stream reset")
+        )
+
+        result = await stream_gemini_engine(client, "p")
+        assert result.status == ResearchStatus.FAILED
+        assert "stream reset" in result.error_message
+        assert result.tldr == "- First item"
+        assert result.viral_events[0].headline == "Launch"
+        assert result.completeness_audit is None
+
+
+class TestCircuitFastFail:
+    @pytest.mark.asyncio
+    async def test_open_circuit_skips_engine(self) -> None:
+        client = AsyncMock(spec=LangChainResearchClient)
+        client.breakers = (CircuitBreaker("openai"), _open_breaker("tavily"))
+
+        result = await run_langchain_engine(client, "test prompt")
+
+        assert result.status == ResearchStatus.FAILED
+        assert result.error_message == "Circuit open for tavily"
+        assert result.duration_seconds < 0.1
+        client.run_research.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_closed_circuits_run_engine(self) -> None:
+        client = AsyncMock(spec=GeminiResearchClient)
+        client.breakers = (CircuitBreaker("gemini"),)
+        client.run_research.return_value = "# Report\nContent"
+
+        result = await run_gemini_engine(client, "test prompt")
+
+        assert result.status == ResearchStatus.COMPLETED
+
+    @pytest.mark.asyncio
+    async def test_circuit_opening_mid_run_fails_engine(
+        self, tmp_path: Path
+    ) -> None:
+        client = LangChainResearchClient(
+            openai_api_key="k",
+            tavily_api_key="k",
+            model="m",
+            checkpoint_path=str(tmp_path / "checkpoints.sqlite3"),
+        )
+        client._search_client.search = AsyncMock(
+            side_effect=CircuitOpenError("tavily circuit open")
+        )
+        client._llm = AsyncMock()
+
+        result = await run_langchain_engine(client, "test prompt")
+        await client.aclose()
+
+        assert result.status == ResearchStatus.FAILED
+        assert "tavily circuit open" in result.error_message
+        client._llm.ainvoke.assert_not_awaited()
+
+
+class TestCompletionHook:
+    @pytest.mark.asyncio
+    async def test_hook_receives_final_result(self) -> None:
+        client = AsyncMock(spec=GeminiResearchClient)
+        client.run_research.side_effect = GeminiApiError("timeout")
+        seen: list[EngineResult] = []
+
+        async def on_complete(result: EngineResult) -> None:
+            seen.append(result)
+
+        result = await run_gemini_engine(client, "p", on_complete=on_complete)
+        assert seen == [result]
+        assert result.status == ResearchStatus.FAILED
+
+    @pytest.mark.asyncio
+    async def test_hook_failure_does_not_fail_engine(self) -> None:
+        client = AsyncMock(spec=LangChainResearchClient)
+        client.run_research.return_value = "# LC\nReport"
+
+        async def on_complete(_result: EngineResult) -> None:
+            raise RuntimeError("bus down")
+
+        result = await run_langchain_engine(client, "p", on_complete=on_complete)
+        assert result.status == ResearchStatus.COMPLETED
+
+
+async def _hang(*_args: object, **_kwargs: object) -> str:
+    await asyncio.sleep(10)
+    return ""
+
+
+class TestDeadline:
+    @pytest.mark.asyncio
+    async def test_hung_engine_times_out(self) -> None:
+        client = AsyncMock(spec=GeminiResearchClient)
+        client.run_research.side_effect = _hang
+
+        result = await run_gemini_engine(client, "p", deadline=Deadline(0.05))
+        assert result.status == ResearchStatus.TIMED_OUT
+        assert "deadline" in result.error_message
+        assert result.duration_seconds < 1.0
+        assert result.tldr is None
+
+    @pytest.mark.asyncio
+    async def test_timed_out_stream_keeps_closed_sections_and_timings(
+        self,
+    ) -> None:
+        async def stream(_prompt: str):  # type: ignore[no-untyped-def]
+            for chunk in STREAMED_CHUNKS[:2]:
+                yield chunk
+            await asyncio.sleep(10)
+
+        client = AsyncMock(spec=GeminiResearchClient)
+        client.stream_research = stream
+
+        result = await stream_gemini_engine(client, "p", deadline=Deadline(0.05))
+        assert result.status == ResearchStatus.TIMED_OUT
+        assert result.tldr == "- First item"
+        assert list(result.timings) == ["section:1"]
+
+    @pytest.mark.asyncio
+    async def test_langchain_gets_deadline_and_reports_node_timings(self) -> None:
+        client = AsyncMock(spec=LangChainResearchClient)
+        deadline = Deadline(5.0)
+
+        async def research(_prompt: str, **kwargs: object) -> str:
+            assert kwargs["deadline"] is deadline
+            kwargs["timings"]["search"] = 0.5
+            return "# LC"
+
+        client.run_research.side_effect = research
+        result = await run_langchain_engine(client, "p", deadline=deadline)
+        assert result.status == ResearchStatus.COMPLETED
+        assert result.timings == {"search": 0.5}
+
+    @pytest.mark.asyncio
+    async def test_completed_engine_records_generate_timing(self) -> None:
+        client = AsyncMock(spec=GeminiResearchClient)
+        client.run_research.return_value = "# G"
+
+        result = await run_gemini_engine(client, "p")
+        assert list(result.timings) == ["generate"]
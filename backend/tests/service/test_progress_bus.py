@@ -0,0 +1,91 @@
+"""Tests for backend.service.progress_bus."""
+
+import asyncio
+
+import pytest
+
+from backend.service.progress_bus import ProgressBus
+from backend.types.enums import ProgressKind
+from backend.types.progress import ProgressEvent
+
+
+def _event(kind: ProgressKind, **data: object) -> ProgressEvent:
+    return ProgressEvent(report_id="rpt-1", kind=kind, data=data)
+
+
+class TestProgressBus:
+    @pytest.mark.asyncio
+    async def test_fans_out_to_every_subscriber(self) -> None:
+        bus = ProgressBus()
+        first = bus.subscribe("rpt-1")
+        second = bus.subscribe("rpt-1")
+        other = bus.subscribe("rpt-2")
+        bus.publish(_event(ProgressKind.SEARCH_STARTED))
+        assert (await first.get()).kind is ProgressKind.SEARCH_STARTED
+        assert (await second.get()).kind is ProgressKind.SEARCH_STARTED
+        with pytest.raises(TimeoutError):
+            await asyncio.wait_for(other.get(), 0.01)
+
+    @pytest.mark.asyncio
+    async def test_slow_subscriber_drops_oldest_not_newest(self) -> None:
+        bus = ProgressBus(buffer_size=2)
+        slow = bus.subscribe("rpt-1")
+        for index in range(5):
+            bus.publish(_event(ProgressKind.SECTION_GENERATED, index=index))
+        bus.publish(_event(ProgressKind.REPORT_SAVED))
+        received = [event async for event in slow]
+        assert [e.kind for e in received] == [
+            ProgressKind.SECTION_GENERATED,
+            ProgressKind.REPORT_SAVED,
+        ]
+        assert received[0].data == {"index": 4}
+        assert slow.dropped == 4
+
+    @pytest.mark.asyncio
+    async def test_iteration_ends_at_terminal_event(self) -> None:
+        bus = ProgressBus()
+        subscription = bus.subscribe("rpt-1")
+        bus.publish(_event(ProgressKind.SEARCH_STARTED))
+        bus.publish(_event(ProgressKind.RUN_FAILED, error="boom"))
+        bus.publish(_event(ProgressKind.SEARCH_STARTED))
+        kinds = [event.kind async for event in subscription]
+        assert kinds == [ProgressKind.SEARCH_STARTED, ProgressKind.RUN_FAILED]
+
+    @pytest.mark.asyncio
+    async def test_late_subscriber_replays_current_run(self) -> None:
+        bus = ProgressBus()
+        bus.publish(_event(ProgressKind.RUN_STARTED, date="old"))
+        bus.publish(_event(ProgressKind.REPORT_SAVED))
+        bus.publish(_event(ProgressKind.RUN_STARTED, date="new"))
+        bus.publish(_event(ProgressKind.SEARCH_STARTED))
+        late = bus.subscribe("rpt-1")
+        first = await late.get()
+        assert first.data == {"date": "new"}
+        assert (await late.get()).kind is ProgressKind.SEARCH_STARTED
+
+    def test_close_unsubscribes(self) -> None:
+        bus = ProgressBus()
+        subscription = bus.subscribe("rpt-1")
+        assert bus.subscriber_count("rpt-1") == 1
+        subscription.close()
+        subscription.close()
+        assert bus.subscriber_count("rpt-1") == 0
+        bus.publish(_event(ProgressKind.SEARCH_STARTED))
+
+    @pytest.mark.asyncio
+    async def test_reset_forgets_history(self) -> None:
+        bus = ProgressBus()
+        bus.publish(_event(ProgressKind.RUN_STARTED))
+        bus.publish(_event(ProgressKind.REPORT_SAVED))
+        bus.reset("rpt-1")
+        late = bus.subscribe("rpt-1")
+        with pytest.raises(TimeoutError):
+            await asyncio.wait_for(late.get(), 0.01)
+
+    def test_finished_tracks_latest_event(self) -> None:
+        bus = ProgressBus()
+        assert not bus.finished("rpt-1")
+        bus.publish(_event(ProgressKind.RUN_STARTED))
+        assert not bus.finished("rpt-1")
+        bus.publish(_event(ProgressKind.RUN_FAILED))
+        assert bus.finished("rpt-1")
@@ -1,6 +1,6 @@
 """Tests for src.service.report_parser — RED phase."""
 
-from backend.service.report_parser import ReportParser
+from backend.service.report_parser import ReportParser, index_sections
 
 
 SAMPLE_MARKDOWN = """# Global AI Viral Intelligence Tracker v4.0
@@ -80,3 +80,59 @@ class TestReportParser:
     def test_parse_viral_events_empty(self) -> None:
         events = self.parser.parse_viral_events("# Nothing")
         assert events == []
+
+    def test_parses_every_event_in_section(self) -> None:
+        events = self.parser.parse_viral_events(SAMPLE_MARKDOWN)
+        assert [e.headline for e in events] == [
+            "GPT-5 Released",
+            "Gemini 3.0 Announced",
+        ]
+
+    def test_parses_every_deep_dive(self) -> None:
+        dives = self.parser.parse_deep_dives(SAMPLE_MARKDOWN)
+        assert [d.title for d in dives] == [
+            "Multimodal AI Race",
+            "EU Regulation Impact",
+        ]
+
+    def test_parses_single_blocks(self) -> None:
+        event = self.parser.event_from(
+            "### Launch\n- **Category**: funding\n- **Impact Rating**: 12"
+        )
+        assert event is not None
+        assert event.headline == "Launch"
+        assert event.impact_rating == 10
+        dive = self.parser.dive_from("### Chips\n- **Priority**: HIGH")
+        assert dive is not None
+        assert dive.priority == "HIGH"
+        assert self.parser.event_from("### ") is None
+
+    def test_parse_matches_section_parsers(self) -> None:
+        parsed = self.parser.parse(SAMPLE_MARKDOWN)
+        assert parsed.tldr == self.parser.parse_tldr(SAMPLE_MARKDOWN)
+        assert parsed.viral_events == self.parser.parse_viral_events(
+            SAMPLE_MARKDOWN
+        )
+        assert parsed.deep_dives == self.parser.parse_deep_dives(
+            SAMPLE_MARKDOWN
+        )
+        assert parsed.completeness_audit == (
+            self.parser.parse_completeness_audit(SAMPLE_MARKDOWN)
+        )
+
+
+class TestIndexSections:
+    def test_spans_run_to_next_level_two_heading(self) -> None:
+        markdown = "## A\nbody a\n### sub\n## B\nbody b"
+        index = index_sections(markdown)
+        start, end = index["A"]
+        assert markdown[start:end] == "\nbody a\n### sub"
+        start, end = index["B"]
+        assert markdown[start:end] == "\nbody b"
+
+    def test_first_occurrence_wins(self) -> None:
+        index = index_sections("## A\nfirst\n## A\nsecond")
+        assert index["A"] == (4, 10)
+
+    def test_no_sections(self) -> None:
+        assert index_sections("# Title only\ntext") == {}
@@ -1,14 +1,43 @@
 """Tests for src.service.research_orchestrator — RED phase."""
 
-from unittest.mock import AsyncMock, MagicMock
+import asyncio
+from unittest.mock import AsyncMock
 
 import pytest
 
 from backend.repo.firestore_client import FirestoreRepo
 from backend.repo.gemini_client import GeminiResearchClient
 from backend.repo.langchain_client import LangChainResearchClient
+from backend.service.engine_registry import (
+    EngineRegistry,
+    gemini_engine,
+    langchain_engine,
+)
+from backend.service.progress_bus import ProgressBus
 from backend.service.research_orchestrator import ResearchOrchestrator
-from backend.types.enums import ResearchStatus
+from backend.types.enums import EngineType, ProgressKind, ResearchStatus
+from backend.types.errors import FirestoreError
+
+GEMINI = EngineType.GEMINI
+LANGCHAIN = EngineType.LANGCHAIN
+
+
+def _orchestrator(
+    gemini_client: GeminiResearchClient,
+    langchain_client: LangChainResearchClient,
+    firestore_repo: FirestoreRepo,
+    stream_gemini: bool = False,
+    **kwargs: object,
+) -> ResearchOrchestrator:
+    registry = EngineRegistry(
+        [
+            gemini_engine(lambda: gemini_client, stream=stream_gemini),
+            langchain_engine(lambda: langchain_client),
+        ]
+    )
+    return ResearchOrchestrator(
+        registry=registry, firestore_repo=firestore_repo, **kwargs
+    )
 
 
 class TestResearchOrchestrator:
@@ -16,7 +45,7 @@ class TestResearchOrchestrator:
         self.gemini_client = AsyncMock(spec=GeminiResearchClient)
         self.langchain_client = AsyncMock(spec=LangChainResearchClient)
         self.firestore_repo = AsyncMock(spec=FirestoreRepo)
-        self.orchestrator = ResearchOrchestrator(
+        self.orchestrator = _orchestrator(
             gemini_client=self.gemini_client,
             langchain_client=self.langchain_client,
             firestore_repo=self.firestore_repo,
@@ -29,10 +58,10 @@ class TestResearchOrchestrator:
 
         report = await self.orchestrator.run_daily_research("2026-02-28")
         assert report.report_id.startswith("rpt-2026-02-28")
-        assert report.gemini_result is not None
-        assert report.langchain_result is not None
-        assert report.gemini_result.status == ResearchStatus.COMPLETED
-        self.firestore_repo.save_report.assert_called_once()
+        assert report.results[GEMINI] is not None
+        assert report.results[LANGCHAIN] is not None
+        assert report.results[GEMINI].status == ResearchStatus.COMPLETED
+        self.firestore_repo.create_report.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_run_daily_research_gemini_fails(self) -> None:
@@ -40,9 +69,9 @@ class TestResearchOrchestrator:
         self.langchain_client.run_research.return_value = "# LC\nReport"
 
         report = await self.orchestrator.run_daily_research("2026-02-28")
-        assert report.gemini_result is not None
-        assert report.gemini_result.status == ResearchStatus.FAILED
-        assert report.langchain_result.status == ResearchStatus.COMPLETED
+        assert report.results[GEMINI] is not None
+        assert report.results[GEMINI].status == ResearchStatus.FAILED
+        assert report.results[LANGCHAIN].status == ResearchStatus.COMPLETED
 
     @pytest.mark.asyncio
     async def test_run_daily_research_saves_to_firestore(self) -> None:
@@ -50,4 +79,415 @@ class TestResearchOrchestrator:
         self.langchain_client.run_research.return_value = "# Report"
 
         await self.orchestrator.run_daily_research("2026-02-28")
-        self.firestore_repo.save_report.assert_called_once()
+        self.firestore_repo.create_report.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_cache_opt_out_reaches_langchain(self) -> None:
+        self.gemini_client.run_research.return_value = "# Report"
+        self.langchain_client.run_research.return_value = "# Report"
+
+        await self.orchestrator.run_daily_research("2026-02-28", use_cache=False)
+        kwargs = self.langchain_client.run_research.call_args.kwargs
+        assert kwargs["use_cache"] is False
+
+    @pytest.mark.asyncio
+    async def test_concurrent_triggers_for_same_date_share_one_run(self) -> None:
+        release = asyncio.Event()
+
+        async def slow_research(*_args: object, **_kwargs: object) -> str:
+            await release.wait()
+            return "# Report"
+
+        self.gemini_client.run_research.side_effect = slow_research
+        self.langchain_client.run_research.side_effect = slow_research
+
+        runs = [
+            asyncio.ensure_future(
+                self.orchestrator.run_daily_research("2026-02-28")
+            )
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0.01)
+        release.set()
+        reports = await asyncio.gather(*runs)
+
+        assert reports[0] is reports[1] is reports[2]
+        assert self.gemini_client.run_research.await_count == 1
+        assert self.langchain_client.run_research.await_count == 1
+        self.firestore_repo.create_report.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_different_dates_run_independently(self) -> None:
+        self.gemini_client.run_research.return_value = "# Report"
+        self.langchain_client.run_research.return_value = "# Report"
+
+        first, second = await asyncio.gather(
+            self.orchestrator.run_daily_research("2026-02-27"),
+            self.orchestrator.run_daily_research("2026-02-28"),
+        )
+        assert first.report_id == "rpt-2026-02-27"
+        assert second.report_id == "rpt-2026-02-28"
+        assert self.firestore_repo.create_report.call_count == 2
+
+
+class TestStreamingOrchestrator:
+    def setup_method(self) -> None:
+        self.gemini_client = AsyncMock(spec=GeminiResearchClient)
+        self.langchain_client = AsyncMock(spec=LangChainResearchClient)
+        self.firestore_repo = AsyncMock(spec=FirestoreRepo)
+        self.orchestrator = _orchestrator(
+            gemini_client=self.gemini_client,
+            langchain_client=self.langchain_client,
+            firestore_repo=self.firestore_repo,
+            stream_gemini=True,
+        )
+
+    @pytest.mark.asyncio
+    async def test_saves_partial_report_per_closed_section(self) -> None:
+        async def stream(_prompt: str):  # type: ignore[no-untyped-def]
+            yield "## TL;DR\n- Item\n"
+            yield "\n## Completeness Audit\n- **Gaps**: none\n"
+
+        self.gemini_client.stream_research = stream
+        self.langchain_client.run_research.return_value = "# LC\nReport"
+
+        report = await self.orchestrator.run_daily_research("2026-02-28")
+        partials = [
+            result
+            for call in self.firestore_repo.update_report.call_args_list
+            for result in call.kwargs["results"]
+            if result.engine is EngineType.GEMINI
+        ]
+        assert len(partials) == 2
+        assert partials[0].status == ResearchStatus.RUNNING
+        assert partials[0].tldr == "- Item"
+        assert partials[-1].status == ResearchStatus.COMPLETED
+        assert report.results[GEMINI].status == ResearchStatus.COMPLETED
+
+    @pytest.mark.asyncio
+    async def test_partial_save_failure_does_not_fail_engine(self) -> None:
+        async def stream(_prompt: str):  # type: ignore[no-untyped-def]
+            yield "## TL;DR\n- Item\n\n## Global Viral Events\n"
+
+        self.gemini_client.stream_research = stream
+        self.langchain_client.run_research.return_value = "# LC\nReport"
+        failures = iter([FirestoreError("unavailable")])
+        self.firestore_repo.update_report.side_effect = (
+            lambda *_args, **_kwargs: next(failures, None)
+        )
+
+        report = await self.orchestrator.run_daily_research("2026-02-28")
+        assert report.results[GEMINI].status == ResearchStatus.COMPLETED
+
+
+class TestProgressivePersistence:
+    def setup_method(self) -> None:
+        self.gemini_client = AsyncMock(spec=GeminiResearchClient)
+        self.langchain_client = AsyncMock(spec=LangChainResearchClient)
+        self.firestore_repo = AsyncMock(spec=FirestoreRepo)
+        self.orchestrator = _orchestrator(
+            gemini_client=self.gemini_client,
+            langchain_client=self.langchain_client,
+            firestore_repo=self.firestore_repo,
+        )
+
+    @pytest.mark.asyncio
+    async def test_first_engine_is_saved_before_second_finishes(self) -> None:
+        release = asyncio.Event()
+
+        async def slow_gemini(_prompt: str) -> str:
+            await release.wait()
+            return "## TL;DR\n- G"
+
+        self.gemini_client.run_research.side_effect = slow_gemini
+        self.langchain_client.run_research.return_value = "## TL;DR\n- LC"
+
+        run = asyncio.ensure_future(
+            self.orchestrator.run_daily_research("2026-02-28")
+        )
+        await asyncio.sleep(0.01)
+
+        created = self.firestore_repo.create_report.call_args.args[0]
+        assert created.status == ResearchStatus.RUNNING
+        assert created.results == {}
+        first = self.firestore_repo.update_report.call_args
+        assert first.args == ("rpt-2026-02-28",)
+        [langchain] = first.kwargs["results"]
+        assert langchain.engine is EngineType.LANGCHAIN
+
+        release.set()
+        report = await run
+        final = self.firestore_repo.update_report.call_args
+        assert final.kwargs["status"] == ResearchStatus.COMPLETED
+        assert list(final.kwargs["results"]) == []
+        assert report.status == ResearchStatus.COMPLETED
+        assert report.results[GEMINI].tldr == "- G"
+
+    @pytest.mark.asyncio
+    async def test_rerun_keeps_existing_report_until_results_land(self) -> None:
+        self.gemini_client.run_research.return_value = "# G"
+        self.langchain_client.run_research.return_value = "# LC"
+        self.firestore_repo.create_report.return_value = False
+
+        await self.orchestrator.run_daily_research("2026-02-28")
+
+        self.firestore_repo.save_report.assert_not_called()
+        first = self.firestore_repo.update_report.call_args_list[0]
+        assert first.args == ("rpt-2026-02-28",)
+        assert first.kwargs == {"status": ResearchStatus.RUNNING}
+
+    @pytest.mark.asyncio
+    async def test_failed_result_write_is_retried_with_status(self) -> None:
+        self.gemini_client.run_research.return_value = "# G"
+        self.langchain_client.run_research.return_value = "# LC"
+
+        async def update(_report_id: str, **kwargs: object) -> None:
+            results = list(kwargs.get("results", ()))
+            if kwargs.get("status") is None and results[0].engine is (
+                EngineType.GEMINI
+            ):
+                raise FirestoreError("unavailable")
+
+        self.firestore_repo.update_report.side_effect = update
+        await self.orchestrator.run_daily_research("2026-02-28")
+
+        final = self.firestore_repo.update_report.call_args.kwargs
+        assert final["status"] == ResearchStatus.COMPLETED
+        assert [r.engine for r in final["results"]] == [EngineType.GEMINI]
+
+    @pytest.mark.asyncio
+    async def test_failed_final_update_marks_report_failed(self) -> None:
+        self.gemini_client.run_research.return_value = "# G"
+        self.langchain_client.run_research.return_value = "# LC"
+
+        async def update(_report_id: str, **kwargs: object) -> None:
+            if kwargs.get("status") == ResearchStatus.COMPLETED:
+                raise FirestoreError("down")
+
+        self.firestore_repo.update_report.side_effect = update
+        with pytest.raises(FirestoreError):
+            await self.orchestrator.run_daily_research("2026-02-28")
+        self.firestore_repo.update_report.assert_awaited_with(
+            "rpt-2026-02-28", status=ResearchStatus.FAILED
+        )
+
+
+class TestRunDeadline:
+    @pytest.mark.asyncio
+    async def test_hung_engine_marks_report_timed_out(self) -> None:
+        gemini_client = AsyncMock(spec=GeminiResearchClient)
+        langchain_client = AsyncMock(spec=LangChainResearchClient)
+        firestore_repo = AsyncMock(spec=FirestoreRepo)
+        orchestrator = _orchestrator(
+            gemini_client=gemini_client,
+            langchain_client=langchain_client,
+            firestore_repo=firestore_repo,
+            deadline_seconds=0.05,
+        )
+
+        async def hang(_prompt: str) -> str:
+            await asyncio.sleep(10)
+            return ""
+
+        gemini_client.run_research.side_effect = hang
+        langchain_client.run_research.return_value = "## TL;DR\n- LC"
+
+        report = await orchestrator.run_daily_research("2026-02-28")
+        assert report.status == ResearchStatus.TIMED_OUT
+        assert report.results[GEMINI].status == ResearchStatus.TIMED_OUT
+        assert report.results[LANGCHAIN].status == ResearchStatus.COMPLETED
+        deadline = langchain_client.run_research.call_args.kwargs["deadline"]
+        assert deadline.seconds == 0.05
+        final = firestore_repo.update_report.call_args.kwargs
+        assert final["status"] == ResearchStatus.TIMED_OUT
+
+
+class TestEngineSelection:
+    def setup_method(self) -> None:
+        self.gemini_client = AsyncMock(spec=GeminiResearchClient)
+        self.langchain_client = AsyncMock(spec=LangChainResearchClient)
+        self.firestore_repo = AsyncMock(spec=FirestoreRepo)
+
+    @pytest.mark.asyncio
+    async def test_runs_only_configured_engines(self) -> None:
+        orchestrator = _orchestrator(
+            self.gemini_client,
+            self.langchain_client,
+            self.firestore_repo,
+            engines=[LANGCHAIN],
+        )
+        self.langchain_client.run_research.return_value = "# LC"
+
+        report = await orchestrator.run_daily_research("2026-02-28")
+        assert list(report.results) == [LANGCHAIN]
+        self.gemini_client.run_research.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_max_parallel_engines_runs_them_in_turn(self) -> None:
+        orchestrator = _orchestrator(
+            self.gemini_client,
+            self.langchain_client,
+            self.firestore_repo,
+            max_parallel_engines=1,
+        )
+        active = 0
+        peak = 0
+
+        async def research(*_args: object, **_kwargs: object) -> str:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return "# Report"
+
+        self.gemini_client.run_research.side_effect = research
+        self.langchain_client.run_research.side_effect = research
+
+        report = await orchestrator.run_daily_research("2026-02-28")
+        assert peak == 1
+        assert set(report.results) == {GEMINI, LANGCHAIN}
+
+
+class TestProgressEvents:
+    def setup_method(self) -> None:
+        self.gemini_client = AsyncMock(spec=GeminiResearchClient)
+        self.langchain_client = AsyncMock(spec=LangChainResearchClient)
+        self.firestore_repo = AsyncMock(spec=FirestoreRepo)
+        self.bus = ProgressBus()
+        self.orchestrator = _orchestrator(
+            gemini_client=self.gemini_client,
+            langchain_client=self.langchain_client,
+            firestore_repo=self.firestore_repo,
+            stream_gemini=True,
+            progress_bus=self.bus,
+        )
+
+    @pytest.mark.asyncio
+    async def test_publishes_run_lifecycle(self) -> None:
+        async def stream(_prompt: str):  # type: ignore[no-untyped-def]
+            yield "## TL;DR\n- Item\n\n## Global Viral Events\n"
+
+        async def langchain(_prompt: str, **kwargs: object) -> str:
+            await kwargs["on_progress"](ProgressKind.SEARCH_FINISHED, {"hits": 7})
+            return "## TL;DR\n- LC"
+
+        self.gemini_client.stream_research = stream
+        self.langchain_client.run_research.side_effect = langchain
+        subscription = self.bus.subscribe("rpt-2026-02-28")
+
+        await self.orchestrator.run_daily_research("2026-02-28")
+        events = [event async for event in subscription]
+
+        kinds = [event.kind for event in events]
+        assert kinds[0] is ProgressKind.RUN_STARTED
+        assert kinds[-1] is ProgressKind.REPORT_SAVED
+        assert kinds.count(ProgressKind.ENGINE_COMPLETED) == 2
+        search = next(e for e in events if e.kind is ProgressKind.SEARCH_FINISHED)
+        assert search.engine is EngineType.LANGCHAIN
+        assert search.data == {"hits": 7}
+        section = next(
+            e for e in events if e.kind is ProgressKind.SECTION_GENERATED
+        )
+        assert section.engine is EngineType.GEMINI
+        completed = [e for e in events if e.kind is ProgressKind.ENGINE_COMPLETED]
+        assert {e.data["status"] for e in completed} == {"completed"}
+        assert all("duration_seconds" in e.data for e in completed)
+
+    @pytest.mark.asyncio
+    async def test_every_engine_failing_fails_the_report(self) -> None:
+        async def stream(_prompt: str):  # type: ignore[no-untyped-def]
+            raise Exception("gemini down")
+            yield ""
+
+        self.gemini_client.stream_research = stream
+        self.langchain_client.run_research.side_effect = Exception("lc down")
+        subscription = self.bus.subscribe("rpt-2026-02-28")
+
+        report = await self.orchestrator.run_daily_research("2026-02-28")
+
+        assert report.status == ResearchStatus.FAILED
+        final = self.firestore_repo.update_report.call_args.kwargs
+        assert final["status"] == ResearchStatus.FAILED
+        events = [event async for event in subscription]
+        assert events[-1].kind is ProgressKind.RUN_FAILED
+        assert "gemini down" in events[-1].data["error"]
+        assert "lc down" in events[-1].data["error"]
+
+    @pytest.mark.asyncio
+    async def test_save_failure_publishes_run_failed(self) -> None:
+        self.gemini_client.stream_research = AsyncMock()
+        self.langchain_client.run_research.return_value = "# LC"
+        self.firestore_repo.create_report.side_effect = FirestoreError("down")
+        subscription = self.bus.subscribe("rpt-2026-02-28")
+
+        with pytest.raises(FirestoreError):
+            await self.orchestrator.run_daily_research("2026-02-28")
+        events = [event async for event in subscription]
+        assert events[-1].kind is ProgressKind.RUN_FAILED
+        assert events[-1].data == {"error": "down"}
+
+
+class TestResumeLangChainRun:
+    def setup_method(self) -> None:
+        self.gemini_client = AsyncMock(spec=GeminiResearchClient)
+        self.langchain_client = AsyncMock(spec=LangChainResearchClient)
+        self.firestore_repo = AsyncMock(spec=FirestoreRepo)
+        self.orchestrator = _orchestrator(
+            gemini_client=self.gemini_client,
+            langchain_client=self.langchain_client,
+            firestore_repo=self.firestore_repo,
+        )
+
+    @pytest.mark.asyncio
+    async def test_langchain_run_keyed_on_report(self) -> None:
+        self.gemini_client.run_research.return_value = "# G"
+        self.langchain_client.run_research.return_value = "# LC"
+        await self.orchestrator.run_daily_research("2026-02-28")
+        self.langchain_client.run_research.assert_awaited_once()
+        assert (
+            self.langchain_client.run_research.call_args.kwargs["run_id"]
+            == "rpt-2026-02-28:langchain"
+        )
+
+    @pytest.mark.asyncio
+    async def test_resume_merges_into_existing_report(self) -> None:
+        self.gemini_client.run_research.return_value = "## TL;DR\n- G"
+        self.langchain_client.run_research.side_effect = Exception("crash")
+        first = await self.orchestrator.run_daily_research("2026-02-28")
+        self.firestore_repo.get_report.return_value = first
+        self.langchain_client.resume_research.return_value = "## TL;DR\n- LC"
+
+        report = await self.orchestrator.resume_langchain_run(
+            "rpt-2026-02-28:langchain"
+        )
+        self.langchain_client.resume_research.assert_awaited_once_with(
+            "rpt-2026-02-28:langchain"
+        )
+        assert report.report_id == "rpt-2026-02-28"
+        assert report.results[GEMINI] == first.results[GEMINI]
+        assert report.results[LANGCHAIN].status == ResearchStatus.COMPLETED
+        assert report.results[LANGCHAIN].tldr == "- LC"
+        final = self.firestore_repo.update_report.call_args.kwargs
+        assert final["status"] == ResearchStatus.COMPLETED
+        assert final["results"] == [report.results[LANGCHAIN]]
+
+    @pytest.mark.asyncio
+    async def test_resume_marks_report_running_then_failed(self) -> None:
+        self.firestore_repo.get_report.return_value = None
+        self.firestore_repo.create_report.return_value = False
+        self.langchain_client.resume_research.side_effect = Exception("crash")
+
+        report = await self.orchestrator.resume_langchain_run(
+            "rpt-2026-02-28:langchain"
+        )
+
+        assert report.status == ResearchStatus.FAILED
+        calls = self.firestore_repo.update_report.call_args_list
+        assert calls[0].kwargs == {"status": ResearchStatus.RUNNING}
+        assert calls[-1].kwargs["status"] == ResearchStatus.FAILED
+
+    @pytest.mark.asyncio
+    async def test_resume_rejects_foreign_run_id(self) -> None:
+        with pytest.raises(ValueError):
+            await self.orchestrator.resume_langchain_run("some-uuid")
@@ -0,0 +1,241 @@
+"""Tests for backend.service.run_queue."""
+
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+
+from backend.repo.run_store import RunStore
+from backend.service.progress_bus import ProgressBus
+from backend.service.run_queue import RunQueue
+from backend.types.enums import ProgressKind, ResearchStatus
+from backend.types.progress import ProgressEvent
+from backend.types.report import ResearchReport
+from backend.types.runs import ResearchRun
+
+
+def _report(date: str) -> ResearchReport:
+    now = datetime.now(timezone.utc)
+    status = {
+        "slow": ResearchStatus.TIMED_OUT,
+        "empty": ResearchStatus.FAILED,
+    }.get(date, ResearchStatus.COMPLETED)
+    return ResearchReport(
+        report_id=f"rpt-{date}",
+        run_date=now,
+        gemini_result=None,
+        langchain_result=None,
+        created_at=now,
+        status=status,
+    )
+
+
+class GatedRunner:
+    """Run function that blocks until released and tracks concurrency."""
+
+    def __init__(self) -> None:
+        self.release = asyncio.Event()
+        self.dates: list[str] = []
+        self.use_cache: list[bool] = []
+        self.active = 0
+        self.peak = 0
+
+    async def __call__(self, date: str, use_cache: bool) -> ResearchReport:
+        self.dates.append(date)
+        self.use_cache.append(use_cache)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await self.release.wait()
+        finally:
+            self.active -= 1
+        if date == "fail":
+            raise RuntimeError("engine exploded")
+        return _report(date)
+
+
+async def _wait_for(queue: RunQueue, run_id: str, status: ResearchStatus) -> None:
+    for _ in range(200):
+        if queue.get(run_id).status == status:
+            return
+        await asyncio.sleep(0.005)
+    raise AssertionError(f"{run_id} never reached {status}")
+
+
+class TestRunQueue:
+    @pytest.mark.asyncio
+    async def test_submit_returns_pending_run_immediately(self) -> None:
+        runner = GatedRunner()
+        queue = RunQueue(RunStore(), runner)
+        run = await queue.submit("2026-02-28")
+        assert run.status == ResearchStatus.PENDING
+        assert run.report_id == "rpt-2026-02-28"
+        await _wait_for(queue, run.run_id, ResearchStatus.RUNNING)
+        runner.release.set()
+        await _wait_for(queue, run.run_id, ResearchStatus.COMPLETED)
+        finished = queue.get(run.run_id)
+        assert finished.started_at is not None
+        assert finished.completed_at is not None
+        await queue.stop()
+
+    @pytest.mark.asyncio
+    async def test_cache_opt_out_reaches_run_fn(self) -> None:
+        runner = GatedRunner()
+        runner.release.set()
+        queue = RunQueue(RunStore(), runner)
+        run = await queue.submit("2026-02-28", use_cache=False)
+        assert run.use_cache is False
+        await _wait_for(queue, run.run_id, ResearchStatus.COMPLETED)
+        assert runner.use_cache == [False]
+        await queue.stop()
+
+    @pytest.mark.asyncio
+    async def test_failure_is_recorded(self) -> None:
+        runner = GatedRunner()
+        runner.release.set()
+        queue = RunQueue(RunStore(), runner)
+        run = await queue.submit("fail")
+        await _wait_for(queue, run.run_id, ResearchStatus.FAILED)
+        assert queue.get(run.run_id).error_message == "engine exploded"
+        await queue.stop()
+
+    @pytest.mark.asyncio
+    async def test_timed_out_report_is_recorded(self) -> None:
+        runner = GatedRunner()
+        runner.release.set()
+        queue = RunQueue(RunStore(), runner)
+        run = await queue.submit("slow")
+        await _wait_for(queue, run.run_id, ResearchStatus.TIMED_OUT)
+        assert queue.get(run.run_id).report_id == "rpt-slow"
+        await queue.stop()
+
+    @pytest.mark.asyncio
+    async def test_failed_report_fails_the_run(self) -> None:
+        runner = GatedRunner()
+        runner.release.set()
+        queue = RunQueue(RunStore(), runner)
+        run = await queue.submit("empty")
+        await _wait_for(queue, run.run_id, ResearchStatus.FAILED)
+        assert queue.get(run.run_id).error_message.startswith(
+            "No engine completed"
+        )
+        await queue.stop()
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self) -> None:
+        runner = GatedRunner()
+        queue = RunQueue(RunStore(), runner, max_concurrency=2)
+        runs = [await queue.submit(f"2026-02-{day}") for day in (25, 26, 27)]
+        await _wait_for(queue, runs[1].run_id, ResearchStatus.RUNNING)
+        await asyncio.sleep(0.02)
+        assert queue.get(runs[2].run_id).status == ResearchStatus.PENDING
+        runner.release.set()
+        await _wait_for(queue, runs[2].run_id, ResearchStatus.COMPLETED)
+        assert runner.peak == 2
+        await queue.stop()
+
+    @pytest.mark.asyncio
+    async def test_active_date_is_not_queued_twice(self) -> None:
+        runner = GatedRunner()
+        queue = RunQueue(RunStore(), runner)
+        first = await queue.submit("2026-02-28")
+        second = await queue.submit("2026-02-28")
+        assert second.run_id == first.run_id
+        runner.release.set()
+        await _wait_for(queue, first.run_id, ResearchStatus.COMPLETED)
+        assert runner.dates == ["2026-02-28"]
+        await queue.stop()
+
+    @pytest.mark.asyncio
+    async def test_new_run_clears_previous_progress_history(self) -> None:
+        runner = GatedRunner()
+        bus = ProgressBus()
+        bus.publish(
+            ProgressEvent(report_id="rpt-2026-02-28", kind=ProgressKind.REPORT_SAVED)
+        )
+        queue = RunQueue(RunStore(), runner, progress_bus=bus)
+        await queue.submit("2026-02-28")
+        subscription = bus.subscribe("rpt-2026-02-28")
+        with pytest.raises(TimeoutError):
+            await asyncio.wait_for(subscription.get(), 0.01)
+        runner.release.set()
+        await queue.stop()
+
+    @pytest.mark.asyncio
+    async def test_early_failure_ends_the_event_stream(self) -> None:
+        async def broken(_date: str, _use_cache: bool) -> ResearchReport:
+            raise RuntimeError("no firestore credentials")
+
+        bus = ProgressBus()
+        queue = RunQueue(RunStore(), broken, progress_bus=bus)
+        run = await queue.submit("2026-02-28")
+        subscription = bus.subscribe(run.report_id)
+        events = [event async for event in subscription]
+        assert [e.kind for e in events] == [ProgressKind.RUN_FAILED]
+        assert events[0].data == {"error": "no firestore credentials"}
+        await queue.stop()
+
+    @pytest.mark.asyncio
+    async def test_failure_already_announced_is_not_repeated(self) -> None:
+        bus = ProgressBus()
+
+        async def failing(date: str, _use_cache: bool) -> ResearchReport:
+            bus.publish(
+                ProgressEvent(
+                    report_id=f"rpt-{date}", kind=ProgressKind.RUN_FAILED
+                )
+            )
+            raise RuntimeError("engine exploded")
+
+        queue = RunQueue(RunStore(), failing, progress_bus=bus)
+        run = await queue.submit("2026-02-28")
+        await _wait_for(queue, run.run_id, ResearchStatus.FAILED)
+        assert bus.finished(run.report_id)
+        subscription = bus.subscribe(run.report_id)
+        await subscription.get()
+        with pytest.raises(TimeoutError):
+            await asyncio.wait_for(subscription.get(), 0.01)
+        await queue.stop()
+
+    @pytest.mark.asyncio
+    async def test_pending_and_interrupted_runs_resume_on_start(self) -> None:
+        store = RunStore()
+        now = datetime.now(timezone.utc)
+        for run_id, status in (
+            ("run-a", ResearchStatus.PENDING),
+            ("run-b", ResearchStatus.RUNNING),
+            ("run-c", ResearchStatus.COMPLETED),
+        ):
+            store.save(
+                ResearchRun(
+                    run_id=run_id,
+                    date=run_id,
+                    report_id=f"rpt-{run_id}",
+                    status=status,
+                    created_at=now,
+                )
+            )
+        runner = GatedRunner()
+        runner.release.set()
+        queue = RunQueue(store, runner)
+        await queue.start()
+        await _wait_for(queue, "run-a", ResearchStatus.COMPLETED)
+        await _wait_for(queue, "run-b", ResearchStatus.COMPLETED)
+        assert sorted(runner.dates) == ["run-a", "run-b"]
+        await queue.stop()
+
+    @pytest.mark.asyncio
+    async def test_stop_leaves_running_run_for_restart(self) -> None:
+        store = RunStore()
+        runner = GatedRunner()
+        queue = RunQueue(store, runner)
+        run = await queue.submit("2026-02-28")
+        await _wait_for(queue, run.run_id, ResearchStatus.RUNNING)
+        await queue.stop()
+        assert store.get(run.run_id).status == ResearchStatus.RUNNING
+
+        restarted = RunQueue(store, runner)
+        runner.release.set()
+        await restarted.start()
+        await _wait_for(restarted, run.run_id, ResearchStatus.COMPLETED)
+        await restarted.stop()
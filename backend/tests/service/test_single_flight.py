@@ -0,0 +1,90 @@
+"""Tests for backend.service.single_flight."""
+
+import asyncio
+
+import pytest
+
+from backend.service.single_flight import SingleFlight
+
+
+class TestSingleFlight:
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_call(self) -> None:
+        flights: SingleFlight[int] = SingleFlight()
+        calls: list[int] = []
+        release = asyncio.Event()
+
+        async def work() -> int:
+            calls.append(1)
+            await release.wait()
+            return 42
+
+        waiters = [
+            asyncio.ensure_future(flights.run("k", work)) for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        assert flights.in_flight() == ["k"]
+        release.set()
+        assert await asyncio.gather(*waiters) == [42, 42, 42]
+        assert calls == [1]
+
+    @pytest.mark.asyncio
+    async def test_different_keys_run_separately(self) -> None:
+        flights: SingleFlight[str] = SingleFlight()
+
+        async def work(key: str) -> str:
+            await asyncio.sleep(0)
+            return key
+
+        results = await asyncio.gather(
+            flights.run("a", lambda: work("a")),
+            flights.run("b", lambda: work("b")),
+        )
+        assert results == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_key_is_released_after_completion(self) -> None:
+        flights: SingleFlight[int] = SingleFlight()
+        calls: list[int] = []
+
+        async def work() -> int:
+            calls.append(1)
+            return len(calls)
+
+        assert await flights.run("k", work) == 1
+        await asyncio.sleep(0)
+        assert flights.in_flight() == []
+        assert await flights.run("k", work) == 2
+
+    @pytest.mark.asyncio
+    async def test_error_is_shared_then_released(self) -> None:
+        flights: SingleFlight[int] = SingleFlight()
+
+        async def work() -> int:
+            await asyncio.sleep(0)
+            raise RuntimeError("boom")
+
+        results = await asyncio.gather(
+            flights.run("k", work),
+            flights.run("k", work),
+            return_exceptions=True,
+        )
+        assert all(isinstance(r, RuntimeError) for r in results)
+        await asyncio.sleep(0)
+        assert flights.in_flight() == []
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_run(self) -> None:
+        flights: SingleFlight[int] = SingleFlight()
+        release = asyncio.Event()
+
+        async def work() -> int:
+            await release.wait()
+            return 7
+
+        first = asyncio.ensure_future(flights.run("k", work))
+        second = asyncio.ensure_future(flights.run("k", work))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+        assert await second == 7
@@ -0,0 +1,118 @@
+"""Tests for backend.service.streaming_report_parser."""
+
+import random
+
+import pytest
+
+from backend.service.report_parser import (
+    AUDIT_SECTION,
+    EVENTS_SECTION,
+    TLDR_SECTION,
+    ReportParser,
+)
+from backend.service.streaming_report_parser import StreamingReportParser
+from backend.tests.service.test_report_parser import SAMPLE_MARKDOWN
+
+LINE_VOCABULARY = [
+    "# Global AI Viral Intelligence Tracker v4.0",
+    "## TL;DR",
+    "##TL;DR",
+    "## Global Viral Events",
+    "##  Global Viral Events \t",
+    "## Strategic Deep Dives",
+    "## Completeness Audit",
+    "## Unrelated Section",
+    "##",
+    "###",
+    "### ",
+    "###Not A Block",
+    "#### Deeper heading",
+    "### GPT-5 Released",
+    "### \tGemini 3.0",
+    "- **Category**: product_launch",
+    "- **Category**: unknown",
+    "- **Impact Rating**: 9",
+    "- **Impact Rating**: many",
+    "- **Confidence**: low",
+    "- **Source**: OpenAI Blog",
+    "- **Priority**: HIGH",
+    "- **Summary**: Something happened.",
+    "- **Key Findings**",
+    "- **Key Findings**:",
+    "  - nested finding",
+    "- plain bullet",
+    "- **Verified Signals**: 42",
+    "- **Verified Signals**: lots",
+    "- **Sources Checked**: 15",
+    "- **Confidence Score**: 0.87",
+    "- **Gaps**: Asia, , startups",
+    "Free text paragraph.",
+    "",
+    "   ",
+]
+
+
+def _random_document(rng: random.Random) -> str:
+    lines = [rng.choice(LINE_VOCABULARY) for _ in range(rng.randint(0, 60))]
+    return "\n".join(lines) + rng.choice(["", "\n", "\n\n"])
+
+
+def _random_chunks(rng: random.Random, text: str) -> list[str]:
+    cuts = sorted(rng.sample(range(len(text) + 1), min(len(text), 8)))
+    bounds = [0, *cuts, len(text)]
+    return [text[a:b] for a, b in zip(bounds, bounds[1:])]
+
+
+def _stream(chunks: list[str]) -> tuple[StreamingReportParser, list]:
+    parser = StreamingReportParser()
+    items = []
+    for chunk in chunks:
+        items.extend(parser.feed(chunk))
+    items.extend(parser.close())
+    return parser, items
+
+
+class TestStreamingReportParser:
+    def test_matches_batch_parser_on_sample(self) -> None:
+        parser, _ = _stream([SAMPLE_MARKDOWN])
+        assert parser.result() == ReportParser().parse(SAMPLE_MARKDOWN)
+
+    def test_emits_event_when_next_block_starts(self) -> None:
+        parser = StreamingReportParser()
+        assert parser.feed("## Global Viral Events\n### First\n") == []
+        emitted = parser.feed("- **Impact Rating**: 7\n### Second\n")
+        assert [(s, e.headline) for s, e in emitted] == [
+            (EVENTS_SECTION, "First")
+        ]
+
+    def test_emits_tldr_and_audit_when_sections_end(self) -> None:
+        parser = StreamingReportParser()
+        parser.feed("## TL;DR\n- one\n")
+        assert parser.feed("## Completeness Audit\n") == [
+            (TLDR_SECTION, "- one")
+        ]
+        parser.feed("- **Verified Signals**: 3")
+        ((section, audit),) = parser.close()
+        assert section == AUDIT_SECTION
+        assert audit.verified_signals == 3
+        assert parser.sections_closed == 2
+
+    def test_feed_after_close_raises(self) -> None:
+        parser = StreamingReportParser()
+        parser.close()
+        with pytest.raises(ValueError):
+            parser.feed("more")
+
+
+class TestStreamingMatchesBatchProperty:
+    @pytest.mark.parametrize("seed", range(500))
+    def test_random_documents_and_chunkings(self, seed: int) -> None:
+        rng = random.Random(seed)
+        document = _random_document(rng)
+        expected = ReportParser().parse(document)
+
+        parser, items = _stream(_random_chunks(rng, document))
+        assert parser.result() == expected
+        assert [i for s, i in items if s == EVENTS_SECTION] == (
+            expected.viral_events
+        )
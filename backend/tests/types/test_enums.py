@@ -32,9 +32,12 @@ class TestResearchStatus:
     def test_failed_value(self) -> None:
         assert ResearchStatus.FAILED.value == "failed"
 
+    def test_timed_out_value(self) -> None:
+        assert ResearchStatus.TIMED_OUT.value == "timed_out"
+
     def test_all_members(self) -> None:
         members = {s.value for s in ResearchStatus}
-        assert members == {"pending", "running", "completed", "failed"}
+        assert members == {"pending", "running", "completed", "failed", "timed_out"}
 
 
 class TestConfidenceLevel:
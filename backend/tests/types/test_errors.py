@@ -7,6 +7,8 @@ from backend.types.errors import (
     FirestoreError,
     GeminiApiError,
     LangChainError,
+    SearchError,
+    TokenizerError,
 )
 
 
@@ -36,6 +38,19 @@ class TestLangChainError:
         assert isinstance(err, EngineError)
 
 
+class TestSearchError:
+    def test_inherits_engine_error(self) -> None:
+        err = SearchError("search issue")
+        assert isinstance(err, EngineError)
+
+
+class TestTokenizerError:
+    def test_inherits_app_error(self) -> None:
+        err = TokenizerError("tokenizer issue")
+        assert isinstance(err, AppError)
+        assert not isinstance(err, EngineError)
+
+
 class TestFirestoreError:
     def test_inherits_app_error(self) -> None:
         err = FirestoreError("db issue")
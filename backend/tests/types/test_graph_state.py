@@ -47,6 +47,8 @@ class TestResearchGraphState:
         state: ResearchGraphState = {
             "prompt": "Research prompt",
             "search_context": "context",
+            "search_hits": ["context"],
+            "duplicate_tokens_saved": 0,
             "full_prompt": "full prompt",
             "section_results": [],
             "combined_markdown": "",
@@ -60,9 +62,12 @@ class TestResearchGraphState:
         hints = get_type_hints(ResearchGraphState, include_extras=True)
         assert "prompt" in hints
         assert "search_context" in hints
+        assert "search_hits" in hints
+        assert "duplicate_tokens_saved" in hints
         assert "full_prompt" in hints
         assert "section_results" in hints
         assert "combined_markdown" in hints
+        assert "token_usage" in hints
         assert "run_id" in hints
         assert "date" in hints
 
@@ -73,8 +73,7 @@ class TestResearchReport:
             created_at=now,
         )
         assert report.report_id == "rpt-2026-02-28"
-        assert report.gemini_result is not None
-        assert report.langchain_result is None
+        assert report.results == {EngineType.GEMINI: gemini_result}
 
     def test_serialization_round_trip(self) -> None:
         now = datetime(2026, 2, 28, tzinfo=timezone.utc)
@@ -88,3 +87,64 @@ class TestResearchReport:
         data = report.model_dump()
         restored = ResearchReport.model_validate(data)
         assert restored.report_id == report.report_id
+
+    def test_results_keyed_by_engine_round_trip(self) -> None:
+        now = datetime(2026, 2, 28, tzinfo=timezone.utc)
+        result = _result(EngineType.LANGCHAIN, now)
+        report = ResearchReport(
+            report_id="rpt-test",
+            run_date=now,
+            results={EngineType.LANGCHAIN: result},
+            created_at=now,
+        )
+        data = report.model_dump(mode="json")
+        assert list(data["results"]) == ["langchain"]
+        assert "langchain_result" not in data
+        assert ResearchReport.model_validate(data) == report
+
+    def test_legacy_document_folds_into_results(self) -> None:
+        now = datetime(2026, 2, 28, tzinfo=timezone.utc)
+        legacy = {
+            "report_id": "rpt-old",
+            "run_date": now.isoformat(),
+            "gemini_result": _result(EngineType.GEMINI, now).model_dump(
+                mode="json"
+            ),
+            "langchain_result": None,
+            "created_at": now.isoformat(),
+        }
+        report = ResearchReport.model_validate(legacy)
+        assert list(report.results) == [EngineType.GEMINI]
+        assert report.results[EngineType.GEMINI].tldr == "summary"
+        assert report.status == ResearchStatus.COMPLETED
+
+    def test_legacy_fields_merge_with_newer_results(self) -> None:
+        now = datetime(2026, 2, 28, tzinfo=timezone.utc)
+        resumed = _result(EngineType.LANGCHAIN, now).model_dump(mode="json")
+        data = {
+            "report_id": "rpt-old",
+            "run_date": now.isoformat(),
+            "gemini_result": _result(EngineType.GEMINI, now).model_dump(
+                mode="json"
+            ),
+            "results": {"langchain": resumed},
+            "created_at": now.isoformat(),
+        }
+        report = ResearchReport.model_validate(data)
+        assert set(report.results) == {EngineType.GEMINI, EngineType.LANGCHAIN}
+
+
+def _result(engine: EngineType, now: datetime) -> EngineResult:
+    return EngineResult(
+        engine=engine,
+        status=ResearchStatus.COMPLETED,
+        raw_markdown="# Report",
+        tldr="summary",
+        viral_events=[],
+        deep_dives=[],
+        completeness_audit=None,
+        started_at=now,
+        completed_at=now,
+        duration_seconds=1.0,
+        error_message=None,
+    )
@@ -0,0 +1,19 @@
+"""Tests for backend.types.routing."""
+
+import pytest
+from pydantic import ValidationError
+
+from backend.types.routing import SectionRoute
+
+
+class TestSectionRoute:
+    def test_defaults_inherit_everything(self) -> None:
+        route = SectionRoute()
+        assert route.model is None
+        assert route.max_tokens is None
+        assert route.temperature is None
+
+    def test_is_frozen(self) -> None:
+        route = SectionRoute(model="gpt-5")
+        with pytest.raises(ValidationError):
+            route.model = "gpt-4o"  # type: ignore[misc]
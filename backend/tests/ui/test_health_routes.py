@@ -15,3 +15,8 @@ class TestHealthRoutes:
         assert resp.status_code == 200
         data = resp.json()
         assert data["status"] == "ok"
+
+    def test_health_reports_circuit_states(self) -> None:
+        circuits = self.client.get("/health").json()["circuits"]
+        assert set(circuits) == {"openai", "gemini", "tavily"}
+        assert circuits["openai"]["state"] in {"closed", "open", "half_open"}
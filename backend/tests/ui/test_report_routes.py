@@ -62,6 +62,10 @@ class TestReportRoutes:
         assert resp.status_code == 200
         data = resp.json()
         assert data["total"] == 1
+        summary = data["reports"][0]
+        assert summary["status"] == "completed"
+        assert summary["tldrs"] == {"gemini": summary["gemini_tldr"]}
+        assert summary["langchain_tldr"] is None
 
     def test_get_report_found(self) -> None:
         report = _make_report("rpt-123")
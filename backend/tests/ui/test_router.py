@@ -15,3 +15,5 @@ class TestRegisterRoutes:
         assert "/api/reports/" in paths
         assert "/api/reports/{report_id}" in paths
         assert "/api/reports/trigger" in paths
+        assert "/api/runs/{run_id}" in paths
+        assert "/api/runs/{run_id}/events" in paths
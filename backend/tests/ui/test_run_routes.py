@@ -0,0 +1,191 @@
+"""Tests for backend.ui.run_routes."""
+
+import asyncio
+import json
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+from fastapi.testclient import TestClient
+
+from backend.repo.run_store import RunStore
+from backend.runtime.dependencies import get_progress_bus, get_run_queue
+from backend.service.progress_bus import ProgressBus
+from backend.service.run_queue import RunQueue
+from backend.types.enums import ProgressKind, ResearchStatus
+from backend.types.progress import ProgressEvent
+from backend.types.report import ResearchReport
+from backend.types.runs import ResearchRun
+from backend.ui.app_factory import create_app
+
+
+def _run(status: ResearchStatus = ResearchStatus.PENDING) -> ResearchRun:
+    return ResearchRun(
+        run_id="run-abc",
+        date="2026-02-28",
+        report_id="rpt-2026-02-28",
+        status=status,
+        created_at=datetime(2026, 2, 28, tzinfo=timezone.utc),
+    )
+
+
+def _parse_sse(body: str) -> list[tuple[str, dict[str, object]]]:
+    events = []
+    for block in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.splitlines())
+        if "event" in lines:
+            events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+class TestRunRoutes:
+    def setup_method(self) -> None:
+        self.app = create_app()
+        self.queue = MagicMock(spec=RunQueue)
+        self.queue.submit = AsyncMock(return_value=_run())
+        self.bus = ProgressBus()
+        self.app.dependency_overrides[get_run_queue] = lambda: self.queue
+        self.app.dependency_overrides[get_progress_bus] = lambda: self.bus
+        self.client = TestClient(self.app)
+        token = self.client.post(
+            "/api/auth/login", json={"password": "test-password"}
+        ).json()["access_token"]
+        self.headers = {"Authorization": f"Bearer {token}"}
+
+    def teardown_method(self) -> None:
+        self.app.dependency_overrides.clear()
+
+    def test_trigger_returns_202_with_run_id(self) -> None:
+        resp = self.client.post(
+            "/api/reports/trigger",
+            json={"date": "2026-02-28"},
+            headers=self.headers,
+        )
+        assert resp.status_code == 202
+        assert resp.json() == {
+            "run_id": "run-abc",
+            "report_id": "rpt-2026-02-28",
+            "status": "pending",
+        }
+        self.queue.submit.assert_awaited_once_with("2026-02-28", use_cache=True)
+
+    def test_trigger_can_bypass_llm_cache(self) -> None:
+        resp = self.client.post(
+            "/api/reports/trigger",
+            json={"date": "2026-02-28", "use_cache": False},
+            headers=self.headers,
+        )
+        assert resp.status_code == 202
+        self.queue.submit.assert_awaited_once_with(
+            "2026-02-28", use_cache=False
+        )
+
+    def test_get_run_status(self) -> None:
+        self.queue.get.return_value = _run(ResearchStatus.RUNNING)
+        resp = self.client.get("/api/runs/run-abc", headers=self.headers)
+        assert resp.status_code == 200
+        assert resp.json()["status"] == "running"
+
+    def test_unknown_run_is_404(self) -> None:
+        self.queue.get.return_value = None
+        resp = self.client.get("/api/runs/run-nope", headers=self.headers)
+        assert resp.status_code == 404
+
+    def test_run_status_requires_auth(self) -> None:
+        assert self.client.get("/api/runs/run-abc").status_code == 401
+
+    def test_finished_run_gets_single_terminal_event(self) -> None:
+        self.queue.get.return_value = _run(ResearchStatus.COMPLETED)
+        resp = self.client.get("/api/runs/run-abc/events", headers=self.headers)
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("text/event-stream")
+        events = _parse_sse(resp.text)
+        assert [kind for kind, _ in events] == ["report_saved"]
+
+    def test_active_run_streams_until_terminal_event(self) -> None:
+        self.queue.get.return_value = _run(ResearchStatus.RUNNING)
+        for kind, data in (
+            (ProgressKind.RUN_STARTED, {}),
+            (ProgressKind.SEARCH_FINISHED, {"hits": 4}),
+            (ProgressKind.REPORT_SAVED, {}),
+        ):
+            self.bus.publish(
+                ProgressEvent(report_id="rpt-2026-02-28", kind=kind, data=data)
+            )
+        resp = self.client.get("/api/runs/run-abc/events", headers=self.headers)
+        events = _parse_sse(resp.text)
+        assert [kind for kind, _ in events] == [
+            "run_started",
+            "search_finished",
+            "report_saved",
+        ]
+        assert events[1][1]["data"] == {"hits": 4}
+        assert self.bus.subscriber_count("rpt-2026-02-28") == 0
+
+    def test_unknown_run_events_is_404(self) -> None:
+        self.queue.get.return_value = None
+        resp = self.client.get("/api/runs/run-nope/events", headers=self.headers)
+        assert resp.status_code == 404
+
+    def test_events_require_auth(self) -> None:
+        assert self.client.get("/api/runs/run-abc/events").status_code == 401
+
+    def test_events_accept_token_query_param(self) -> None:
+        self.queue.get.return_value = _run(ResearchStatus.COMPLETED)
+        token = self.headers["Authorization"].removeprefix("Bearer ")
+        resp = self.client.get(f"/api/runs/run-abc/events?access_token={token}")
+        assert resp.status_code == 200
+        bad = self.client.get("/api/runs/run-abc/events?access_token=nope")
+        assert bad.status_code == 401
+
+
+class TestRerunEvents:
+    def setup_method(self) -> None:
+        self.app = create_app()
+        self.bus = ProgressBus()
+        self.queue = RunQueue(RunStore(), self._run_daily, progress_bus=self.bus)
+        self.app.dependency_overrides[get_run_queue] = lambda: self.queue
+        self.app.dependency_overrides[get_progress_bus] = lambda: self.bus
+
+    def teardown_method(self) -> None:
+        self.app.dependency_overrides.clear()
+
+    async def _run_daily(self, date: str, use_cache: bool) -> ResearchReport:
+        report_id = f"rpt-{date}"
+        await asyncio.sleep(0.2)
+        for kind, data in (
+            (ProgressKind.RUN_STARTED, {"date": date}),
+            (ProgressKind.SEARCH_FINISHED, {"hits": 2}),
+            (ProgressKind.REPORT_SAVED, {}),
+        ):
+            self.bus.publish(
+                ProgressEvent(report_id=report_id, kind=kind, data=data)
+            )
+        now = datetime.now(timezone.utc)
+        return ResearchReport(report_id=report_id, run_date=now, created_at=now)
+
+    def test_retriggered_date_streams_the_new_run(self) -> None:
+        for kind in (ProgressKind.RUN_STARTED, ProgressKind.RUN_FAILED):
+            self.bus.publish(
+                ProgressEvent(
+                    report_id="rpt-2026-02-28", kind=kind, data={"old": True}
+                )
+            )
+        with TestClient(self.app) as client:
+            token = client.post(
+                "/api/auth/login", json={"password": "test-password"}
+            ).json()["access_token"]
+            headers = {"Authorization": f"Bearer {token}"}
+            run_id = client.post(
+                "/api/reports/trigger",
+                json={"date": "2026-02-28"},
+                headers=headers,
+            ).json()["run_id"]
+            resp = client.get(f"/api/runs/{run_id}/events", headers=headers)
+
+        events = _parse_sse(resp.text)
+        assert [kind for kind, _ in events] == [
+            "run_started",
+            "search_finished",
+            "report_saved",
+        ]
+        assert all("old" not in data["data"] for _, data in events)
@@ -17,6 +17,27 @@ class ResearchStatus(str, Enum):
     RUNNING = "running"
     COMPLETED = "completed"
     FAILED = "failed"
+    TIMED_OUT = "timed_out"
+
+
+class ProgressKind(str, Enum):
+    """Lifecycle event published while a research run progresses."""
+
+    RUN_STARTED = "run_started"
+    SEARCH_STARTED = "search_started"
+    SEARCH_FINISHED = "search_finished"
+    SECTION_GENERATED = "section_generated"
+    ENGINE_COMPLETED = "engine_completed"
+    REPORT_SAVED = "report_saved"
+    RUN_FAILED = "run_failed"
+
+
+class CircuitState(str, Enum):
+    """State of a provider circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
 
 
 class ConfidenceLevel(str, Enum):
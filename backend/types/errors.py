@@ -17,9 +17,25 @@ class LangChainError(EngineError):
     """Error from the LangChain research pipeline."""
 
 
+class SearchError(EngineError):
+    """Error from the web search provider."""
+
+
+class CircuitOpenError(EngineError):
+    """A provider's circuit breaker is open, so the call was not made."""
+
+
+class DeadlineExceededError(EngineError):
+    """The run's deadline expired before the work finished."""
+
+
 class FirestoreError(AppError):
     """Error from Firestore operations."""
 
 
+class TokenizerError(AppError):
+    """Error loading or validating a tokenizer encoding."""
+
+
 class AuthError(AppError):
     """Authentication or authorization error."""
@@ -9,6 +9,11 @@ class SectionResult(TypedDict):
 
     section_name: str
     content: str
+    model: str
+    latency_seconds: float
+    input_tokens: int
+    cached_tokens: int
+    output_tokens: int
 
 
 class SectionGenerateState(TypedDict):
@@ -19,13 +24,35 @@ class SectionGenerateState(TypedDict):
     full_prompt: str
 
 
+class ChunkSummaryState(TypedDict):
+    """Input state sent to each parallel chunk summarizer via Send()."""
+
+    chunk_index: int
+    prompt: str
+    chunk: str
+
+
+class ChunkSummary(TypedDict):
+    """Output from summarizing one chunk of search context."""
+
+    chunk_index: int
+    summary: str
+    input_tokens: int
+    cached_tokens: int
+    output_tokens: int
+
+
 class ResearchGraphState(TypedDict):
     """Top-level state flowing through the LangGraph research pipeline."""
 
     prompt: str
     search_context: str
+    search_hits: list[str]
+    duplicate_tokens_saved: int
     full_prompt: str
+    chunk_summaries: Annotated[list[ChunkSummary], operator.add]
     section_results: Annotated[list[SectionResult], operator.add]
     combined_markdown: str
+    token_usage: dict[str, int]
     run_id: str
     date: str
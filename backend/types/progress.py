@@ -0,0 +1,28 @@
+"""Run progress event models."""
+
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timezone
+
+from pydantic import BaseModel, Field
+
+from backend.types.enums import EngineType, ProgressKind
+
+TERMINAL_KINDS = frozenset({ProgressKind.REPORT_SAVED, ProgressKind.RUN_FAILED})
+
+# Engine-side hook: (kind, details) for one lifecycle step.
+ProgressCallback = Callable[[ProgressKind, dict[str, object]], Awaitable[None]]
+
+
+class ProgressEvent(BaseModel):
+    """One lifecycle step of a research run, keyed by its report ID."""
+
+    report_id: str
+    kind: ProgressKind
+    engine: EngineType | None = None
+    data: dict[str, object] = {}
+    at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+    @property
+    def terminal(self) -> bool:
+        """Whether this event ends the run's stream."""
+        return self.kind in TERMINAL_KINDS
@@ -2,14 +2,28 @@
 
 from datetime import datetime
 
-from pydantic import BaseModel
+from pydantic import BaseModel, model_validator
 
 from backend.types.enums import EngineType, ResearchStatus
 from backend.types.events import CompletenessAudit, DeepDive, ViralEvent
 
 
+class ParsedReport(BaseModel):
+    """Structured sections parsed from an engine's markdown output."""
+
+    tldr: str
+    viral_events: list[ViralEvent]
+    deep_dives: list[DeepDive]
+    completeness_audit: CompletenessAudit | None
+
+
 class EngineResult(BaseModel):
-    """Result from a single research engine run."""
+    """Result from a single research engine run.
+
+    ``timings`` maps each finished stage (search, a section) to how
+    long it took in seconds; a timed-out run keeps the stages it got
+    through.
+    """
 
     engine: EngineType
     status: ResearchStatus
@@ -22,13 +36,39 @@ class EngineResult(BaseModel):
     completed_at: datetime
     duration_seconds: float
     error_message: str | None
+    timings: dict[str, float] = {}
 
 
 class ResearchReport(BaseModel):
-    """A daily research report combining both engine results."""
+    """A daily research report combining every engine's result.
+
+    ``results`` is keyed by engine. Documents written before engines
+    were pluggable keep one ``<engine>_result`` field per engine; those
+    are folded into ``results`` on read. ``status`` is RUNNING while
+    engine results are still being merged in; documents written before
+    it existed read as COMPLETED.
+    """
 
     report_id: str
     run_date: datetime
-    gemini_result: EngineResult | None
-    langchain_result: EngineResult | None
+    results: dict[EngineType, EngineResult] = {}
     created_at: datetime
+    status: ResearchStatus = ResearchStatus.COMPLETED
+
+    @model_validator(mode="before")
+    @classmethod
+    def _fold_legacy_results(cls, data: object) -> object:
+        """Move legacy per-engine fields into ``results``."""
+        if not isinstance(data, dict):
+            return data
+        legacy = [f"{engine.value}_result" for engine in EngineType]
+        if not any(key in data for key in legacy):
+            return data
+        data = dict(data)
+        results = dict(data.get("results") or {})
+        for engine in EngineType:
+            result = data.pop(f"{engine.value}_result", None)
+            if result is not None:
+                results.setdefault(engine.value, result)
+        data["results"] = results
+        return data
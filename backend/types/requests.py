@@ -4,23 +4,41 @@ from datetime import datetime
 
 from pydantic import BaseModel
 
-from backend.types.enums import ResearchStatus
+from backend.types.enums import EngineType, ResearchStatus
 
 
 class ResearchRequest(BaseModel):
-    """Request to trigger a research run."""
+    """Request to trigger a research run.
+
+    ``use_cache=False`` regenerates every section instead of reusing
+    cached LLM responses.
+    """
 
     date: str | None = None
+    use_cache: bool = True
+
+
+class TriggerResponse(BaseModel):
+    """Acknowledgement of a queued research run."""
+
+    run_id: str
+    report_id: str
+    status: ResearchStatus
 
 
 class ReportSummary(BaseModel):
-    """Summary of a report for list views."""
+    """Summary of a report for list views.
+
+    ``tldrs`` covers every engine; the per-engine TL;DR fields are kept
+    for existing clients.
+    """
 
     report_id: str
     run_date: datetime
     status: ResearchStatus
     gemini_tldr: str | None
     langchain_tldr: str | None
+    tldrs: dict[EngineType, str | None] = {}
 
 
 class ReportListResponse(BaseModel):
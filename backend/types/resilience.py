@@ -0,0 +1,46 @@
+"""Retry, rate-limit and circuit-breaker models for provider calls."""
+
+from pydantic import BaseModel
+
+from backend.types.enums import CircuitState
+
+
+class RetryPolicy(BaseModel):
+    """How often and how long to back off on retryable provider errors."""
+
+    model_config = {"frozen": True}
+
+    max_attempts: int = 4
+    base_delay_seconds: float = 1.0
+    max_delay_seconds: float = 30.0
+
+
+class CircuitPolicy(BaseModel):
+    """When a provider's breaker opens and how long it stays open."""
+
+    model_config = {"frozen": True}
+
+    failure_rate_threshold: float = 0.5
+    window_seconds: float = 60.0
+    min_calls: int = 5
+    open_seconds: float = 30.0
+
+
+class CircuitStatus(BaseModel):
+    """Point-in-time view of one provider's circuit breaker."""
+
+    state: CircuitState
+    failure_rate: float
+    calls: int
+    retry_in_seconds: float = 0.0
+
+
+class HedgePolicy(BaseModel):
+    """When to send a duplicate request and how many extras to allow."""
+
+    model_config = {"frozen": True}
+
+    quantile: float = 0.9
+    budget_ratio: float = 0.1
+    window: int = 100
+    min_samples: int = 20
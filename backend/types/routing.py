@@ -0,0 +1,16 @@
+"""Per-section LLM routing configuration."""
+
+from pydantic import BaseModel
+
+
+class SectionRoute(BaseModel):
+    """Model and generation overrides for one report section.
+
+    Unset fields fall back to the client's default model and parameters.
+    """
+
+    model_config = {"frozen": True, "protected_namespaces": ()}
+
+    model: str | None = None
+    max_tokens: int | None = None
+    temperature: float | None = None
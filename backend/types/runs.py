@@ -0,0 +1,21 @@
+"""Queued research run models."""
+
+from datetime import datetime
+
+from pydantic import BaseModel
+
+from backend.types.enums import ResearchStatus
+
+
+class ResearchRun(BaseModel):
+    """A research run accepted by the queue, tracked until it finishes."""
+
+    run_id: str
+    date: str
+    report_id: str
+    use_cache: bool = True
+    status: ResearchStatus = ResearchStatus.PENDING
+    error_message: str | None = None
+    created_at: datetime
+    started_at: datetime | None = None
+    completed_at: datetime | None = None
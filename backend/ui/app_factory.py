@@ -3,10 +3,17 @@
 import logging
 import os
 import warnings
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from backend.runtime.dependencies import (
+    close_clients,
+    get_run_queue,
+    preload_tokenizer,
+)
 from backend.ui.router import register_routes
 
 # Suppress noisy Google ADC quota-project warning (harmless with gcloud auth)
@@ -29,14 +36,32 @@ def _configure_logging() -> None:
     logging.getLogger("langchain").setLevel(logging.WARNING)
 
 
+@asynccontextmanager
+async def _lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Run the research queue workers for the lifetime of the server.
+
+    On shutdown the workers stop first, then the pooled HTTP clients,
+    checkpoint database and SDK clients they used are closed.
+    """
+    queue = app.dependency_overrides.get(get_run_queue, get_run_queue)()
+    await queue.start()
+    try:
+        yield
+    finally:
+        await queue.stop()
+        await close_clients()
+
+
 def create_app() -> FastAPI:
     """Create and configure the FastAPI application."""
     _configure_logging()
+    preload_tokenizer()
 
     app = FastAPI(
         title="Deep Research Agent",
         description="AI Intelligence Tracker API",
         version="1.0.0",
+        lifespan=_lifespan,
     )
 
     origins = os.environ.get(
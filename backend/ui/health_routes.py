@@ -2,10 +2,12 @@
 
 from fastapi import APIRouter
 
+from backend.runtime.dependencies import get_circuit_statuses
+
 router = APIRouter()
 
 
 @router.get("/health")
-async def health_check() -> dict[str, str]:
-    """Return service health status."""
-    return {"status": "ok"}
+async def health_check() -> dict[str, object]:
+    """Return service health status and each provider's circuit state."""
+    return {"status": "ok", "circuits": get_circuit_statuses()}
@@ -3,22 +3,23 @@
 import logging
 from datetime import datetime, timezone
 
-from fastapi import APIRouter, Depends, Header, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException, status
 
 from backend.runtime.dependencies import (
     get_auth_service,
     get_firestore_repo,
-    get_orchestrator,
+    get_run_queue,
 )
 from backend.service.auth_service import AuthService
 from backend.repo.firestore_client import FirestoreRepo
-from backend.service.research_orchestrator import ResearchOrchestrator
-from backend.types.enums import ResearchStatus
+from backend.service.run_queue import RunQueue
+from backend.types.enums import EngineType, ResearchStatus
 from backend.types.report import ResearchReport
 from backend.types.requests import (
     ReportListResponse,
     ReportSummary,
     ResearchRequest,
+    TriggerResponse,
 )
 from backend.types.errors import FirestoreError
 from backend.ui.auth_middleware import require_auth
@@ -36,24 +37,22 @@ def _auth_dep(
 
 
 def _summarize(report: ResearchReport) -> ReportSummary:
-    gemini_tldr = None
-    langchain_tldr = None
+    """Completed if any engine completed, else the first engine's status."""
+    statuses = [result.status for result in report.results.values()]
     status = ResearchStatus.PENDING
-
-    if report.gemini_result:
-        gemini_tldr = report.gemini_result.tldr
-        status = report.gemini_result.status
-    if report.langchain_result:
-        langchain_tldr = report.langchain_result.tldr
-        if report.langchain_result.status == ResearchStatus.COMPLETED:
-            status = ResearchStatus.COMPLETED
+    if ResearchStatus.COMPLETED in statuses:
+        status = ResearchStatus.COMPLETED
+    elif statuses:
+        status = statuses[0]
+    tldrs = {engine: result.tldr for engine, result in report.results.items()}
 
     return ReportSummary(
         report_id=report.report_id,
         run_date=report.run_date,
         status=status,
-        gemini_tldr=gemini_tldr,
-        langchain_tldr=langchain_tldr,
+        gemini_tldr=tldrs.get(EngineType.GEMINI),
+        langchain_tldr=tldrs.get(EngineType.LANGCHAIN),
+        tldrs=tldrs,
     )
 
 
@@ -94,19 +93,20 @@ async def get_report(
     return report
 
 
-@router.post("/trigger")
+@router.post(
+    "/trigger",
+    response_model=TriggerResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
 async def trigger_research(
     request: ResearchRequest,
     _user: dict[str, str] = Depends(_auth_dep),
-    orchestrator: ResearchOrchestrator = Depends(get_orchestrator),
-) -> dict[str, str]:
-    """Trigger a new research run."""
+    queue: RunQueue = Depends(get_run_queue),
+) -> TriggerResponse:
+    """Queue a research run; poll ``/api/runs/{run_id}`` for progress."""
     date = _get_date_or_today(request.date)
     logger.info("Research trigger requested for date=%s", date)
-    try:
-        report = await orchestrator.run_daily_research(date)
-    except FirestoreError as exc:
-        logger.error("Firestore unavailable: %s", exc)
-        raise HTTPException(status_code=503, detail=str(exc)) from exc
-    logger.info("Research complete report_id=%s", report.report_id)
-    return {"report_id": report.report_id, "status": "triggered"}
+    run = await queue.submit(date, use_cache=request.use_cache)
+    return TriggerResponse(
+        run_id=run.run_id, report_id=run.report_id, status=run.status
+    )
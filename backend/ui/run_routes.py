@@ -0,0 +1,118 @@
+"""Research run status routes."""
+
+import asyncio
+from collections.abc import AsyncIterator
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi.responses import StreamingResponse
+
+from backend.runtime.dependencies import (
+    get_auth_service,
+    get_progress_bus,
+    get_run_queue,
+)
+from backend.service.auth_service import AuthService
+from backend.service.progress_bus import ProgressBus
+from backend.service.run_queue import RunQueue
+from backend.types.enums import ProgressKind, ResearchStatus
+from backend.types.progress import ProgressEvent
+from backend.types.runs import ResearchRun
+from backend.ui.auth_middleware import require_auth
+
+router = APIRouter(prefix="/api/runs", tags=["runs"])
+
+KEEPALIVE_SECONDS = 15.0
+FINISHED_KINDS = {
+    ResearchStatus.COMPLETED: ProgressKind.REPORT_SAVED,
+    ResearchStatus.TIMED_OUT: ProgressKind.REPORT_SAVED,
+    ResearchStatus.FAILED: ProgressKind.RUN_FAILED,
+}
+
+
+def _auth_dep(
+    authorization: str | None = Header(None),
+    auth_service: AuthService = Depends(get_auth_service),
+) -> dict[str, str]:
+    return require_auth(authorization, auth_service)
+
+
+def _stream_auth_dep(
+    authorization: str | None = Header(None),
+    access_token: str | None = Query(None),
+    auth_service: AuthService = Depends(get_auth_service),
+) -> dict[str, str]:
+    """Accept the token as ``?access_token=`` too.
+
+    A browser EventSource cannot set an Authorization header.
+    """
+    if authorization is None and access_token is not None:
+        authorization = f"Bearer {access_token}"
+    return require_auth(authorization, auth_service)
+
+
+def _get_run_or_404(queue: RunQueue, run_id: str) -> ResearchRun:
+    run = queue.get(run_id)
+    if run is None:
+        raise HTTPException(status_code=404, detail="Run not found")
+    return run
+
+
+def _sse(event: ProgressEvent) -> str:
+    return f"event: {event.kind.value}\ndata: {event.model_dump_json()}\n\n"
+
+
+@router.get("/{run_id}", response_model=ResearchRun)
+async def get_run(
+    run_id: str,
+    _user: dict[str, str] = Depends(_auth_dep),
+    queue: RunQueue = Depends(get_run_queue),
+) -> ResearchRun:
+    """Report a queued run's status."""
+    return _get_run_or_404(queue, run_id)
+
+
+@router.get("/{run_id}/events")
+async def stream_run_events(
+    run_id: str,
+    _user: dict[str, str] = Depends(_stream_auth_dep),
+    queue: RunQueue = Depends(get_run_queue),
+    bus: ProgressBus = Depends(get_progress_bus),
+) -> StreamingResponse:
+    """Stream a run's progress as server-sent events until it finishes.
+
+    A run that has already finished gets a single terminal event. The
+    hosting platform may cut a long stream (Cloud Run ends requests
+    after the service's ``timeoutSeconds``, 300s here); a client that
+    reconnects is replayed the run's recent history, terminal event
+    included, and then follows it live.
+    """
+    run = _get_run_or_404(queue, run_id)
+    finished = FINISHED_KINDS.get(run.status)
+    subscription = None if finished else bus.subscribe(run.report_id)
+
+    async def events() -> AsyncIterator[str]:
+        if subscription is None:
+            data = {"error": run.error_message} if run.error_message else {}
+            event = ProgressEvent(report_id=run.report_id, kind=finished, data=data)
+            yield _sse(event)
+            return
+        try:
+            while True:
+                try:
+                    event = await asyncio.wait_for(
+                        subscription.get(), KEEPALIVE_SECONDS
+                    )
+                except TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                yield _sse(event)
+                if event.terminal:
+                    return
+        finally:
+            subscription.close()
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
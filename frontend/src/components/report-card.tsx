@@ -52,6 +52,7 @@ function EngineSummary({ result }: { result: EngineResult | null }) {
     result.status === "completed" ? "bg-green-500" :
     result.status === "running" ? "bg-yellow-500 animate-pulse" :
     result.status === "failed" ? "bg-red-500" :
+    result.status === "timed_out" ? "bg-orange-500" :
     "bg-gray-500";
 
   return (
@@ -1,9 +1,56 @@
 "use client";
 
 import { useState, useEffect, useCallback } from "react";
-import { getReports, getReport, triggerResearch } from "@/lib/api";
+import {
+  getReports,
+  getReport,
+  getRun,
+  runEventsUrl,
+  triggerResearch,
+} from "@/lib/api";
 import { getToken } from "@/lib/auth";
-import { ResearchReport } from "@/lib/types";
+import { ProgressEvent, ResearchReport } from "@/lib/types";
+
+const RUN_POLL_INTERVAL_MS = 5000;
+
+async function waitForRun(runId: string, token: string): Promise<void> {
+  if (typeof EventSource === "undefined") return pollRun(runId, token);
+  return streamRun(runId, token);
+}
+
+// Follow the run's server-sent events. When the stream drops (e.g. the
+// hosting platform's request timeout) the browser reconnects and the
+// server replays the run's history; if it gives up, fall back to polling.
+function streamRun(runId: string, token: string): Promise<void> {
+  return new Promise((resolve, reject) => {
+    const source = new EventSource(runEventsUrl(runId, token));
+    source.addEventListener("report_saved", () => {
+      source.close();
+      resolve();
+    });
+    source.addEventListener("run_failed", (event) => {
+      source.close();
+      const { data } = JSON.parse((event as MessageEvent).data) as ProgressEvent;
+      reject(new Error(String(data.error || "Research run failed")));
+    });
+    source.onerror = () => {
+      if (source.readyState === EventSource.CLOSED) {
+        pollRun(runId, token).then(resolve, reject);
+      }
+    };
+  });
+}
+
+async function pollRun(runId: string, token: string): Promise<void> {
+  for (;;) {
+    const run = await getRun(runId, token);
+    if (run.status === "completed" || run.status === "timed_out") return;
+    if (run.status === "failed") {
+      throw new Error(run.error_message || "Research run failed");
+    }
+    await new Promise((resolve) => setTimeout(resolve, RUN_POLL_INTERVAL_MS));
+  }
+}
 
 interface UseReportsReturn {
   reports: ResearchReport[];
@@ -47,7 +94,8 @@ export function useReports(): UseReportsReturn {
 
     setTriggering(true);
     try {
-      await triggerResearch(token, date);
+      const { run_id } = await triggerResearch(token, date);
+      await waitForRun(run_id, token);
       await fetchReports();
     } catch (err) {
       const message =
@@ -2,6 +2,8 @@ import {
   LoginResponse,
   ReportsListResponse,
   ResearchReport,
+  ResearchRun,
+  TriggerResponse,
 } from "./types";
 
 const API_BASE = process.env.NEXT_PUBLIC_API_BASE || "http://localhost:8000";
@@ -68,12 +70,27 @@ export async function getReport(
 export async function triggerResearch(
   token: string,
   date?: string
-): Promise<ResearchReport> {
-  return request<ResearchReport>("/api/reports/trigger", {
+): Promise<TriggerResponse> {
+  return request<TriggerResponse>("/api/reports/trigger", {
     method: "POST",
     headers: authHeaders(token),
     body: JSON.stringify(date ? { date } : {}),
   });
 }
 
+export async function getRun(
+  runId: string,
+  token: string
+): Promise<ResearchRun> {
+  return request<ResearchRun>(`/api/runs/${runId}`, {
+    headers: authHeaders(token),
+  });
+}
+
+// EventSource cannot send headers, so the token goes in the query string.
+export function runEventsUrl(runId: string, token: string): string {
+  const query = new URLSearchParams({ access_token: token });
+  return `${API_BASE}/api/runs/${runId}/events?${query}`;
+}
+
 export { ApiError };
@@ -1,4 +1,9 @@
-export type ResearchStatus = "pending" | "running" | "completed" | "failed";
+export type ResearchStatus =
+  | "pending"
+  | "running"
+  | "completed"
+  | "failed"
+  | "timed_out";
 export type ConfidenceLevel = "high" | "medium" | "low";
 
 export interface ViralEvent {
@@ -42,6 +47,32 @@ export interface ResearchReport {
   run_date: string;
   result: EngineResult | null;
   created_at: string;
+  status?: ResearchStatus;
+}
+
+export interface TriggerResponse {
+  run_id: string;
+  report_id: string;
+  status: ResearchStatus;
+}
+
+export interface ResearchRun {
+  run_id: string;
+  date: string;
+  report_id: string;
+  status: ResearchStatus;
+  error_message: string | null;
+  created_at: string;
+  started_at: string | null;
+  completed_at: string | null;
+}
+
+export interface ProgressEvent {
+  report_id: string;
+  kind: string;
+  engine: string | null;
+  data: Record<string, unknown>;
+  at: string;
 }
 
 export interface LoginResponse {